@@ -0,0 +1,142 @@
+"""
+Módulo para precalcular la caché de frames escalados, sin abrir el juego.
+
+Uso: `python -m src.main.calentar_cache [--ancho ANCHO] [--alto ALTO] [--px-celda PX] [RUTAS ...]`
+"""
+
+# ----- Sin esto Pygame muestra un cartel cada vez que se corre el programa -----
+# pylint: disable=wrong-import-position
+from os import environ
+
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+# -------------------------------------------------------------------------------
+
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .controlador.editor import DIRECCIONES_SPRITES, MISSING_IMG_PATH
+from .controlador.jugador import ANIMACIONES_JUGADOR
+from .main import ALTO_PANTALLA, ANCHO_PANTALLA
+from .modelo.celdas import TiposCelda
+from .modelo.niveles import EXT_PACK, abrir_pack, leer_bytes_nivel, leer_nivel
+from .modelo.niveles.nivel import EXT as EXT_NIVEL
+from .vista.sprites import cargar_imagenes_escaladas
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from .vista.sprites import TamSuperficie
+
+RUTA_NIVELES: "PathLike" = "./niveles"
+ESCALA_JUGADOR: float = 0.9 # El jugador es un poco más chico que las celdas
+
+
+def rutas_de_niveles(rutas: Iterable["PathLike"]) -> list[str]:
+    """
+    Devuelve las rutas de todos los niveles en las rutas dadas, incluidos los que están
+    dentro de packs. Las carpetas se recorren completas.
+    -
+    'rutas': Rutas de niveles, packs o carpetas.
+    """
+
+    niveles = []
+    for ruta in map(Path, rutas):
+        archivos = (sorted(ruta.rglob("*")) if ruta.is_dir() else [ruta])
+        for archivo in archivos:
+            if archivo.suffix.lower() == EXT_NIVEL:
+                niveles.append(archivo.as_posix())
+            elif archivo.suffix.lower() == EXT_PACK:
+                niveles.extend(abrir_pack(archivo).rutas())
+
+    return niveles
+
+
+def sprites_de_nivel(ruta_nivel: "PathLike",
+                     tam_pantalla: "TamSuperficie",
+                     px_celda: Optional[int]=None) -> set[tuple[str, tuple[float, float]]]:
+    """
+    Devuelve qué animaciones (carpetas u hojas de frames) hacen falta para un nivel, y a
+    qué tamaño.
+    -
+    'ruta_nivel': La ruta del nivel.
+
+    'tam_pantalla': El tamaño de la ventana del juego.
+
+    'px_celda': Los píxeles por celda de la resolución interna, si se usa.
+    """
+
+    lineas = leer_bytes_nivel(ruta_nivel).decode("utf-8").splitlines()
+    matriz, _, _ = leer_nivel(lineas, Path(ruta_nivel).as_posix())
+    incr = ((tam_pantalla[0] / len(matriz[0]), tam_pantalla[1] / len(matriz))
+            if px_celda is None else (float(px_celda), float(px_celda)))
+    incr_jugador = (incr[0] * ESCALA_JUGADOR, incr[1] * ESCALA_JUGADOR)
+
+    tipos = {info.tipo for fila in matriz for info in fila if info.tipo != TiposCelda.AIRE}
+    sprites = {(Path(DIRECCIONES_SPRITES.get(tipo, MISSING_IMG_PATH)).as_posix(), incr)
+               for tipo in tipos}
+    sprites.update((Path(ruta).as_posix(), incr_jugador) for ruta in ANIMACIONES_JUGADOR)
+
+    return sprites
+
+
+def calentar(rutas: Iterable["PathLike"],
+             tam_pantalla: "TamSuperficie",
+             px_celda: Optional[int]=None) -> int:
+    """
+    Deja en la caché los frames escalados de todos los niveles dados, para una resolución.
+    Devuelve cuántas combinaciones de animación y tamaño se procesaron.
+    -
+    'rutas': Rutas de niveles, packs o carpetas.
+
+    'tam_pantalla': El tamaño de la ventana del juego.
+
+    'px_celda': Los píxeles por celda de la resolución interna, si se usa.
+    """
+
+    pendientes = set()
+    for ruta_nivel in rutas_de_niveles(rutas):
+        try:
+            pendientes.update(sprites_de_nivel(ruta_nivel, tam_pantalla, px_celda))
+        except ValueError as exc:
+            print(f"Ignorando '{ruta_nivel}': {exc}")
+
+    for animacion, tam in sorted(pendientes):
+        cargar_imagenes_escaladas(animacion, tam)
+
+    return len(pendientes)
+
+
+def main(args: Optional[list[str]]=None) -> int:
+    """
+    Corre el comando de precalentado de la caché.
+    -
+    'args': Los argumentos de la línea de comandos. Si no se dan, se usan los del programa.
+    """
+
+    parser = ArgumentParser(prog="python -m src.main.calentar_cache",
+                            description="Precalcula los frames escalados de los niveles, "
+                                        "tal que el juego no tenga que hacerlo al iniciar.")
+    parser.add_argument("rutas", nargs="*", default=[RUTA_NIVELES],
+                        help="Niveles, packs o carpetas a procesar (por defecto, todos).")
+    parser.add_argument("--ancho", type=int, default=ANCHO_PANTALLA,
+                        help="El ancho de la ventana del juego.")
+    parser.add_argument("--alto", type=int, default=ALTO_PANTALLA,
+                        help="El alto de la ventana del juego.")
+    parser.add_argument("--px-celda", type=int, default=None,
+                        help="Los píxeles por celda, si el juego usa resolución interna "
+                             "(en ese caso, el tamaño de la ventana no importa).")
+    opciones = parser.parse_args(args)
+
+    inicio = perf_counter()
+    cantidad = calentar(opciones.rutas, (opciones.ancho, opciones.alto), opciones.px_celda)
+    destino = (f"{opciones.ancho}x{opciones.alto}" if opciones.px_celda is None
+               else f"{opciones.px_celda} px por celda")
+    print(f"{cantidad} animaciones listas para {destino} en {perf_counter() - inicio:.2f} s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -2,4 +2,6 @@
 Paquete para objetos que manejan archivos.
 """
 
+from .cargador_recursos import *
+from .catalogo_niveles import *
 from .ruta_json import *
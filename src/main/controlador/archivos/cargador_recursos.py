@@ -0,0 +1,303 @@
+"""
+Módulo para el cargador de recursos (imágenes y sonidos) en segundo plano.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from json import load
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterable, Optional, TypeAlias, Union
+
+from pygame.display import get_surface
+from pygame.image import load as img_load
+from pygame.mixer import Sound
+from pygame.mixer import get_init as mixer_iniciado
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from pygame import Surface
+
+    from ..logger import LoggerJuego
+
+RecursoCrudo: TypeAlias = Union["Surface", bytes]
+Manifiesto: TypeAlias = dict[str, tuple[str, ...]]
+
+MANIFIESTO_RECURSOS: "PathLike" = "./media/manifiesto.json"
+EXT_IMAGENES: tuple[str, ...] = (".png",)
+EXT_SONIDOS: tuple[str, ...] = (".wav",)
+MAX_HILOS: int = 4
+
+
+def cargar_manifiesto(ruta_manifiesto: "PathLike"=MANIFIESTO_RECURSOS) -> Manifiesto:
+    """
+    Lee el manifiesto de recursos. Éste es un JSON con dos listas de rutas (archivos o
+    carpetas): 'inicio', con lo que tiene que estar listo antes de mostrar el primer
+    frame, y 'diferido', con lo que se puede ir cargando después mientras se juega.
+    Si no existe, no hay nada que precargar.
+    -
+    'ruta_manifiesto': La ruta del archivo del manifiesto.
+    """
+
+    try:
+        with Path(ruta_manifiesto).open(mode="r", encoding="utf-8") as archivo:
+            dic = load(archivo)
+    except FileNotFoundError:
+        dic = {}
+
+    return {"inicio": tuple(dic.get("inicio", ())),
+            "diferido": tuple(dic.get("diferido", ()))}
+
+
+class CargadorRecursos:
+    """
+    Clase que lee y decodifica imágenes y sonidos en varios hilos a la vez.
+    Lo que no se puede hacer fuera del hilo principal (convertir las imágenes al formato
+    de la pantalla, crear los sonidos) se termina en `procesar()`, poco a poco, o al
+    pedir el recurso si todavía no se había terminado.
+    """
+
+    def __init__(self,
+                 max_hilos: int=MAX_HILOS,
+                 logger: Optional["LoggerJuego"]=None) -> None:
+        """
+        Inicializa el cargador. Los hilos se crean recién al pedir el primer recurso.
+        -
+        'max_hilos': La cantidad máxima de archivos a decodificar a la vez.
+
+        'logger': El registrador del juego.
+        """
+
+        self.max_hilos: int = max_hilos
+        self.logger: Optional["LoggerJuego"] = logger
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._candado: Lock = Lock()
+
+        self._pendientes: dict[str, Future] = {}
+        self._crudos: dict[str, RecursoCrudo] = {}
+        self._imagenes: dict[str, "Surface"] = {}
+        self._sonidos: dict[str, Sound] = {}
+
+        # Para mostrar el progreso de lo último que se pidió
+        self.total: int = 0
+        self.listos: int = 0
+
+
+    @staticmethod
+    def _clave_de(ruta: "PathLike") -> str:
+        """
+        Devuelve la clave con la que se guarda un recurso.
+        -
+        'ruta': La ruta del archivo.
+        """
+
+        return Path(ruta).as_posix()
+
+
+    @staticmethod
+    def expandir(rutas: Iterable["PathLike"]) -> list[Path]:
+        """
+        Devuelve todos los archivos de imagen o sonido que hay en las rutas dadas. Las
+        carpetas se recorren completas.
+        -
+        'rutas': Las rutas de archivos o carpetas.
+        """
+
+        archivos = []
+        for ruta in map(Path, rutas):
+            candidatos = (sorted(ruta.rglob("*")) if ruta.is_dir() else [ruta])
+            archivos.extend(arch for arch in candidatos
+                            if arch.suffix.lower() in EXT_IMAGENES + EXT_SONIDOS)
+
+        return archivos
+
+
+    @staticmethod
+    def _decodificar(ruta: str) -> RecursoCrudo:
+        """
+        Lee un recurso del disco. Corre en otro hilo.
+        Las imágenes se decodifican acá; de los sonidos sólo se leen los bytes, ya que
+        crearlos requiere el hilo principal.
+        -
+        'ruta': La ruta del archivo.
+        """
+
+        if Path(ruta).suffix.lower() in EXT_SONIDOS:
+            return Path(ruta).read_bytes()
+
+        return img_load(ruta)
+
+
+    def pedir(self, rutas: Iterable["PathLike"]) -> int:
+        """
+        Empieza a cargar en segundo plano todos los recursos de las rutas dadas que no
+        estén ya cargados. Devuelve cuántos archivos se pidieron.
+        -
+        'rutas': Las rutas de archivos o carpetas a cargar.
+        """
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_hilos,
+                                            thread_name_prefix="recursos")
+
+        pedidos = 0
+        with self._candado:
+            for archivo in self.expandir(rutas):
+                clave = self._clave_de(archivo)
+                if clave in self._crudos or clave in self._pendientes:
+                    continue
+
+                self._pendientes[clave] = self._pool.submit(self._decodificar, clave)
+                pedidos += 1
+
+        self.total = pedidos
+        self.listos = 0
+        return pedidos
+
+
+    def listo(self) -> bool:
+        "Verifica si ya se terminó de cargar todo lo pedido."
+
+        return not self._pendientes
+
+
+    @property
+    def progreso(self) -> float:
+        "Devuelve qué fracción de lo último que se pidió ya está lista, entre 0.0 y 1.0."
+
+        return (self.listos / self.total if self.total else 1.0)
+
+
+    def _terminar(self, clave: str, crudo: RecursoCrudo) -> None:
+        """
+        Deja listo un recurso ya decodificado. Debe correr en el hilo principal.
+        -
+        'clave': La clave del recurso.
+
+        'crudo': La imagen o los bytes del sonido.
+        """
+
+        if isinstance(crudo, bytes):
+            if mixer_iniciado() is not None:
+                self._sonidos[clave] = Sound(file=BytesIO(crudo))
+
+        elif get_surface() is not None:
+            self._imagenes[clave] = crudo.convert_alpha()
+
+
+    def procesar(self, limite_ms: Optional[float]=None) -> int:
+        """
+        Termina de preparar en el hilo principal los recursos que ya se decodificaron.
+        Devuelve cuántos se terminaron.
+        -
+        'limite_ms': El tiempo máximo a usar, en milisegundos, tal que se pueda llamar
+                     una vez por frame sin trabar el juego. Si es `None`, no hay límite.
+        """
+
+        inicio = perf_counter()
+        terminados = 0
+
+        with self._candado:
+            hechos = [(clave, fut) for clave, fut in self._pendientes.items() if fut.done()]
+
+        for clave, fut in hechos:
+            if limite_ms is not None and (perf_counter() - inicio) * 1000 > limite_ms:
+                break
+
+            with self._candado:
+                self._pendientes.pop(clave, None)
+
+            try:
+                crudo = fut.result()
+            # Si falla, el error aparece al pedir el recurso de forma normal
+            except Exception as exc: # pylint: disable=broad-exception-caught
+                if self.logger is not None:
+                    self.logger.warning(f"No se pudo precargar '{clave}': {exc}")
+                self.listos += 1
+                continue
+
+            with self._candado:
+                self._crudos.setdefault(clave, crudo)
+            self._terminar(clave, crudo)
+            self.listos += 1
+            terminados += 1
+
+        return terminados
+
+
+    def imagen_cruda(self, ruta: "PathLike") -> "Surface":
+        """
+        Devuelve una imagen tal cual está en el archivo, sin convertir. Si se estaba
+        cargando se espera a que termine, y si no se había pedido se lee en el momento.
+        Se puede llamar desde cualquier hilo.
+        -
+        'ruta': La ruta de la imagen.
+        """
+
+        clave = self._clave_de(ruta)
+        with self._candado:
+            imagen = self._crudos.get(clave)
+            fut = self._pendientes.get(clave)
+
+        if imagen is None:
+            imagen = (fut.result() if fut is not None else img_load(clave))
+            with self._candado:
+                imagen = self._crudos.setdefault(clave, imagen)
+
+        return imagen
+
+
+    def imagen(self, ruta: "PathLike") -> "Surface":
+        """
+        Devuelve una imagen ya convertida al formato de la pantalla (con transparencia).
+        Debe llamarse desde el hilo principal. La superficie es compartida, así que no se
+        debe modificar; para eso, usar una copia.
+        -
+        'ruta': La ruta de la imagen.
+        """
+
+        clave = self._clave_de(ruta)
+        imagen = self._imagenes.get(clave)
+        if imagen is None:
+            imagen = self.imagen_cruda(ruta).convert_alpha()
+            self._imagenes[clave] = imagen
+
+        return imagen
+
+
+    def sonido(self, ruta: "PathLike") -> Sound:
+        """
+        Devuelve un sonido listo para reproducir. Debe llamarse desde el hilo principal.
+        -
+        'ruta': La ruta del archivo de sonido.
+        """
+
+        clave = self._clave_de(ruta)
+        sonido = self._sonidos.get(clave)
+        if sonido is None:
+            with self._candado:
+                crudo = self._crudos.get(clave)
+                fut = self._pendientes.get(clave)
+
+            if crudo is None and fut is not None:
+                crudo = fut.result()
+            sonido = (Sound(file=BytesIO(crudo)) if crudo is not None else Sound(clave))
+            self._sonidos[clave] = sonido
+
+        return sonido
+
+
+    def cerrar(self) -> None:
+        "Cancela lo que falte cargar y termina los hilos."
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+        with self._candado:
+            self._pendientes.clear()
+
+
+RECURSOS: CargadorRecursos = CargadorRecursos()
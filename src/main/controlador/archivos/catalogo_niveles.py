@@ -0,0 +1,342 @@
+"""
+Módulo para un catálogo persistente de los niveles en disco.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, TypeAlias
+
+from ...modelo.celdas import TiposCelda
+from ...modelo.niveles import (EXT, RUTA_NIVELES_DEFAULT, Nivel, PackInvalido,
+                               PackNiveles, es_pack, leer_cabecera)
+from .ruta_json import RutaJSON
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from ..logger import LoggerJuego
+
+InfoCatalogo: TypeAlias = dict[str, Any]
+DicDirectorios: TypeAlias = dict[str, InfoCatalogo]
+DicNiveles: TypeAlias = dict[str, InfoCatalogo]
+
+NOMBRE_CATALOGO: str = "catalogo.json"
+VERSION_CATALOGO: int = 1
+
+
+class CatalogoNiveles:
+    """
+    Índice de todos los niveles bajo un directorio, guardado junto a ellos.
+    Cada directorio y cada nivel recuerdan su fecha de modificación, tal que sólo se
+    vuelven a listar o a leer los que cambiaron desde la última vez.
+    Los archivos '.nivelpack' se catalogan como si fueran un directorio más, con sus
+    niveles en el orden del pack.
+    """
+
+    def __init__(self,
+                 ruta_madre: "PathLike"=RUTA_NIVELES_DEFAULT,
+                 logger: Optional["LoggerJuego"]=None) -> None:
+        """
+        Inicializa el catálogo, cargando el índice guardado si es que hay uno.
+        -
+        'ruta_madre': El directorio donde se encuentran los niveles.
+
+        'logger': El registrador del juego.
+        """
+
+        self.ruta_madre: Path = Path(ruta_madre)
+        self.logger: Optional["LoggerJuego"] = logger
+        self.directorios: DicDirectorios = {}
+        self.niveles: DicNiveles = {}
+        self._ruta_json: Optional[RutaJSON] = None
+
+        if self.ruta_madre.exists():
+            self._ruta_json = RutaJSON(self.ruta_madre / NOMBRE_CATALOGO)
+            self._cargar()
+
+
+    def _cargar(self) -> None:
+        "Carga el índice desde el disco, descartándolo si es de otra versión."
+
+        try:
+            datos = self._ruta_json.cargar()
+        except ValueError:
+            datos = {}
+
+        if datos.get("version") != VERSION_CATALOGO:
+            return
+
+        self.directorios = datos.get("directorios", {})
+        self.niveles = datos.get("niveles", {})
+
+
+    def guardar(self) -> None:
+        "Guarda el índice en el disco."
+
+        if self._ruta_json is None:
+            return
+
+        self._ruta_json.guardar({"version": VERSION_CATALOGO,
+                                 "directorios": self.directorios,
+                                 "niveles": self.niveles},
+                                sangria=None)
+
+
+    @staticmethod
+    def _es_nivel(ruta: Path) -> bool:
+        """
+        Decide si una ruta es un archivo de nivel.
+        -
+        'ruta': La ruta en cuestión.
+        """
+
+        return ruta.is_file() and ruta.suffix.lower() == EXT
+
+
+    @staticmethod
+    def inspeccionar_nivel(ruta: Path) -> InfoCatalogo:
+        """
+        Lee un archivo de nivel y resume sus datos para el catálogo. Si el nivel tiene
+        cabecera, no se lee la grilla.
+        -
+        'ruta': La ruta del archivo de nivel.
+        """
+
+        stat = ruta.stat()
+        info = {"mtime": stat.st_mtime_ns,
+                "tam": stat.st_size,
+                "titulo": " ".join(ruta.stem.split("_")).upper(),
+                "valido": False}
+
+        # Los niveles en formato v2 traen todo lo necesario en la cabecera
+        try:
+            with ruta.open(mode="r", encoding="utf-8") as archivo:
+                cabecera = leer_cabecera(archivo, ruta.as_posix())
+        except (ValueError, UnicodeDecodeError) as exc:
+            info["error"] = str(exc)
+            return info
+
+        if cabecera is not None:
+            info.update(ancho=cabecera.ancho,
+                        alto=cabecera.alto,
+                        titulo=(cabecera.titulo.upper() or info["titulo"]),
+                        trofeos=cabecera.trofeos,
+                        llaves=cabecera.llaves,
+                        puertas=cabecera.puertas,
+                        valido=cabecera.jugadores > 0)
+            return info
+
+        try:
+            datos = Nivel.cargar_desde_ruta(ruta, ignorar_pos_jugador=True)
+        except (ValueError, KeyError) as exc:
+            info["error"] = str(exc)
+            return info
+
+        conteos = {tipo: 0 for tipo in TiposCelda}
+        for fila in datos["matriz"]:
+            for celda in fila:
+                conteos[celda.tipo] += 1
+
+        info.update(ancho=(len(datos["matriz"][0]) if datos["matriz"] else 0),
+                    alto=len(datos["matriz"]),
+                    titulo=datos["titulo"],
+                    trofeos=conteos[TiposCelda.TROFEO],
+                    llaves=conteos[TiposCelda.LLAVE],
+                    puertas=conteos[TiposCelda.PUERTA],
+                    valido=conteos[TiposCelda.POS_JUGADOR] > 0)
+        return info
+
+
+    def _actualizar_directorio(self, ruta: Path, profundidad: int) -> bool:
+        """
+        Refresca la entrada de un directorio y la de sus niveles. Devuelve `True` si
+        algo cambió.
+        -
+        'ruta': El directorio a refrescar.
+
+        'profundidad': Cuántos niveles de subdirectorios seguir explorando.
+        """
+
+        clave = ruta.as_posix()
+        if es_pack(ruta):
+            return self._actualizar_pack(ruta)
+
+        mtime = ruta.stat().st_mtime_ns
+        entrada = self.directorios.get(clave)
+        cambio = False
+
+        if entrada is None or entrada["mtime"] != mtime:
+            subdirs, niveles = [], []
+            for hijo in sorted(ruta.iterdir()):
+                if hijo.is_dir() or es_pack(hijo):
+                    subdirs.append(hijo.name)
+                elif self._es_nivel(hijo):
+                    niveles.append(hijo.name)
+
+            entrada = {"mtime": mtime, "subdirectorios": subdirs, "niveles": niveles}
+            self.directorios[clave] = entrada
+            cambio = True
+
+        for nombre in entrada["niveles"]:
+            ruta_nivel = ruta / nombre
+            clave_nivel = ruta_nivel.as_posix()
+            info = self.niveles.get(clave_nivel)
+
+            try:
+                stat = ruta_nivel.stat()
+            except FileNotFoundError:
+                continue
+
+            if (info is not None and info["mtime"] == stat.st_mtime_ns
+                and info["tam"] == stat.st_size):
+                continue
+
+            self.niveles[clave_nivel] = self.inspeccionar_nivel(ruta_nivel)
+            cambio = True
+            if self.logger is not None:
+                self.logger.debug(f"Catálogo: nivel '{clave_nivel}' (re)indexado")
+
+        if profundidad > 0:
+            for nombre in entrada["subdirectorios"]:
+                subdir = ruta / nombre
+                if subdir.is_dir() or es_pack(subdir):
+                    cambio = self._actualizar_directorio(subdir, profundidad - 1) or cambio
+
+        return cambio
+
+
+    def _actualizar_pack(self, ruta: Path) -> bool:
+        """
+        Refresca la entrada de un pack de niveles a partir de su tabla de contenidos,
+        sin leer ninguno de sus niveles. Devuelve `True` si algo cambió.
+        -
+        'ruta': La ruta del archivo '.nivelpack'.
+        """
+
+        clave = ruta.as_posix()
+        stat = ruta.stat()
+        entrada = self.directorios.get(clave)
+        if entrada is not None and entrada["mtime"] == stat.st_mtime_ns:
+            return False
+
+        try:
+            with PackNiveles(ruta) as pack:
+                entradas_pack = pack.entradas
+        except PackInvalido as exc:
+            entradas_pack = []
+            if self.logger is not None:
+                self.logger.warning(f"Catálogo: {exc}")
+
+        self.directorios[clave] = {"mtime": stat.st_mtime_ns,
+                                   "subdirectorios": [],
+                                   "niveles": [info["nombre"] for info in entradas_pack]}
+        for info in entradas_pack:
+            self.niveles[f"{clave}/{info['nombre']}"] = {
+                "mtime": stat.st_mtime_ns,
+                "tam": info["tam"],
+                "titulo": info["titulo"],
+                "valido": info["jugadores"] > 0,
+                "ancho": info["ancho"],
+                "alto": info["alto"],
+                "trofeos": info["trofeos"],
+                "llaves": info["llaves"],
+                "puertas": info["puertas"]
+            }
+
+        if self.logger is not None:
+            self.logger.debug(f"Catálogo: pack '{clave}' (re)indexado")
+
+        return True
+
+
+    def _purgar_huerfanos(self) -> bool:
+        "Olvida las entradas de directorios y niveles que ya no existen. Devuelve si hubo."
+
+        vivos_dirs = set()
+        vivos_niveles = set()
+        pendientes = [self.ruta_madre.as_posix()]
+
+        while pendientes:
+            clave = pendientes.pop()
+            entrada = self.directorios.get(clave)
+            if entrada is None:
+                continue
+
+            vivos_dirs.add(clave)
+            vivos_niveles.update(f"{clave}/{nombre}" for nombre in entrada["niveles"])
+            pendientes.extend(f"{clave}/{nombre}" for nombre in entrada["subdirectorios"])
+
+        muertos_dirs = self.directorios.keys() - vivos_dirs
+        muertos_niveles = self.niveles.keys() - vivos_niveles
+        for clave in muertos_dirs:
+            self.directorios.pop(clave)
+        for clave in muertos_niveles:
+            self.niveles.pop(clave)
+
+        return bool(muertos_dirs or muertos_niveles)
+
+
+    def actualizar(self, profundidad: int=1) -> bool:
+        """
+        Refresca incrementalmente el catálogo y lo guarda si hubo cambios. Devuelve
+        `True` si algo cambió.
+        -
+        'profundidad': Cuántos niveles de subdirectorios explorar bajo la ruta madre.
+        """
+
+        if not self.ruta_madre.exists():
+            return False
+
+        cambio = self._actualizar_directorio(self.ruta_madre, profundidad)
+        cambio = self._purgar_huerfanos() or cambio
+
+        if cambio:
+            self.guardar()
+
+        return cambio
+
+
+    def info(self, ruta_nivel: "PathLike") -> Optional[InfoCatalogo]:
+        """
+        Devuelve la información catalogada de un nivel, de haberla.
+        -
+        'ruta_nivel': La ruta del archivo de nivel.
+        """
+
+        return self.niveles.get(Path(ruta_nivel).as_posix())
+
+
+    def subdirectorios(self, ruta: "PathLike") -> tuple[str, ...]:
+        """
+        Devuelve las rutas de los subdirectorios catalogados de un directorio.
+        -
+        'ruta': El directorio a consultar.
+        """
+
+        clave = Path(ruta).as_posix()
+        entrada = self.directorios.get(clave, {})
+        return tuple(f"{clave}/{nombre}" for nombre in entrada.get("subdirectorios", ()))
+
+
+    def niveles_en(self, ruta: "PathLike", solo_validos: bool=True) -> tuple[str, ...]:
+        """
+        Devuelve las rutas de los niveles catalogados directamente en un directorio o en
+        un pack. Los de un directorio van en orden alfabético, y los de un '.nivelpack'
+        en el orden del pack.
+        -
+        'ruta': El directorio a consultar.
+
+        'solo_validos': Si omitir los niveles que no se pueden jugar.
+        """
+
+        clave = Path(ruta).as_posix()
+        entrada = self.directorios.get(clave, {})
+        rutas = []
+
+        for nombre in entrada.get("niveles", ()):
+            ruta_nivel = f"{clave}/{nombre}"
+            info = self.niveles.get(ruta_nivel)
+            if solo_validos and (info is None or not info["valido"]):
+                continue
+            rutas.append(ruta_nivel)
+
+        return tuple(rutas)
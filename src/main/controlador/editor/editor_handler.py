@@ -6,18 +6,17 @@ from enum import StrEnum
 from math import degrees, pi
 from typing import TYPE_CHECKING, Optional, TypeAlias, Union
 
-from pygame import Rect
+from pygame import Rect, Surface
 from pygame.constants import (BUTTON_LEFT, BUTTON_MIDDLE, BUTTON_RIGHT,
                               BUTTON_WHEELDOWN, BUTTON_WHEELUP, K_KP_MINUS,
                               K_KP_PLUS, K_MINUS, K_PLUS, KEYDOWN,
                               MOUSEBUTTONUP, MOUSEMOTION, K_v)
-from pygame.display import get_surface
 from pygame.draw import rect
 from pygame.math import Vector2
 
 from ...modelo.celdas import TiposCelda
 from ...modelo.editor import EditorNiveles
-from ...modelo.utils import Temporizador
+from ...modelo.utils import METRICAS_PANTALLA, Temporizador
 from ...vista.fuentes import FuenteMinecraftia
 from ...vista.sprites import Animacion
 from ..eventos import EventosJuego
@@ -25,7 +24,6 @@ from ..eventos import EventosJuego
 if TYPE_CHECKING:
     from os import PathLike
 
-    from pygame import Surface
     from pygame.event import Event
 
     from ...modelo.niveles import InfoNivel
@@ -55,6 +53,8 @@ DIRECCIONES_SPRITES: DireccionesSprites = {
 }
 
 TRANSPARENCIA: int = 100
+TRANSPARENCIA_INVISIBLE: int = 125
+TRANSPARENCIA_PROBLEMA: int = 90
 
 # --- Colores ---
 COLOR_FONDO: str = "#dfdfdf"
@@ -62,6 +62,9 @@ COLOR_FONDO_1: str = "#cccccc"
 COLOR_FONDO_2: str = "#bbbbbb"
 COLOR_FONDO_MENU: str = "#333333"
 COLOR_IDS: str = "#fefeee"
+COLOR_PROBLEMA: str = "#ff2020"
+COLOR_VALIDACION: str = "#ffaa55"
+COLOR_VALIDO: str = "#88ee88"
 # ---------------
 
 
@@ -85,15 +88,13 @@ class EditorHandler:
         'logger': El registrador del juego.
         """
 
-        _, alto = get_surface().get_size()
-
         self.editor: EditorNiveles = EditorNiveles()
         self.logger: Optional["LoggerJuego"] = logger
-        self.espacio_menu: float = alto * 0.15
         self.matriz_sprites: MatrizSprites = self._generar_matriz_sprites()
 
         self._enfocada: Vector2 = Vector2(0, 0)
         self.mouse: Vector2 = Vector2(0.0, 0.0)
+        self._surf_problema: Optional[Surface] = None
 
         self.mensajes: dict[str, list[Union[str, Temporizador]]] = {
             PosicionesMensajesEditor.CURSOR_ARRIBA: ["", Temporizador(2000)],
@@ -124,11 +125,19 @@ class EditorHandler:
         self._enfocada.y = y
 
 
+    @property
+    def espacio_menu(self) -> float:
+        "Devuelve el alto que ocupa el menú por encima de la grilla."
+
+        _, alto = METRICAS_PANTALLA.tam
+        return alto * 0.15
+
+
     @property
     def incremento_x(self) -> float:
         "Devuelve el incremento horizontal de las celdas."
 
-        ancho_ventana, _ = get_surface().get_size()
+        ancho_ventana, _ = METRICAS_PANTALLA.tam
         ed_ancho, _ = self.editor.forma
         return ancho_ventana / ed_ancho
 
@@ -137,7 +146,7 @@ class EditorHandler:
     def incremento_y(self) -> float:
         "Devuelve el incremento vertical de las celdas."
 
-        _, alto_ventana = get_surface().get_size()
+        _, alto_ventana = METRICAS_PANTALLA.tam
         _, ed_alto = self.editor.forma
         return (alto_ventana - self.espacio_menu) / ed_alto
 
@@ -261,6 +270,11 @@ class EditorHandler:
                                    PosicionesMensajesEditor.INFO_ARRIBA)
             return None
 
+        problemas = self.editor.validador.problemas()
+        if problemas:
+            self.refrescar_mensaje(f"Exportado con advertencias: {problemas[0]}",
+                                   PosicionesMensajesEditor.INFO_ARRIBA)
+
         return self.editor.exportar(titulo)
 
 
@@ -297,7 +311,8 @@ class EditorHandler:
         return Animacion(pos=Vector2(self.incremento_x * ancho,
                                      self.incremento_y * alto + self.espacio_menu),
                          tam=Vector2(self.incremento_x, self.incremento_y),
-                         ruta=ruta_spr).rotar(degrees(rot))
+                         ruta=ruta_spr,
+                         alphas=(TRANSPARENCIA_INVISIBLE,)).rotar(degrees(rot))
 
 
     def _generar_matriz_sprites(self) -> MatrizSprites:
@@ -328,6 +343,15 @@ class EditorHandler:
                                       self.incremento_y * j + self.espacio_menu)
 
 
+    def reacomodar(self) -> None:
+        """
+        Vuelve a armar los sprites de la grilla para las medidas actuales de la pantalla,
+        por ejemplo al redimensionar la ventana.
+        """
+
+        self.matriz_sprites = self._generar_matriz_sprites()
+
+
     def coords_matriz(self, px_x: float, px_y: float) -> tuple[int, int]:
         """
         Dadas las coordenadas en pixeles del cursor, devuelve a qué casilla
@@ -373,7 +397,7 @@ class EditorHandler:
                  las últimas coordenadas registradas del cursor.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         if mx is None:
             mx = self.mouse.x
@@ -385,15 +409,11 @@ class EditorHandler:
 
 
     def _purgar_pos_jugador(self) -> None:
-        "Va celda por celda eliminando todas las que sean posiciones de jugadores."
+        "Elimina todas las celdas que sean posiciones de jugadores."
 
-        ancho, alto = self.editor.forma
-
-        for j in range(alto):
-            for i in range(ancho):
-                if self.editor.matriz[j][i].tipo == TiposCelda.POS_JUGADOR:
-                    self.editor.borrar_celda(i, j)
-                    self.borrar_sprite(i, j)
+        for i, j in tuple(self.editor.validador.pos_jugador):
+            self.editor.borrar_celda(i, j)
+            self.borrar_sprite(i, j)
 
 
     def dibujar_fondo(self, superficie: "Surface") -> None:
@@ -403,7 +423,7 @@ class EditorHandler:
         'superficie': La superficie sobre la que dibujar.
         """
 
-        ancho_ventana, _ = get_surface().get_size()
+        ancho_ventana, _ = METRICAS_PANTALLA.tam
         ancho, alto = self.editor.forma
 
         superficie.fill(COLOR_FONDO)
@@ -432,7 +452,7 @@ class EditorHandler:
                 spr = self.matriz_sprites[j][i]
                 if spr is not None:
                     vis = self.editor.matriz[j][i].visible
-                    spr.dibujar(superficie, alpha=(255 if vis else 125))
+                    spr.dibujar(superficie, alpha=(255 if vis else TRANSPARENCIA_INVISIBLE))
 
 
     def dibujar_ids(self, superficie: "Surface", tipos_aceptados: tuple[TiposCelda, ...]) -> None:
@@ -445,7 +465,7 @@ class EditorHandler:
                            dibujar los IDs.
         """
 
-        _, alto = get_surface().get_size()
+        _, alto = METRICAS_PANTALLA.tam
         fuente = FuenteMinecraftia(tam=int(alto * 0.025))
         ancho, alto = self.editor.forma
 
@@ -460,6 +480,43 @@ class EditorHandler:
                                              j * self.incremento_y + self.espacio_menu))
 
 
+    def _get_surf_problema(self) -> Surface:
+        "Devuelve la superficie translúcida con la que se resalta una celda problemática."
+
+        tam = (max(int(self.incremento_x), 1), max(int(self.incremento_y), 1))
+        if self._surf_problema is None or self._surf_problema.get_size() != tam:
+            self._surf_problema = Surface(tam)
+            self._surf_problema.fill(COLOR_PROBLEMA)
+            self._surf_problema.set_alpha(TRANSPARENCIA_PROBLEMA)
+
+        return self._surf_problema
+
+
+    def dibujar_validacion(self, superficie: "Surface") -> None:
+        """
+        Resalta las celdas con problemas y muestra un resumen de la validación del nivel.
+        -
+        'superficie': La superficie sobre la que dibujar.
+        """
+
+        validador = self.editor.validador
+        ancho, alto = self.editor.forma
+        surf_problema = self._get_surf_problema()
+
+        for i, j in validador.celdas_problematicas():
+            if i < ancho and j < alto:
+                superficie.blit(surf_problema, (self.incremento_x * i,
+                                                self.incremento_y * j + self.espacio_menu))
+
+        _, alto_ventana = METRICAS_PANTALLA.tam
+        problemas = validador.problemas()
+        fuente = FuenteMinecraftia(tam=int(alto_ventana * 0.018))
+        resumen = (" | ".join(problemas) if problemas else "Nivel válido")
+        fuente_img = fuente.render(resumen, False,
+                                   (COLOR_VALIDACION if problemas else COLOR_VALIDO))
+        superficie.blit(fuente_img, (alto_ventana * 0.01, alto_ventana * 0.005))
+
+
     def dibujar_sostenido(self, superficie: "Surface") -> None:
         """
         Dibuja la celda que está siendo sostenida por el cursor.
@@ -535,6 +592,7 @@ class EditorHandler:
         self.dibujar_fondo(superficie)
         self.dibujar_celdas(superficie)
         self.dibujar_ids(superficie, (TiposCelda.PUERTA, TiposCelda.LLAVE))
+        self.dibujar_validacion(superficie)
         self.dibujar_sostenido(superficie)
 
         for ev in eventos:
@@ -606,6 +664,7 @@ class EditorHandler:
 
             elif ev.type == EventosJuego.CONTAR_TIMERS:
                 self._actualizar_timers()
+                self.editor.validador.actualizar(self.editor.matriz)
 
 
         for iden, (_, temp) in self.mensajes.items():
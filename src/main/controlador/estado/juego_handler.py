@@ -2,24 +2,30 @@
 Módulo para el handler del estado del juego.
 """
 
-from typing import TYPE_CHECKING, Optional, TypeAlias
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional, TypeAlias, TypeVar, Union
 
-from pygame.constants import K_ESCAPE, KEYDOWN
-from pygame.display import set_caption
+from pygame.constants import (K_ESCAPE, K_F5, KEYDOWN, KEYUP, MOUSEBUTTONDOWN,
+                              MOUSEBUTTONUP, MOUSEMOTION, VIDEORESIZE)
+from pygame.display import get_surface, set_caption
 from pygame.time import set_timer
 from pygame_menu.sound import (SOUND_EXAMPLE_WIDGET_SELECTION,
                                SOUND_TYPE_CLICK_MOUSE,
                                SOUND_TYPE_WIDGET_SELECTION)
 
+from ...modelo.estado import SimulacionJuego
 from ...modelo.eventos import EventosSonidos
+from ...modelo.utils import METRICAS_PANTALLA
+from ...vista.dibujo import CapasDibujo, ListaDibujo
 from ...vista.menus import (MenuCargar, MenuControles, MenuEditor, MenuNivel,
                             MenuOpciones, MenuPerderPartida, MenuPrincipal,
                             MenuVictoria)
 from ...vista.niveles import RenderizadorNivel
 from ..controles import ControlesHandler
-from ..editor import EditorHandler
+from ..editor import EditorHandler, PosicionesMensajesEditor
 from ..eventos import EventosJuego
 from ..jugador import JugadorHandler
+from ..logger import PERFIL_INICIO
 from ..sonidos import MotorSFX
 
 if TYPE_CHECKING:
@@ -28,12 +34,23 @@ if TYPE_CHECKING:
     from pygame import Surface
     from pygame.event import Event
 
-    from ...modelo.estado import Juego, RutasNiveles
+    from ...modelo.estado import FotoJuego, Juego, RutasNiveles
+    from ...modelo.jugador import FotoJugador
     from ...modelo.niveles import Nivel
+    from ...vista.dibujo import MotorTexturas
     from ...vista.menus import SuperMenu
     from ..logger import LoggerJuego
 
 TuplaMenus: TypeAlias = tuple["SuperMenu", ...]
+TipoMenu = TypeVar("TipoMenu", bound="SuperMenu")
+
+# Los menús se crean recién la primera vez que se usan, en este orden al precalentarlos
+MENUS_EXTERNOS: tuple[type["SuperMenu"], ...] = (MenuPrincipal, MenuCargar, MenuOpciones,
+                                                 MenuControles, MenuEditor, MenuPerderPartida,
+                                                 MenuVictoria)
+MENUS_INTERNOS: tuple[type["SuperMenu"], ...] = (MenuNivel,)
+FRAMES_INACTIVO_PRECALENTAR: int = 30 # Frames sin que el usuario haga nada en el menú principal
+EVENTOS_USUARIO: tuple[int, ...] = (KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION)
 
 # -- sfx --
 MENU_CLICK_PATH: "PathLike" = "./media/sfx/menus/menu_click.wav"
@@ -44,48 +61,53 @@ class JuegoHandler:
 
     def __init__(self,
                  juego: "Juego",
-                 logger: "LoggerJuego") -> None:
+                 logger: "LoggerJuego",
+                 motor_texturas: Optional["MotorTexturas"]=None) -> None:
         """
         Inicializa el handler del juego.
         -
         'juego': La instancia del estado del juego, tal que se pueda acceder a ella.
 
         'logger': El registrador del juego.
+
+        'motor_texturas': Si se especifica, el nivel se dibuja con texturas a través de
+                          este motor en vez de con superficies.
         """
 
         self.juego: "Juego" = juego
         self.logger: "LoggerJuego" = logger
-        self.controles: ControlesHandler = ControlesHandler(logger=self.logger)
-        self.sfx: MotorSFX = MotorSFX(logger=self.logger)
+        self.motor_texturas: Optional["MotorTexturas"] = motor_texturas
+        with PERFIL_INICIO.fase("ControlesHandler"):
+            self.controles: ControlesHandler = ControlesHandler(logger=self.logger)
+        with PERFIL_INICIO.fase("MotorSFX"):
+            self.sfx: MotorSFX = MotorSFX(logger=self.logger)
         self.jugador_handler: Optional[JugadorHandler] = None
-        self.editor_handler: EditorHandler = EditorHandler()
+        self._editor_handler: Optional[EditorHandler] = None
 
         # -- Niveles --
-        self.rend_nivel: RenderizadorNivel = RenderizadorNivel(self)
+        with PERFIL_INICIO.fase("RenderizadorNivel"):
+            self.rend_nivel: RenderizadorNivel = RenderizadorNivel(self)
+        self.juego.precargador.calentar = self.rend_nivel.calentar_sprites
+        self.lista_dibujo: ListaDibujo = ListaDibujo()
         self.trofeos_recogidos: int = 0
         # -------------
 
         # -- Atributos de control --
         self._salir: bool = False
         self.conservar_vidas: bool = True
+        self.probando_nivel: bool = False # Si se juega un nivel del editor
+        # Si se elige en la configuración de video, el juego avanza en su propio hilo
+        self.simulacion: Optional[SimulacionJuego] = None
+        # Cómo está el jugador en el frame actual, para dibujar la interfaz sin tocarlo
+        self.foto_jugador: Optional["FotoJugador"] = None
         # --------------------------
 
         # -- Menús --
-        self.menu_principal: MenuPrincipal = MenuPrincipal(self)
-        self.menu_opciones: MenuOpciones = MenuOpciones(self)
-        self.menu_controles: MenuControles = MenuControles(self)
-        self.menu_editor: MenuEditor = MenuEditor(self)
-        self.menu_nivel: MenuNivel = MenuNivel(self)
-        self.menu_perder: MenuPerderPartida = MenuPerderPartida(self)
-        self.menu_ganar: MenuVictoria = MenuVictoria(self)
-        self.menu_cargar: MenuCargar = MenuCargar(self)
-
-        self.menus_ext: TuplaMenus = (self.menu_principal, self.menu_cargar, self.menu_opciones,
-                                      self.menu_controles, self.menu_editor, self.menu_perder,
-                                      self.menu_ganar)
-        self.menus_in: TuplaMenus = (self.menu_nivel,)
-
-        self.menu_actual: "SuperMenu" = self.menu_principal
+        self._menus: dict[type["SuperMenu"], "SuperMenu"] = {}
+        self.precalentar_menus: bool = True # Crear los menús que falten si no se hace nada
+        self._frames_inactivo: int = 0
+        with PERFIL_INICIO.fase("MenuPrincipal"):
+            self.menu_actual: "SuperMenu" = self.menu_principal
         # -----------
 
         # -- eventos --
@@ -95,13 +117,127 @@ class JuegoHandler:
         # -------------
 
 
+    def _get_menu(self, clase: type[TipoMenu]) -> TipoMenu:
+        """
+        Devuelve la instancia de un menú, creándola si es la primera vez que se pide.
+        -
+        'clase': La clase del menú.
+        """
+
+        menu = self._menus.get(clase)
+        if menu is None:
+            inicio = perf_counter()
+            menu = clase(self)
+            # Los menús ya creados se enteraron de los cambios de audio, éste no
+            menu.set_sound((self.sfx.menus_sfx if self.hay_audio() else None), recursive=True)
+            self._menus[clase] = menu
+            self.logger.debug(f"Menú '{clase.__name__}' creado en "
+                              f"{(perf_counter() - inicio) * 1000:.1f} ms")
+
+        return menu
+
+
+    @property
+    def menu_principal(self) -> MenuPrincipal:
+        "Devuelve el menú principal."
+
+        return self._get_menu(MenuPrincipal)
+
+
+    @property
+    def menu_opciones(self) -> MenuOpciones:
+        "Devuelve el menú de opciones."
+
+        return self._get_menu(MenuOpciones)
+
+
+    @property
+    def menu_controles(self) -> MenuControles:
+        "Devuelve el menú de controles."
+
+        return self._get_menu(MenuControles)
+
+
+    @property
+    def menu_editor(self) -> MenuEditor:
+        "Devuelve el menú del editor de niveles."
+
+        return self._get_menu(MenuEditor)
+
+
+    @property
+    def menu_nivel(self) -> MenuNivel:
+        "Devuelve el menú de nivel."
+
+        return self._get_menu(MenuNivel)
+
+
+    @property
+    def menu_perder(self) -> MenuPerderPartida:
+        "Devuelve el menú de perder un nivel."
+
+        return self._get_menu(MenuPerderPartida)
+
+
+    @property
+    def menu_ganar(self) -> MenuVictoria:
+        "Devuelve el menú de ganar."
+
+        return self._get_menu(MenuVictoria)
+
+
+    @property
+    def menu_cargar(self) -> MenuCargar:
+        "Devuelve el menú de cargar niveles."
+
+        return self._get_menu(MenuCargar)
+
+
+    @property
+    def editor_handler(self) -> EditorHandler:
+        "Devuelve el handler del editor de niveles, creándolo la primera vez que se pide."
+
+        if self._editor_handler is None:
+            self._editor_handler = EditorHandler()
+
+        return self._editor_handler
+
+
+    @property
+    def menus_ext(self) -> TuplaMenus:
+        "Devuelve los menús externos (fuera de un nivel) que ya fueron creados."
+
+        return tuple(self._menus[clase] for clase in MENUS_EXTERNOS if clase in self._menus)
+
+
+    @property
+    def menus_in(self) -> TuplaMenus:
+        "Devuelve los menús internos (dentro de un nivel) que ya fueron creados."
+
+        return tuple(self._menus[clase] for clase in MENUS_INTERNOS if clase in self._menus)
+
+
     @property
     def menus(self) -> TuplaMenus:
-        "Devuelve todos los menús disponibles en el juego."
+        "Devuelve todos los menús del juego que ya fueron creados."
 
         return self.menus_ext + self.menus_in
 
 
+    def precalentar(self) -> bool:
+        """
+        Crea el siguiente menú que todavía no exista. Devuelve `False` si ya estaban todos.
+        Se crea de a uno para no trabar más de un frame a la vez.
+        """
+
+        for clase in MENUS_EXTERNOS + MENUS_INTERNOS:
+            if clase not in self._menus:
+                self._get_menu(clase)
+                return True
+
+        return False
+
+
     @property
     def nivel(self) -> Optional["Nivel"]:
         "Devuelve el nivel actual del juego."
@@ -249,26 +385,28 @@ class JuegoHandler:
     def en_editor(self) -> bool:
         "Verifica si el juego está en el editor."
 
-        return self.menu_actual == self.menu_editor
+        return isinstance(self.menu_actual, MenuEditor)
 
 
     def se_esta_jugando(self) -> bool:
         "Averigua si el juego esta dentro de un nivel o no."
 
-        return self.juego.se_esta_jugando() and self.menu_actual in self.menus_in
+        return self.juego.se_esta_jugando() and isinstance(self.menu_actual, MENUS_INTERNOS)
 
 
-    def iniciar_juego(self, niveles: Optional["RutasNiveles"]=None) -> None:
+    def iniciar_juego(self,
+                      niveles: Optional[Union["RutasNiveles", "PathLike"]]=None) -> None:
         """
         Inicia el juego por primera vez.
         -
-        'niveles': Las rutas de los niveles a cargar, si es que se quiere cargar un pack en
-                   particular. Si no se especifica, se utilizan los niveles que vienen con
-                   el juego.
+        'niveles': Las rutas de los niveles a cargar, o la de un archivo '.nivelpack', si es
+                   que se quiere cargar un pack en particular. Si no se especifica, se
+                   utilizan los niveles que vienen con el juego.
         """
 
         self.juego.reiniciar_niveles(niveles)
         self.trofeos_recogidos = 0
+        self.probando_nivel = False
         self.jugar(conservar_vidas=False) # Al ser la primera vez, la vida se debe reiniciar
 
 
@@ -282,15 +420,61 @@ class JuegoHandler:
         if conservar_vidas is None:
             conservar_vidas = self.conservar_vidas
 
+        self._detener_simulacion()
         self.juego.jugar(preservar_vidas=conservar_vidas)
-        self.jugador_handler = JugadorHandler(self.juego.jugador,
-                                              self.sfx,
-                                              self.controles,
-                                              self.logger)
+        self._entrar_a_nivel()
+
+
+    def _entrar_a_nivel(self) -> None:
+        "Prepara el jugador y el renderizador para el nivel recién cargado y entra al mismo."
+
+        # Los sprites del jugador se conservan entre niveles; sólo se reinician
+        if self.jugador_handler is None:
+            self.jugador_handler = JugadorHandler(self.juego.jugador,
+                                                  self.sfx,
+                                                  self.controles,
+                                                  self.logger,
+                                                  escala=self.rend_nivel.escala_dibujo)
+        else:
+            self.jugador_handler.reiniciar(self.juego.jugador, self.rend_nivel.escala_dibujo)
         self.rend_nivel.reiniciar_nivel()
         self.cambiar_a_nivel()
 
 
+    def probar_nivel_editor(self) -> None:
+        """
+        Juega el nivel que está en el editor directamente desde memoria, sin exportarlo.
+        Al salir, perder o ganar se vuelve al editor tal como estaba.
+        """
+
+        editor = self.editor_handler.editor
+        if not editor.validador.es_jugable():
+            self.editor_handler.refrescar_mensaje("ERROR: Se necesita exactamente una casilla "
+                                                  "del jugador para probar el nivel",
+                                                  PosicionesMensajesEditor.INFO_ARRIBA)
+            return
+
+        self.juego.probar_nivel(editor.generar_nivel(self.menu_editor.nombre_nivel))
+        self.trofeos_recogidos = 0
+        self.probando_nivel = True
+        self._entrar_a_nivel()
+
+
+    def volver_al_editor(self, mensaje: str="") -> None:
+        """
+        Termina la prueba de un nivel y vuelve al editor.
+        -
+        'mensaje': Un mensaje opcional a mostrar en el editor.
+        """
+
+        self._detener_simulacion()
+        self.juego.salir()
+        self.probando_nivel = False
+        self.cambiar_a_editor()
+        if mensaje:
+            self.editor_handler.refrescar_mensaje(mensaje, PosicionesMensajesEditor.INFO_ARRIBA)
+
+
     def hay_que_salir(self) -> bool:
         "Determina si hay que salir del programa o no."
 
@@ -306,6 +490,82 @@ class JuegoHandler:
         self._salir = True
 
 
+    def redimensionar(self) -> bool:
+        """
+        Reacomoda todo al tamaño actual de la pantalla, si es que cambió. Devuelve si lo
+        hizo. Los menús se vuelven a crear (conservando lo que el usuario había cambiado),
+        y el nivel, el jugador y el editor se reubican sin perder su estado. Las imágenes
+        escaladas se guardan por tamaño, así que cada una se reescala sólo la primera vez.
+        """
+
+        tam_anterior = METRICAS_PANTALLA.tam
+        ancho, alto = get_surface().get_size()
+        if ancho <= 0 or alto <= 0 or not METRICAS_PANTALLA.actualizar((ancho, alto)):
+            return False
+
+        self._detener_simulacion()
+        self.logger.info(f"Pantalla redimensionada de {tam_anterior[0]}x{tam_anterior[1]} "
+                         f"a {ancho}x{alto}")
+        self.juego.reacomodar(tam_anterior)
+
+        anteriores = self._menus
+        self._menus = {}
+        clase_actual = type(self.menu_actual)
+        self.menu_actual = self._get_menu(clase_actual)
+        self.menu_actual.conservar(anteriores[clase_actual])
+        for menu in anteriores.values():
+            menu.cerrar()
+        self.precalentar_menus = True
+        self._frames_inactivo = 0
+
+        if self._editor_handler is not None:
+            self._editor_handler.reacomodar()
+
+        if self.jugador_handler is not None and self.juego.jugador is not None:
+            self.jugador_handler.reiniciar(self.juego.jugador, self.rend_nivel.escala_dibujo)
+        if self.rend_nivel.hay_nivel():
+            self.rend_nivel.reiniciar_nivel()
+
+        return True
+
+
+    def _foto_simulacion(self, eventos: list["Event"]) -> Optional["FotoJuego"]:
+        """
+        Si el juego se simula en otro hilo, le pasa los eventos del frame y devuelve la
+        foto más reciente para dibujar, empezando la simulación si todavía no corría.
+        Si no, devuelve `None`.
+        -
+        'eventos': La lista de eventos de Pygame a procesar.
+        """
+
+        if not self.rend_nivel.simulacion_en_hilo:
+            return None
+
+        if self.simulacion is None:
+            self.simulacion = SimulacionJuego(self.juego,
+                                              self.jugador_handler.procesar_teclas_jugador)
+            self.simulacion.iniciar()
+
+        self.simulacion.enviar(eventos)
+        return self.simulacion.tomar()
+
+
+    def _detener_simulacion(self) -> None:
+        """
+        Detiene el hilo de simulación, si corría, tal que se pueda volver a tocar el juego.
+        Si falló en su último paso, el error queda registrado en el log.
+        """
+
+        if self.simulacion is None:
+            return
+
+        self.simulacion.detener()
+        if self.simulacion.error is not None:
+            self.logger.error("La simulación del juego falló",
+                              exc_info=self.simulacion.error)
+        self.simulacion = None
+
+
     def actualizar(self, superficie: "Surface", eventos: list["Event"],
                    **kwargs) -> None:
         """
@@ -320,11 +580,25 @@ class JuegoHandler:
         '**kwargs': Atributos extra.
         """
 
+        self.lista_dibujo.nuevo_frame()
+
+        if any(ev.type == VIDEORESIZE for ev in eventos):
+            self.redimensionar()
+
         for ev in eventos:
             if ev.type == KEYDOWN:
-                if ev.key == K_ESCAPE and (self.en_editor() or self.se_esta_jugando()):
+                if ev.key == K_ESCAPE and self.probando_nivel and self.se_esta_jugando():
+                    self.volver_al_editor()
+
+                elif ev.key == K_ESCAPE and (self.en_editor() or self.se_esta_jugando()):
+                    if self.se_esta_jugando():
+                        self._detener_simulacion()
+                        self.juego.salir()
                     self.cambiar_a_principal()
 
+                elif ev.key == K_F5 and self.en_editor():
+                    self.probar_nivel_editor()
+
             elif ev.type == EventosSonidos.DANIO_FUERTE:
                 self.sfx.mixer.play(self.sfx.sonidos["danio_fuerte"])
 
@@ -336,31 +610,69 @@ class JuegoHandler:
                 self.trofeos_recogidos += 1
 
         if self.se_esta_jugando():
-            gano_nivel, hay_siguiente = self.juego.gano()
-
-            if self.juego.perdio():
-                self.juego.salir()
-                self.mostrar_derrota()
+            foto = self._foto_simulacion(eventos)
+            if foto is not None:
+                perdio, gano_nivel, hay_siguiente = foto.perdio, foto.gano, foto.hay_siguiente
+            else:
+                perdio = self.juego.perdio()
+                gano_nivel, hay_siguiente = self.juego.gano()
+
+            # Para salir del nivel o pasar al siguiente, el juego no debe estar avanzando
+            if perdio or gano_nivel:
+                self._detener_simulacion()
+                foto = None
+
+            if perdio:
+                if self.probando_nivel:
+                    self.volver_al_editor("Prueba terminada: el jugador perdió todas las vidas")
+                else:
+                    self.juego.salir()
+                    self.mostrar_derrota()
 
             elif gano_nivel:
-                if hay_siguiente:
+                if self.probando_nivel:
+                    self.volver_al_editor("Prueba terminada: ¡nivel superado!")
+                elif hay_siguiente:
                     self.jugar()
                 else:
                     self.juego.salir()
                     self.mostrar_victoria()
 
-            self.rend_nivel.actualizar(superficie, eventos)
-            self.juego.reiniciar_vel_jugador() # Necesariamente antes que procesar las teclas
-            self.jugador_handler.actualizar(superficie, eventos, nivel=self.nivel, **kwargs)
-            self.juego.actualizar(eventos)
-            self.rend_nivel.dibujar_debug_info(superficie)
+            self.rend_nivel.actualizar(superficie, eventos, foto)
+            if foto is not None:
+                self.foto_jugador = foto.jugador
+                self.jugador_handler.dibujar_foto(self.lista_dibujo.capa(CapasDibujo.JUGADOR),
+                                                  eventos, foto.jugador)
+            else:
+                self.juego.reiniciar_vel_jugador() # Necesariamente antes que procesar las teclas
+                self.jugador_handler.actualizar(self.lista_dibujo.capa(CapasDibujo.JUGADOR),
+                                                eventos, nivel=self.nivel, **kwargs)
+                self.juego.actualizar(eventos)
+                self.foto_jugador = self.juego.jugador.foto()
+            self.rend_nivel.dibujar_debug_info(self.lista_dibujo.capa(CapasDibujo.DEBUG),
+                                               self.foto_jugador)
+            self.rend_nivel.componer(superficie)
+            self.lista_dibujo.dibujar(superficie)
 
-        elif self.en_editor():
-            self.editor_handler.actualizar(superficie, eventos)
+        else:
+            self._detener_simulacion()
+            if self.en_editor():
+                self.editor_handler.actualizar(superficie, eventos)
 
         self.menu_actual.update(eventos)
         self.menu_actual.draw(superficie)
 
+        # Aprovechar que no se está haciendo nada para ir creando los demás menús
+        if self.precalentar_menus and isinstance(self.menu_actual, MenuPrincipal):
+            if any(ev.type in EVENTOS_USUARIO for ev in eventos):
+                self._frames_inactivo = 0
+            else:
+                self._frames_inactivo += 1
+
+            if self._frames_inactivo >= FRAMES_INACTIVO_PRECALENTAR:
+                self._frames_inactivo = 0
+                self.precalentar_menus = self.precalentar()
+
 
     def guardar_config(self) -> None:
         """
@@ -370,3 +682,12 @@ class JuegoHandler:
 
         self.controles.guardar_config()
         self.sfx.guardar_config()
+        self.rend_nivel.guardar_config()
+
+
+    def cerrar(self) -> None:
+        "Libera los procesos e hilos que trabajan en segundo plano antes de terminar."
+
+        self._detener_simulacion()
+        for menu in self.menus:
+            menu.cerrar()
@@ -5,6 +5,7 @@ Módulo para el handler de una instancia de jugador.
 from typing import TYPE_CHECKING, Optional
 
 from pygame.constants import KEYDOWN
+from pygame.math import Vector2
 
 from ...modelo.jugador import EstadoJugador
 from ...modelo.utils import Temporizador
@@ -16,11 +17,11 @@ from ...modelo.eventos import EventosSonidos
 if TYPE_CHECKING:
     from os import PathLike
 
-    from pygame import Surface
     from pygame.event import Event
 
-    from ...modelo.jugador import Jugador
+    from ...modelo.jugador import FotoJugador, Jugador
     from ...modelo.niveles import Nivel
+    from ...vista.dibujo import Lienzo
     from ..controles import ControlesHandler
     from ..logger import LoggerJuego
     from ..sonidos import MotorSFX
@@ -28,17 +29,41 @@ if TYPE_CHECKING:
 
 # -- sprites --
 SPRITES_JUGADOR: "PathLike" = "./media/sprites/jugador"
-QUIETO: "PathLike" = f"{SPRITES_JUGADOR}/idle"
-CAMINANDO_IZQ: "PathLike" = f"{SPRITES_JUGADOR}/walking_left"
-CAMINANDO_DER: "PathLike" = f"{SPRITES_JUGADOR}/walking_right"
-PARED_IZQ: "PathLike" = f"{SPRITES_JUGADOR}/grabbing_left"
-PARED_DER: "PathLike" = f"{SPRITES_JUGADOR}/grabbing_right"
-DASH_IZQ: "PathLike" = f"{SPRITES_JUGADOR}/dashing_left"
-DASH_DER: "PathLike" = f"{SPRITES_JUGADOR}/dashing_right"
-SALTANDO: "PathLike" = f"{SPRITES_JUGADOR}/jumping"
-CAYENDO: "PathLike" = f"{SPRITES_JUGADOR}/falling"
+QUIETO: "PathLike" = f"{SPRITES_JUGADOR}/idle.png"
+CAMINANDO_IZQ: "PathLike" = f"{SPRITES_JUGADOR}/walking_left.png"
+CAMINANDO_DER: "PathLike" = f"{SPRITES_JUGADOR}/walking_right.png"
+PARED_IZQ: "PathLike" = f"{SPRITES_JUGADOR}/grabbing_left.png"
+PARED_DER: "PathLike" = f"{SPRITES_JUGADOR}/grabbing_right.png"
+DASH_IZQ: "PathLike" = f"{SPRITES_JUGADOR}/dashing_left.png"
+DASH_DER: "PathLike" = f"{SPRITES_JUGADOR}/dashing_right.png"
+SALTANDO: "PathLike" = f"{SPRITES_JUGADOR}/jumping.png"
+CAYENDO: "PathLike" = f"{SPRITES_JUGADOR}/falling.png"
+ANIMACIONES_JUGADOR: tuple["PathLike", ...] = (QUIETO, CAMINANDO_IZQ, CAMINANDO_DER,
+                                               PARED_IZQ, PARED_DER, DASH_IZQ, DASH_DER,
+                                               SALTANDO, CAYENDO)
 # -------------
 
+TRANSPARENCIA_INVULNERABLE: int = 100
+
+# A qué estados es más probable pasar desde cada uno, para tener sus sprites listos antes
+TRANSICIONES_JUGADOR: dict[EstadoJugador, tuple[EstadoJugador, ...]] = {
+    EstadoJugador.QUIETO: (EstadoJugador.CAMINANDO_IZQ, EstadoJugador.CAMINANDO_DER,
+                           EstadoJugador.SALTANDO),
+    EstadoJugador.CAMINANDO_IZQ: (EstadoJugador.SALTANDO, EstadoJugador.DASH_IZQ,
+                                  EstadoJugador.CAYENDO, EstadoJugador.CAMINANDO_DER),
+    EstadoJugador.CAMINANDO_DER: (EstadoJugador.SALTANDO, EstadoJugador.DASH_DER,
+                                  EstadoJugador.CAYENDO, EstadoJugador.CAMINANDO_IZQ),
+    EstadoJugador.SALTANDO: (EstadoJugador.CAYENDO, EstadoJugador.PARED_IZQ,
+                             EstadoJugador.PARED_DER),
+    EstadoJugador.CAYENDO: (EstadoJugador.QUIETO, EstadoJugador.CAMINANDO_IZQ,
+                            EstadoJugador.CAMINANDO_DER, EstadoJugador.PARED_IZQ,
+                            EstadoJugador.PARED_DER),
+    EstadoJugador.PARED_IZQ: (EstadoJugador.SALTANDO, EstadoJugador.CAYENDO),
+    EstadoJugador.PARED_DER: (EstadoJugador.SALTANDO, EstadoJugador.CAYENDO),
+    EstadoJugador.DASH_IZQ: (EstadoJugador.CAMINANDO_IZQ, EstadoJugador.CAYENDO),
+    EstadoJugador.DASH_DER: (EstadoJugador.CAMINANDO_DER, EstadoJugador.CAYENDO)
+}
+
 
 class JugadorHandler:
     """
@@ -52,7 +77,8 @@ class JugadorHandler:
                  jugador: "Jugador",
                  sonidos: "MotorSFX",
                  controles: "ControlesHandler",
-                 logger: Optional["LoggerJuego"]=None) -> None:
+                 logger: Optional["LoggerJuego"]=None,
+                 escala: tuple[float, float]=(1.0, 1.0)) -> None:
         """
         Inicializa el handler del jugador.
         -
@@ -63,9 +89,13 @@ class JugadorHandler:
         'controles': Los controles del juego.
 
         'logger': El registrador del juego.
+
+        'escala': Por cuánto multiplicar la posición y el tamaño del jugador para pasarlos
+                  a los de la superficie donde se dibuja el nivel.
         """
 
         self.jugador: "Jugador" = jugador
+        self.escala: tuple[float, float] = escala
         self.sfx: "MotorSFX" = sonidos
         self.controles: "ControlesHandler" = controles
         self.logger: Optional["LoggerJuego"] = logger
@@ -73,8 +103,8 @@ class JugadorHandler:
         self.dibujar_inv: bool = True
 
         self.sprites: SpritesManager = SpritesManager(
-            pos=self.jugador.pos,
-            tam=self.jugador.tam,
+            pos=self._escalar(self.jugador.pos),
+            tam=self._escalar(self.jugador.tam),
             rutas_anim={
                 EstadoJugador.QUIETO: QUIETO,
                 EstadoJugador.CAMINANDO_IZQ: CAMINANDO_IZQ,
@@ -86,17 +116,39 @@ class JugadorHandler:
                 EstadoJugador.SALTANDO: SALTANDO,
                 EstadoJugador.CAYENDO: CAYENDO
             },
-            default=EstadoJugador.QUIETO
+            default=EstadoJugador.QUIETO,
+            transiciones=TRANSICIONES_JUGADOR,
+            alphas=(TRANSPARENCIA_INVULNERABLE,)
         )
 
 
-    def _cambio_estado_jugador(self) -> bool:
+    def _escalar(self, vector: Vector2) -> Vector2:
         """
-        Determina si desde el último ciclo, el estado de jugador es distinto.
-        Si lo es, cambiar sprites y realizar otras actualizaciones acordes.
+        Pasa una posición o tamaño del jugador a las coordenadas en las que se dibuja.
+        -
+        'vector': La posición o tamaño, en coordenadas de la ventana.
         """
 
-        return self.jugador.estado != self.sprites.nombre_actual
+        return Vector2(vector.x * self.escala[0], vector.y * self.escala[1])
+
+
+    def reiniciar(self, jugador: "Jugador", escala: tuple[float, float]=(1.0, 1.0)) -> None:
+        """
+        Asocia el handler a otro jugador (por ejemplo, al empezar un nivel), reutilizando
+        los sprites ya cargados en vez de crear un handler nuevo.
+        -
+        'jugador': La nueva instancia de jugador.
+
+        'escala': Por cuánto multiplicar la posición y el tamaño del jugador para
+                  dibujarlo.
+        """
+
+        self.jugador = jugador
+        self.escala = escala
+        self.inv_sprites.reiniciar()
+        self.dibujar_inv = True
+        self.sprites.reiniciar(self._escalar(self.jugador.pos), self._escalar(self.jugador.tam),
+                               default=EstadoJugador.QUIETO)
 
 
     def _alternar_dibujar_inv(self) -> None:
@@ -133,29 +185,51 @@ class JugadorHandler:
                         self.sfx.mixer.play(self.sfx.sonidos["dash"])
 
 
-    def _actualizar_timers(self) -> None:
-        "Actualiza toods los temporizadores del handler."
+    def _actualizar_timers(self, invulnerable: bool) -> None:
+        """
+        Actualiza toods los temporizadores del handler.
+        -
+        'invulnerable': Si el jugador es inmune al daño en este momento.
+        """
 
         if not self.inv_sprites.esta_contando():
             self._alternar_dibujar_inv()
 
-        self.inv_sprites.actualizar(1, reiniciar=self.jugador.es_invulnerable())
+        self.inv_sprites.actualizar(1, reiniciar=invulnerable)
 
 
-    def actualizar(self, superficie: "Surface", eventos: list["Event"],
+    def actualizar(self, superficie: "Lienzo", eventos: list["Event"],
                    **kwargs) -> None:
         """
         Actualiza los eventos que le ocurren al jugador.
         -
-        'superficie': La superficie (`pygame.Surface`) en donde se va a dibujar todos los
-                      cambios visuales a aplicar.
+        'superficie': La superficie (`pygame.Surface`) o capa de la lista de dibujo en
+                      donde se va a dibujar todos los cambios visuales a aplicar.
 
         'eventos': La lista de eventos de Pygame a procesar.
 
         '**kwargs': Atributos extra.
         """
 
-        self._actualizar_timers()
+        self.procesar_teclas_jugador(eventos, kwargs.get("nivel"))
+        self.dibujar_foto(superficie, eventos, self.jugador.foto())
+
+
+    def dibujar_foto(self, superficie: "Lienzo", eventos: list["Event"],
+                     foto: "FotoJugador") -> None:
+        """
+        Actualiza los sprites del jugador y lo dibuja tal como aparece en una foto suya,
+        sin leer al jugador mismo (que puede estar cambiando en el hilo de simulación).
+        -
+        'superficie': La superficie (`pygame.Surface`) o capa de la lista de dibujo en
+                      donde se va a dibujar todos los cambios visuales a aplicar.
+
+        'eventos': La lista de eventos de Pygame a procesar.
+
+        'foto': La foto del jugador a dibujar.
+        """
+
+        self._actualizar_timers(foto.invulnerable)
 
         for ev in eventos:
             if ev.type == EventosJuego.REDIBUJAR_JUGADOR:
@@ -164,14 +238,13 @@ class JugadorHandler:
             elif ev.type == EventosSonidos.DANIO:
                 self.sfx.mixer.play(self.sfx.sonidos["danio"])
 
-        self.procesar_teclas_jugador(eventos, kwargs.get("nivel"))
-
-        if self._cambio_estado_jugador():
-            self.sprites.cambiar_animacion(self.jugador.estado)
-        self.sprites.cambiar_pos(self.jugador.pos)
+        if foto.estado != self.sprites.nombre_actual:
+            self.sprites.cambiar_animacion(foto.estado)
+        pos_x, pos_y, _, _ = foto.hitbox
+        self.sprites.cambiar_pos(self._escalar(Vector2(pos_x, pos_y)))
 
-        if self.jugador.es_invulnerable():
+        if foto.invulnerable:
             if self.dibujar_inv:
-                self.sprites.dibujar(superficie, alpha=100)
+                self.sprites.dibujar(superficie, alpha=TRANSPARENCIA_INVULNERABLE)
         else:
             self.sprites.dibujar(superficie)
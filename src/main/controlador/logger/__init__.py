@@ -3,3 +3,4 @@ Paquete para el registrador del proyecto.
 """
 
 from .logger import *
+from .perfil_inicio import *
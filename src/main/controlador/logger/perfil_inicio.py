@@ -0,0 +1,266 @@
+"""
+Módulo para el perfilador del inicio del juego.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from json import dump
+from pathlib import Path
+from sys import meta_path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from importlib.machinery import ModuleSpec
+    from os import PathLike
+    from types import ModuleType
+
+    from .logger import LoggerJuego
+
+# Si esta variable de entorno tiene una ruta, el perfil también se guarda ahí como JSON
+VAR_PERFIL_JSON: str = "CUBE_JUMPER_PERFIL"
+MAX_IMPORTACIONES_REPORTE: int = 15
+
+
+class FaseInicio(NamedTuple):
+    "Una fase del inicio, con sus tiempos en milisegundos."
+
+    nombre: str
+    desde_ms: float # Desde que se creó el perfil
+    ms: float
+    nivel: int # Cuántas fases la contienen
+
+
+class TiempoImportacion(NamedTuple):
+    "Lo que tardó en ejecutarse un módulo al importarlo, en milisegundos."
+
+    modulo: str
+    propio_ms: float # Sin contar los módulos que importó a su vez
+    acumulado_ms: float
+    nivel: int
+
+
+class _MedidorImportaciones(MetaPathFinder):
+    """
+    Buscador de módulos que no encuentra nada por sí mismo: le pide el módulo a los
+    demás buscadores y mide cuánto tarda en ejecutarse, al estilo de `-X importtime`.
+    """
+
+    def __init__(self, perfil: "PerfilInicio") -> None:
+        """
+        Inicializa el medidor.
+        -
+        'perfil': El perfil donde anotar los tiempos.
+        """
+
+        self.perfil: "PerfilInicio" = perfil
+        self._pila: list[float] = [] # Tiempo de los hijos de cada importación en curso
+
+
+    def find_spec(self, fullname: str, path: Any, target: Optional["ModuleType"]=None
+                  ) -> Optional["ModuleSpec"]:
+        """
+        Busca el módulo con los demás buscadores, y si tiene un cargador propio le mide
+        la ejecución.
+        """
+
+        for buscador in meta_path:
+            if buscador is self or not hasattr(buscador, "find_spec"):
+                continue
+
+            spec = buscador.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        cargador = spec.loader
+        # Los cargadores que son clases (módulos integrados) se comparten, no se tocan
+        if cargador is None or isinstance(cargador, type) or not hasattr(cargador, "exec_module"):
+            return spec
+
+        ejecutar = cargador.exec_module
+
+        def exec_module_medido(modulo: "ModuleType") -> None:
+            "Ejecuta el módulo midiendo cuánto tarda."
+
+            nivel = len(self._pila)
+            self._pila.append(0.0)
+            inicio = perf_counter()
+            try:
+                ejecutar(modulo)
+            finally:
+                acumulado = (perf_counter() - inicio) * 1000
+                hijos = self._pila.pop()
+                if self._pila:
+                    self._pila[-1] += acumulado
+                self.perfil.importaciones.append(TiempoImportacion(fullname,
+                                                                   acumulado - hijos,
+                                                                   acumulado,
+                                                                   nivel))
+
+        cargador.exec_module = exec_module_medido
+        return spec
+
+
+class PerfilInicio:
+    """
+    Clase que registra cuánto tarda cada fase del inicio del juego, y cuánto cada módulo
+    importado, para poder ver a qué se va el tiempo hasta el primer frame.
+    """
+
+    def __init__(self) -> None:
+        "Inicializa el perfil. El tiempo se cuenta desde acá."
+
+        self.inicio: float = perf_counter()
+        self.fases: list[FaseInicio] = []
+        self.importaciones: list[TiempoImportacion] = []
+        self._abiertas: list[tuple[str, float]] = []
+        self._medidor: Optional[_MedidorImportaciones] = None
+
+
+    def _ms_desde_inicio(self, instante: float) -> float:
+        """
+        Convierte un instante de `perf_counter()` a milisegundos desde el inicio.
+        -
+        'instante': El instante en cuestión.
+        """
+
+        return (instante - self.inicio) * 1000
+
+
+    @property
+    def total_ms(self) -> float:
+        "Devuelve cuántos milisegundos pasaron desde que se creó el perfil."
+
+        return self._ms_desde_inicio(perf_counter())
+
+
+    def medir_importaciones(self) -> None:
+        """
+        Empieza a medir los módulos que se importen de acá en adelante. Todo hasta que
+        se deje de medir cuenta como la fase 'importaciones'.
+        """
+
+        if self._medidor is None:
+            self._medidor = _MedidorImportaciones(self)
+            meta_path.insert(0, self._medidor)
+            self.iniciar_fase("importaciones")
+
+
+    def dejar_de_medir_importaciones(self) -> None:
+        "Deja de medir las importaciones, si es que se estaban midiendo."
+
+        if self._medidor is not None:
+            meta_path.remove(self._medidor)
+            self._medidor = None
+            self.terminar_fase()
+
+
+    def iniciar_fase(self, nombre: str) -> None:
+        """
+        Empieza una fase. Si ya hay otra en curso, ésta queda dentro de aquella.
+        -
+        'nombre': El nombre de la fase.
+        """
+
+        self._abiertas.append((nombre, perf_counter()))
+
+
+    def terminar_fase(self) -> FaseInicio:
+        "Termina la última fase que se empezó, y la devuelve."
+
+        nombre, desde = self._abiertas.pop()
+        fase = FaseInicio(nombre,
+                          self._ms_desde_inicio(desde),
+                          (perf_counter() - desde) * 1000,
+                          len(self._abiertas))
+        self.fases.append(fase)
+        return fase
+
+
+    @contextmanager
+    def fase(self, nombre: str) -> Iterator[None]:
+        """
+        Mide lo que se ejecute dentro del bloque `with` como una fase.
+        -
+        'nombre': El nombre de la fase.
+        """
+
+        self.iniciar_fase(nombre)
+        try:
+            yield
+        finally:
+            self.terminar_fase()
+
+
+    def importaciones_por_paquete(self) -> dict[str, float]:
+        "Devuelve el tiempo propio de todas las importaciones, sumado por paquete raíz."
+
+        por_paquete = defaultdict(float)
+        for imp in self.importaciones:
+            por_paquete[imp.modulo.split(".")[0]] += imp.propio_ms
+
+        return dict(sorted(por_paquete.items(), key=lambda item: item[1], reverse=True))
+
+
+    def reporte(self, max_importaciones: int=MAX_IMPORTACIONES_REPORTE) -> list[str]:
+        """
+        Devuelve el reporte del perfil, como una lista de líneas de texto.
+        -
+        'max_importaciones': Cuántos de los módulos más lentos mostrar.
+        """
+
+        lineas = [f"Perfil de inicio ({self.total_ms:.1f} ms en total):"]
+        # Las fases se anotan al terminar; se ordenan por cuándo empezaron
+        for fase in sorted(self.fases, key=lambda fase: (fase.desde_ms, fase.nivel)):
+            lineas.append(f"  {'  ' * fase.nivel}{fase.nombre}: {fase.ms:.1f} ms "
+                          f"(desde {fase.desde_ms:.1f} ms)")
+
+        if self.importaciones:
+            lineas.append("Importaciones, por paquete (tiempo propio):")
+            lineas.extend(f"  {paquete}: {ms:.1f} ms"
+                          for paquete, ms in self.importaciones_por_paquete().items())
+
+            lineas.append("Módulos más lentos (propio | acumulado):")
+            lentos = sorted(self.importaciones, key=lambda imp: imp.propio_ms, reverse=True)
+            lineas.extend(f"  {imp.propio_ms:8.1f} | {imp.acumulado_ms:8.1f} | {imp.modulo}"
+                          for imp in lentos[:max_importaciones])
+
+        return lineas
+
+
+    def registrar(self, logger: "LoggerJuego") -> None:
+        """
+        Escribe el reporte en el registro del juego.
+        -
+        'logger': El registrador del juego.
+        """
+
+        logger.info("\n".join(self.reporte()))
+
+
+    def como_dic(self) -> dict[str, Any]:
+        "Devuelve el perfil entero como un diccionario, listo para pasar a JSON."
+
+        return {"total_ms": self.total_ms,
+                "fases": [fase._asdict() for fase in self.fases],
+                "importaciones_por_paquete": self.importaciones_por_paquete(),
+                "importaciones": [imp._asdict() for imp in self.importaciones]}
+
+
+    def guardar_json(self, ruta: "PathLike") -> None:
+        """
+        Guarda el perfil en formato JSON.
+        -
+        'ruta': La ruta del archivo a escribir.
+        """
+
+        ruta = Path(ruta)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        with ruta.open(mode="w", encoding="utf-8") as archivo:
+            dump(self.como_dic(), archivo, indent=4, ensure_ascii=False)
+
+
+PERFIL_INICIO: PerfilInicio = PerfilInicio()
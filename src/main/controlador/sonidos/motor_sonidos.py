@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Optional, TypeAlias, Union
 from pygame.mixer import Channel, Sound, get_num_channels, music
 from pygame_menu.sound import Sound as MenuSound
 
-from ..archivos import RutaJSON
+from ..archivos import RECURSOS, RutaJSON
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -73,7 +73,7 @@ class MotorSFX:
     def _cargar_sonidos(self, **rutas: SoundPathDict) -> None:
         """
         Carga los sonidos al diccionario, tal que queden en memoria como objetos
-        'Sound()'.
+        'Sound()'. Si ya se habían precargado, se usan esos.
         -
         '**rutas': Una colección de rutas donde cada una debería apuntar a una dirección
                    válida para inicializar un archivo de sonido. (se prefiere .WAV)
@@ -81,7 +81,7 @@ class MotorSFX:
 
         for nombre, ruta in rutas.items():
             try:
-                self.sonidos[nombre] = Sound(ruta)
+                self.sonidos[nombre] = RECURSOS.sonido(ruta)
             except FileNotFoundError:
                 self.logger.error(f"Archivo '{ruta}' no encontrado. Ignorando...")
 
@@ -9,42 +9,129 @@ from os import environ
 environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 # -------------------------------------------------------------------------------
 
+# ----- Esto va antes que el resto para poder medir cuánto tardan en importarse -----
+from .controlador.logger.perfil_inicio import PERFIL_INICIO, VAR_PERFIL_JSON
+
+if __name__ == "__main__": # Sólo al correr el juego, no al importar este módulo
+    PERFIL_INICIO.medir_importaciones()
+# -----------------------------------------------------------------------------------
+
 from traceback import format_exc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
-from pygame import QUIT
+from pygame import QUIT, RESIZABLE, VIDEORESIZE
 from pygame import init as pygame_init
-from pygame.display import flip, set_icon, set_mode
+from pygame.display import flip, get_surface, set_icon, set_mode
 from pygame.event import get as event_get
 from pygame.image import load as img_load
+from pygame.time import Clock
 from pygame.transform import scale
 
+from .controlador.archivos import RECURSOS, RutaJSON, cargar_manifiesto
 from .controlador.estado import JuegoHandler
 from .controlador.logger import LoggerJuego
 from .modelo.estado import Juego
+from .vista.carga import PantallaCarga
+from .vista.dibujo import MotorDibujo, MotorTexturas
+from .vista.niveles import VIDEO_CONFIG
 
 if TYPE_CHECKING:
     from os import PathLike
 
+    from pygame import Surface
+
 ANCHO_PANTALLA: int = 1280
 ALTO_PANTALLA: int = 720
 FPS: int = 60
 COLOR_FONDO: str = "#000055"
 ICONO: "PathLike" = "./media/img/icono/icono.png"
+MS_CARGA_POR_FRAME: float = 2.0 # Cuánto tiempo por frame usar para terminar recursos diferidos
+
+
+def abrir_pantalla(logger: LoggerJuego) -> tuple["Surface", Optional[MotorTexturas]]:
+    """
+    Crea la ventana del juego con el motor de dibujo elegido en la configuración de video.
+    Devuelve la superficie donde dibujar y, si se usan texturas, el motor que las maneja.
+    Si se eligieron texturas pero no se pueden usar, se vuelve a las superficies. Con
+    superficies la ventana se puede redimensionar; con texturas, SDL estira el tamaño
+    lógico a la ventana.
+    -
+    'logger': El registrador del juego.
+    """
+
+    video_configs = RutaJSON(VIDEO_CONFIG).cargar()
+
+    if video_configs.get("motor_dibujo") == MotorDibujo.TEXTURAS:
+        try:
+            motor = MotorTexturas.abrir_pantalla((ANCHO_PANTALLA, ALTO_PANTALLA),
+                                                 video_configs.get("render_por_software",
+                                                                   False))
+            return motor.pantalla, motor
+        except RuntimeError as exc: # Los errores de Pygame y de SDL2 heredan de éste
+            logger.warning(f"No se pudo dibujar con texturas, se usan superficies: {exc}")
+
+    return set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), RESIZABLE), None
+
+
+def precargar(pantalla: "Surface",
+              rutas: Iterable["PathLike"],
+              presentar: Callable[[], None]=flip) -> bool:
+    """
+    Carga los recursos dados mostrando una pantalla de carga. Devuelve `False` si se
+    cerró la ventana antes de terminar.
+    -
+    'pantalla': La pantalla del juego.
+
+    'rutas': Las rutas de los recursos a cargar antes de empezar.
+
+    'presentar': Con qué mostrar cada frame en la ventana.
+    """
+
+    pantalla_carga = PantallaCarga(COLOR_FONDO)
+    reloj = Clock()
+    RECURSOS.pedir(rutas)
+
+    while not RECURSOS.listo():
+        if any(evento.type == QUIT for evento in event_get()):
+            return False
+
+        RECURSOS.procesar()
+        pantalla_carga.dibujar(pantalla, RECURSOS.progreso)
+        presentar()
+        reloj.tick(FPS)
+
+    return True
 
 
 def main() -> int:
     "Función principal del programa."
 
+    PERFIL_INICIO.dejar_de_medir_importaciones()
     logger = LoggerJuego(nombre="Cube Jumper", verbose=True)
 
     try:
-        pygame_init()
-        set_icon(scale(img_load(ICONO), (32, 32))) # Por las dudas esto va antes que set_mode()
-        pantalla = set_mode((ANCHO_PANTALLA, ALTO_PANTALLA))
+        with PERFIL_INICIO.fase("pygame_init"):
+            pygame_init()
+
+        with PERFIL_INICIO.fase("set_mode"):
+            set_icon(scale(img_load(ICONO), (32, 32))) # Por las dudas esto va antes que set_mode()
+            pantalla, motor_texturas = abrir_pantalla(logger)
+            presentar = (flip if motor_texturas is None else motor_texturas.presentar)
+
+        with PERFIL_INICIO.fase("precarga de recursos"):
+            RECURSOS.logger = logger
+            manifiesto = cargar_manifiesto()
+            if not precargar(pantalla, manifiesto["inicio"], presentar):
+                RECURSOS.cerrar()
+                return 0
+            RECURSOS.pedir(manifiesto["diferido"]) # Esto sigue cargando mientras se juega
 
-        juego_handler = JuegoHandler(Juego(), logger)
-        juego_handler.set_titulo_juego()
+        with PERFIL_INICIO.fase("JuegoHandler"):
+            juego_handler = JuegoHandler(Juego(), logger, motor_texturas)
+            juego_handler.set_titulo_juego()
+
+        primer_frame = True
+        PERFIL_INICIO.iniciar_fase("primer frame")
 
         while not juego_handler.hay_que_salir():
 
@@ -52,12 +139,25 @@ def main() -> int:
             for evento in eventos:
                 if evento.type == QUIT:
                     juego_handler.salir()
+                elif evento.type == VIDEORESIZE and motor_texturas is None:
+                    pantalla = get_surface() # Al redimensionar puede ser otra superficie
 
             pantalla.fill(COLOR_FONDO)
             juego_handler.actualizar(pantalla, eventos)
-            flip()
+            RECURSOS.procesar(limite_ms=MS_CARGA_POR_FRAME)
+            presentar()
+
+            if primer_frame:
+                PERFIL_INICIO.terminar_fase()
+                logger.info(f"Primer frame dibujado a los {PERFIL_INICIO.total_ms:.0f} ms")
+                PERFIL_INICIO.registrar(logger)
+                if environ.get(VAR_PERFIL_JSON):
+                    PERFIL_INICIO.guardar_json(environ[VAR_PERFIL_JSON])
+                primer_frame = False
 
         juego_handler.guardar_config()
+        juego_handler.cerrar()
+        RECURSOS.cerrar()
 
         return 0
 
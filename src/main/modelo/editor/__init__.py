@@ -3,3 +3,4 @@ Paquete del editor de niveles.
 """
 
 from .editor_niveles import *
+from .validador_niveles import *
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 from ...modelo.niveles import (EXT, RUTA_NIVELES_DEFAULT, InfoCelda,
                                MatrizInfoCeldas, Nivel)
 from ..celdas import TiposCelda
+from .validador_niveles import ValidadorNivel
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -33,6 +34,7 @@ class EditorNiveles:
         """
 
         self.matriz: MatrizInfoCeldas = self.generar_matriz(col_inic, fil_inic)
+        self.validador: ValidadorNivel = ValidadorNivel(self.matriz)
         self.tipos_celdas: list[TiposCelda] = list(TiposCelda)
 
         self._celda_ind: int = 0
@@ -118,10 +120,12 @@ class EditorNiveles:
         'ancho/alto': Las coordenadas de la celda de la matriz.
         """
 
+        anterior = self.matriz[alto][ancho]
         self.matriz[alto][ancho] = InfoCelda(self.celda_sostenida,
                                              self.rot_sostenida,
                                              self.visibilidad_sostenida,
                                              self.id_sostenido)
+        self.validador.registrar_cambio(ancho, alto, anterior, self.matriz[alto][ancho])
         return self.matriz[alto][ancho]
 
 
@@ -133,7 +137,9 @@ class EditorNiveles:
         """
 
         if self.matriz[alto][ancho].tipo != TiposCelda.AIRE:
+            anterior = self.matriz[alto][ancho]
             self.matriz[alto][ancho] = InfoCelda()
+            self.validador.registrar_cambio(ancho, alto, anterior, self.matriz[alto][ancho])
 
         return self.matriz[alto][ancho]
 
@@ -161,13 +167,7 @@ class EditorNiveles:
     def existe_jugador(self) -> bool:
         "Verifica si existe la celda de posición del jugador."
 
-        ancho, alto = self.forma
-        for j in range(alto):
-            for i in range(ancho):
-                if self.matriz[j][i].tipo == TiposCelda.POS_JUGADOR:
-                    return True
-
-        return False
+        return self.validador.cant_jugadores > 0
 
 
     def aumentar_id(self) -> int:
@@ -226,9 +226,10 @@ class EditorNiveles:
                 fila.extend([InfoCelda() for _ in range(cuanto)])
 
         elif cuanto < 0:
-            for fila in self.matriz:
+            for j, fila in enumerate(self.matriz):
                 for _ in range(abs(cuanto)):
-                    fila.pop()
+                    self.validador.quitar(len(fila) - 1, j, fila.pop())
+            self.validador.pedir_alcance()
 
 
     def set_alto(self, alto: int) -> None:
@@ -270,7 +271,10 @@ class EditorNiveles:
 
         elif cuanto < 0:
             for _ in range(abs(cuanto)):
-                self.matriz.pop()
+                fil = len(self.matriz) - 1
+                for i, info in enumerate(self.matriz.pop()):
+                    self.validador.quitar(i, fil, info)
+            self.validador.pedir_alcance()
 
 
     def importar(self, titulo: str) -> "InfoNivel":
@@ -283,10 +287,22 @@ class EditorNiveles:
         ruta_nivel = Path(RUTA_NIVELES_DEFAULT) / f"{'_'.join(titulo.lower().split())}{EXT}"
         datos_nivel = Nivel.cargar_desde_ruta(ruta_nivel, ignorar_pos_jugador=True)
         self.matriz = datos_nivel["matriz"]
+        self.validador.reconstruir(self.matriz)
 
         return datos_nivel
 
 
+    def generar_nivel(self, titulo: str) -> Nivel:
+        """
+        Genera un nivel jugable a partir de la matriz actual, sin escribir ni leer
+        ningún archivo.
+        -
+        'titulo': El título del nivel.
+        """
+
+        return Nivel.desde_matriz(self.matriz, titulo)
+
+
     def exportar(self, titulo: str) -> "PathLike":
         """
         Exporta el nivel a un archivo con nombre.
@@ -295,6 +311,6 @@ class EditorNiveles:
         """
 
         ruta = Path(RUTA_NIVELES_DEFAULT) / f"{'_'.join(titulo.lower().split())}{EXT}"
-        Nivel.exportar_nivel(self.matriz, ruta.as_posix())
+        Nivel.exportar_nivel(self.matriz, ruta.as_posix(), titulo)
 
         return ruta.as_posix()
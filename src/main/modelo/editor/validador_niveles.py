@@ -0,0 +1,355 @@
+"""
+Módulo para el validador incremental de niveles del editor.
+"""
+
+from collections import deque
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Optional, TypeAlias
+
+from ..celdas import TiposCelda
+from ..utils import Temporizador
+
+if TYPE_CHECKING:
+    from ..niveles import InfoCelda, MatrizInfoCeldas
+
+Coords: TypeAlias = tuple[int, int]
+CeldasPorId: TypeAlias = dict[int, set[Coords]]
+FotoMatriz: TypeAlias = tuple[tuple["InfoCelda", ...], ...]
+
+# Celdas que el jugador nunca puede atravesar
+TIPOS_SOLIDOS: tuple[TiposCelda, ...] = (TiposCelda.PLATAFORMA, TiposCelda.PINCHO)
+# Celdas que el jugador debería poder alcanzar desde su posición inicial
+TIPOS_OBJETIVO: tuple[TiposCelda, ...] = (TiposCelda.LLAVE, TiposCelda.TROFEO, TiposCelda.SALIDA)
+ESPERA_ALCANCE: int = 400 # En milisegundos
+
+
+def celdas_inalcanzables(matriz: "FotoMatriz") -> frozenset[Coords]:
+    """
+    Recorre la matriz desde la posición del jugador y devuelve las coordenadas de las
+    llaves, trofeos y salidas a las que no se puede llegar.
+    Es una aproximación por conectividad: no tiene en cuenta la física del salto, pero
+    sí que una puerta sólo se atraviesa tras haber alcanzado alguna llave de su mismo ID.
+    -
+    'matriz': La matriz con la información de celdas. No se modifica.
+    """
+
+    inicio = None
+    objetivos = set()
+    for j, fila in enumerate(matriz):
+        for i, info in enumerate(fila):
+            if info.tipo == TiposCelda.POS_JUGADOR and inicio is None:
+                inicio = (i, j)
+            elif info.tipo in TIPOS_OBJETIVO:
+                objetivos.add((i, j))
+
+    if inicio is None:
+        return frozenset()
+
+    alto = len(matriz)
+    visitadas = {inicio}
+    ids_obtenidos = set()
+    puertas_bloqueadas: CeldasPorId = {}
+    cola = deque((inicio,))
+
+    while cola:
+        col, fil = cola.popleft()
+        info = matriz[fil][col]
+        if info.tipo == TiposCelda.LLAVE and info.id not in ids_obtenidos:
+            ids_obtenidos.add(info.id)
+            for puerta in puertas_bloqueadas.pop(info.id, ()):
+                visitadas.add(puerta)
+                cola.append(puerta)
+
+        for i, j in ((col + 1, fil), (col - 1, fil), (col, fil + 1), (col, fil - 1)):
+            if not (0 <= j < alto and 0 <= i < len(matriz[j])) or (i, j) in visitadas:
+                continue
+
+            vecina = matriz[j][i]
+            if vecina.tipo in TIPOS_SOLIDOS:
+                continue
+
+            if vecina.tipo == TiposCelda.PUERTA and vecina.id not in ids_obtenidos:
+                puertas_bloqueadas.setdefault(vecina.id, set()).add((i, j))
+                continue
+
+            visitadas.add((i, j))
+            cola.append((i, j))
+
+    return frozenset(objetivos - visitadas)
+
+
+class ValidadorNivel:
+    """
+    Clase que valida un nivel a medida que se edita.
+    Los conteos se actualizan por diferencias con cada celda cambiada, sin recorrer la
+    grilla entera; el chequeo de alcance se corre aparte, en un hilo y con demora.
+    """
+
+    def __init__(self, matriz: Optional["MatrizInfoCeldas"]=None) -> None:
+        """
+        Inicializa el validador.
+        -
+        'matriz': Una matriz inicial de la que partir. Si no se especifica, se asume vacía.
+        """
+
+        self.pos_jugador: set[Coords] = set()
+        self.salidas: set[Coords] = set()
+        self.puertas: CeldasPorId = {}
+        self.llaves: CeldasPorId = {}
+
+        # -- Chequeo de alcance --
+        self.inalcanzables: frozenset[Coords] = frozenset()
+        self.espera_alcance: Temporizador = Temporizador(ESPERA_ALCANCE)
+        self._alcance_pendiente: bool = False
+        self._generacion: int = 0
+        self._hilo: Optional[Thread] = None
+        self._candado: Lock = Lock()
+        # ------------------------
+
+        if matriz is not None:
+            self.reconstruir(matriz)
+
+
+    @property
+    def cant_jugadores(self) -> int:
+        "Devuelve la cantidad de celdas de posición del jugador."
+
+        return len(self.pos_jugador)
+
+
+    @property
+    def cant_salidas(self) -> int:
+        "Devuelve la cantidad de celdas de salida."
+
+        return len(self.salidas)
+
+
+    @property
+    def ids_puertas_sin_llave(self) -> set[int]:
+        "Devuelve los IDs que tienen puertas pero ninguna llave que las abra."
+
+        return {c_id for c_id in self.puertas if c_id not in self.llaves}
+
+
+    @property
+    def ids_llaves_sin_puerta(self) -> set[int]:
+        "Devuelve los IDs que tienen llaves pero ninguna puerta que abrir."
+
+        return {c_id for c_id in self.llaves if c_id not in self.puertas}
+
+
+    def _registro_de(self, tipo: TiposCelda) -> Optional[set[Coords]]:
+        """
+        Devuelve el conjunto de coordenadas que lleva la cuenta de los tipos de celda
+        sin ID, si es que este tipo se registra.
+        -
+        'tipo': El tipo de celda.
+        """
+
+        if tipo == TiposCelda.POS_JUGADOR:
+            return self.pos_jugador
+
+        if tipo == TiposCelda.SALIDA:
+            return self.salidas
+
+        return None
+
+
+    def _registro_por_id(self, tipo: TiposCelda) -> Optional[CeldasPorId]:
+        """
+        Devuelve el diccionario de coordenadas por ID para el tipo dado, si es que
+        este tipo se registra.
+        -
+        'tipo': El tipo de celda.
+        """
+
+        if tipo == TiposCelda.PUERTA:
+            return self.puertas
+
+        if tipo == TiposCelda.LLAVE:
+            return self.llaves
+
+        return None
+
+
+    def agregar(self, col: int, fil: int, info: "InfoCelda") -> None:
+        """
+        Registra una celda nueva en la grilla.
+        -
+        'col/fil': Las coordenadas de la celda.
+
+        'info': La información de la celda agregada.
+        """
+
+        registro = self._registro_de(info.tipo)
+        if registro is not None:
+            registro.add((col, fil))
+
+        registro_id = self._registro_por_id(info.tipo)
+        if registro_id is not None:
+            registro_id.setdefault(info.id, set()).add((col, fil))
+
+
+    def quitar(self, col: int, fil: int, info: "InfoCelda") -> None:
+        """
+        Olvida una celda que deja de estar en la grilla.
+        -
+        'col/fil': Las coordenadas de la celda.
+
+        'info': La información que tenía la celda quitada.
+        """
+
+        registro = self._registro_de(info.tipo)
+        if registro is not None:
+            registro.discard((col, fil))
+
+        registro_id = self._registro_por_id(info.tipo)
+        if registro_id is not None and info.id in registro_id:
+            registro_id[info.id].discard((col, fil))
+            if not registro_id[info.id]:
+                registro_id.pop(info.id)
+
+
+    def registrar_cambio(self,
+                         col: int,
+                         fil: int,
+                         anterior: "InfoCelda",
+                         nueva: "InfoCelda") -> None:
+        """
+        Actualiza la validación a partir de un único cambio en la grilla.
+        -
+        'col/fil': Las coordenadas de la celda cambiada.
+
+        'anterior': La información que tenía la celda antes del cambio.
+
+        'nueva': La información que tiene la celda ahora.
+        """
+
+        if anterior == nueva:
+            return
+
+        self.quitar(col, fil, anterior)
+        self.agregar(col, fil, nueva)
+        self.pedir_alcance()
+
+
+    def reconstruir(self, matriz: "MatrizInfoCeldas") -> None:
+        """
+        Descarta todo lo registrado y vuelve a recorrer la matriz entera.
+        Sólo debería hacer falta al importar un nivel o reemplazar la matriz.
+        -
+        'matriz': La matriz con la información de celdas.
+        """
+
+        self.pos_jugador.clear()
+        self.salidas.clear()
+        self.puertas.clear()
+        self.llaves.clear()
+
+        for j, fila in enumerate(matriz):
+            for i, info in enumerate(fila):
+                self.agregar(i, j, info)
+
+        self.pedir_alcance()
+
+
+    def celdas_problematicas(self) -> set[Coords]:
+        "Devuelve las coordenadas de todas las celdas que conviene resaltar al usuario."
+
+        celdas = set(self.inalcanzables)
+        for c_id in self.ids_puertas_sin_llave:
+            celdas.update(self.puertas[c_id])
+        for c_id in self.ids_llaves_sin_puerta:
+            celdas.update(self.llaves[c_id])
+        if self.cant_jugadores > 1:
+            celdas.update(self.pos_jugador)
+
+        return celdas
+
+
+    def problemas(self) -> list[str]:
+        "Devuelve una descripción legible de cada problema que tiene el nivel actualmente."
+
+        problemas = []
+
+        if self.cant_jugadores == 0:
+            problemas.append("Falta la posición del jugador")
+        elif self.cant_jugadores > 1:
+            problemas.append(f"Hay {self.cant_jugadores} posiciones de jugador")
+
+        if self.cant_salidas == 0:
+            problemas.append("Falta una salida")
+
+        sin_llave = self.ids_puertas_sin_llave
+        if sin_llave:
+            problemas.append(f"Puertas sin llave: {', '.join(map(str, sorted(sin_llave)))}")
+
+        sin_puerta = self.ids_llaves_sin_puerta
+        if sin_puerta:
+            problemas.append(f"Llaves sin puerta: {', '.join(map(str, sorted(sin_puerta)))}")
+
+        if self.inalcanzables:
+            problemas.append(f"{len(self.inalcanzables)} objetivo(s) inalcanzable(s)")
+
+        return problemas
+
+
+    def es_jugable(self) -> bool:
+        "Verifica si el nivel tiene exactamente una posición del jugador."
+
+        return self.cant_jugadores == 1
+
+
+    def pedir_alcance(self) -> None:
+        "Marca que el chequeo de alcance debe volver a correrse cuando pase la espera."
+
+        self._alcance_pendiente = True
+        self.espera_alcance.reiniciar()
+
+
+    def alcance_calculando(self) -> bool:
+        "Verifica si hay un chequeo de alcance corriendo en este momento."
+
+        return self._hilo is not None and self._hilo.is_alive()
+
+
+    def _calcular_alcance(self, foto: FotoMatriz, generacion: int) -> None:
+        """
+        Calcula el alcance sobre una copia de la matriz. Si mientras tanto se pidió otro
+        chequeo, el resultado se descarta.
+        -
+        'foto': Una copia inmutable de la matriz.
+
+        'generacion': El número de pedido al que responde este cálculo.
+        """
+
+        resultado = celdas_inalcanzables(foto)
+        with self._candado:
+            if generacion == self._generacion:
+                self.inalcanzables = resultado
+
+
+    def actualizar(self, matriz: "MatrizInfoCeldas", cuanto: float=1.0) -> None:
+        """
+        Descuenta la espera del chequeo de alcance, y lo lanza en segundo plano si ya
+        no quedan cambios recientes.
+        -
+        'matriz': La matriz con la información de celdas.
+
+        'cuanto': Cuánto descontar de la espera, en milisegundos.
+        """
+
+        self.espera_alcance.actualizar(cuanto)
+        if (not self._alcance_pendiente
+            or self.espera_alcance.esta_contando()
+            or self.alcance_calculando()):
+            return
+
+        self._alcance_pendiente = False
+        with self._candado:
+            self._generacion += 1
+            generacion = self._generacion
+
+        foto = tuple(tuple(fila) for fila in matriz)
+        self._hilo = Thread(target=self._calcular_alcance, args=(foto, generacion), daemon=True)
+        self._hilo.start()
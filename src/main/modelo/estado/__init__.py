@@ -3,3 +3,4 @@ Paquete para el estado del juego.
 """
 
 from .estado_juego import *
+from .simulacion_juego import *
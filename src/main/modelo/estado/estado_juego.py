@@ -2,17 +2,18 @@
 Módulo para el estado del juego.
 """
 
-from typing import TYPE_CHECKING, Optional, TypeAlias
+from typing import TYPE_CHECKING, Optional, TypeAlias, Union
 
 from pygame.constants import K_ESCAPE, KEYDOWN
-from pygame.display import get_surface
 from pygame.event import Event
 from pygame.event import post as ev_post
 
 from ...controlador.eventos import EventosJuego
 from ..eventos import EventosSonidos
 from ..jugador import Jugador
-from ..niveles import Nivel
+from ..niveles import (Nivel, PlantillasNiveles, PrecargadorNiveles,
+                       abrir_pack, es_pack)
+from ..utils import METRICAS_PANTALLA
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -65,6 +66,8 @@ class Juego:
         self.rutas_niveles_default: RutasNiveles = niveles
         self._ind_nivel: int = 0
         self.nivel_actual: Optional[Nivel] = None
+        self.precargador: PrecargadorNiveles = PrecargadorNiveles()
+        self.plantillas: PlantillasNiveles = PlantillasNiveles()
         # ----------------------------
 
         # --- Atributos de control ---
@@ -102,11 +105,33 @@ class Juego:
         else:
             self._ind_nivel += 1
 
-        self.cargar_nivel(ruta_nivel=self.rutas_niveles[self._ind_nivel],
-                          ruta_sig=(self.rutas_niveles[self._ind_nivel + 1]
-                                    if self._ind_nivel < (len(self.rutas_niveles) - 1) else None),
+        ruta_nivel = self.rutas_niveles[self._ind_nivel]
+        ruta_sig = self._ruta_en(self._ind_nivel + 1)
+        nivel = self.precargador.tomar(ruta_nivel, ruta_sig)
+        if nivel is not None:
+            self.plantillas.guardar(ruta_nivel, nivel)
+        else:
+            nivel = self.plantillas.obtener(ruta_nivel, ruta_sig)
+
+        self.cargar_nivel(ruta_nivel=ruta_nivel,
+                          nivel=nivel,
+                          ruta_sig=ruta_sig,
                           preservar_vidas=preservar_vidas)
 
+        # Mientras se juega éste, se va cargando el siguiente (si no se tiene ya)
+        if ruta_sig is not None and not self.plantillas.tiene(ruta_sig):
+            self.precargador.pedir(ruta_sig, self._ruta_en(self._ind_nivel + 2))
+
+
+    def _ruta_en(self, indice: int) -> Optional["PathLike"]:
+        """
+        Devuelve la ruta del nivel en la posición dada de la lista, o `None` si no hay.
+        -
+        'indice': La posición del nivel en la lista.
+        """
+
+        return self.rutas_niveles[indice] if indice < len(self.rutas_niveles) else None
+
 
     def cargar_nivel(self,
                      *,
@@ -156,14 +181,53 @@ class Juego:
                                poder_de_dash=incr_x * 0.45)
 
 
-    def reiniciar_niveles(self, nuevas_rutas: Optional[RutasNiveles]=None) -> None:
+    def reacomodar(self, tam_anterior: tuple[int, int]) -> None:
+        """
+        Adapta lo cargado al tamaño actual de la pantalla, después de redimensionarla: se
+        descarta el nivel precargado, y el nivel en juego y el jugador se reubican sin
+        perder su estado (y la plantilla del nivel pasa a ser la del tamaño nuevo). La gravedad y las fricciones no cambian.
+        -
+        'tam_anterior': El tamaño que tenía la pantalla antes.
+        """
+
+        self.precargador.descartar()
+        if self.nivel_actual is None:
+            return
+
+        self.nivel_actual.reubicar_celdas()
+        self.plantillas.reubicar(self.nivel_actual)
+        if self.jugador is not None:
+            ancho, alto = METRICAS_PANTALLA.tam
+            self.jugador.escalar(ancho / tam_anterior[0], alto / tam_anterior[1])
+
+
+    def probar_nivel(self, nivel: Nivel) -> None:
+        """
+        Entra a un nivel suelto ya cargado en memoria, como los que se prueban desde el
+        editor, sin tocar la lista de niveles.
+        -
+        'nivel': El nivel a jugar.
+        """
+
+        self.en_juego = True
+        self.cargar_nivel(ruta_nivel=None, nivel=nivel, preservar_vidas=False)
+
+
+    def reiniciar_niveles(self,
+                          nuevas_rutas: Optional[Union[RutasNiveles, "PathLike"]]=None) -> None:
         """
         Reinicia el puntero de niveles de vuelta al primero.
         -
         'nuevas_rutas': En caso de querer el pack de niveles por otro, se especifica en
-                        este parámetro.
+                        este parámetro. Puede ser también la ruta de un archivo '.nivelpack',
+                        en cuyo caso se juegan sus niveles en orden.
         """
 
+        if nuevas_rutas is not None and not isinstance(nuevas_rutas, tuple):
+            if not es_pack(nuevas_rutas):
+                raise ValueError(f"'{nuevas_rutas}' no es un pack de niveles.")
+            nuevas_rutas = abrir_pack(nuevas_rutas).rutas()
+
         if nuevas_rutas is not None and nuevas_rutas == ():
             raise ValueError("Las rutas de niveles deben tener al menos un valor.")
 
@@ -171,6 +235,7 @@ class Juego:
                               if nuevas_rutas is None else nuevas_rutas)
         self.nivel_actual = None
         self._ind_nivel = 0
+        self.precargador.descartar()
 
 
     def salir(self) -> None:
@@ -227,7 +292,6 @@ class Juego:
         'eventos': La lista de eventos de Pygame a procesar.
         """
 
-        _, alto = get_surface().get_size()
         self.jugador.actualizar(eventos)
 
         for ev in eventos:
@@ -239,7 +303,27 @@ class Juego:
                 self.jugador.procesar_mov(self.grav, self.fric_plat,
                                           self.fric_aire, self.nivel_actual)
 
+        self._revisar_caida()
+
+
+    def avanzar(self, milisegundos: float) -> None:
+        """
+        Avanza el juego un paso fijo de tiempo, sin depender de los eventos de Pygame.
+        Es lo que hace `actualizar()` con un evento de mover al jugador, para usarlo
+        desde el hilo de simulación.
+        -
+        'milisegundos': Cuánto tiempo dura el paso.
+        """
+
+        self.jugador.contar_timers(milisegundos)
+        self.jugador.procesar_mov(self.grav, self.fric_plat, self.fric_aire, self.nivel_actual)
+        self._revisar_caida()
+
+
+    def _revisar_caida(self) -> None:
+        "Si el jugador se cayó por debajo de la pantalla, lo lastima y lo vuelve al inicio."
 
+        _, alto = METRICAS_PANTALLA.tam
         if self.jugador.hitbox.top - self.jugador.hitbox.height > alto:
             self.jugador.lastimar(2)
             self.reiniciar_pos_jugador()
@@ -0,0 +1,258 @@
+"""
+Módulo para simular el juego en un hilo aparte del que dibuja.
+"""
+
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, TypeAlias
+
+from pygame.constants import KEYDOWN
+
+if TYPE_CHECKING:
+    from pygame.event import Event
+
+    from ..jugador import FotoJugador
+    from ..niveles import Nivel
+    from .estado_juego import Juego
+
+FuncionTeclas: TypeAlias = Callable[[list["Event"], Optional["Nivel"]], None]
+
+MS_POR_PASO: float = 22.0 # Lo mismo que el timer de mover al jugador
+MAX_PASOS_ATRASADOS: int = 5 # Si se atrasa más que esto, se saltea en vez de alcanzarlo
+
+
+class CeldaCambiada(NamedTuple):
+    "Una celda cuya visibilidad cambió desde la foto anterior."
+
+    col: int
+    fil: int
+    visible: bool
+
+
+class FotoJuego(NamedTuple):
+    "Copia inmutable y compacta de lo necesario para dibujar un paso de la simulación."
+
+    paso: int
+    jugador: "FotoJugador"
+    celdas: tuple[CeldaCambiada, ...]
+    perdio: bool
+    gano: bool
+    hay_siguiente: bool
+
+
+def combinar_cambios(anteriores: tuple[CeldaCambiada, ...],
+                     nuevos: tuple[CeldaCambiada, ...]) -> tuple[CeldaCambiada, ...]:
+    """
+    Junta los cambios de celdas de dos fotos seguidas; si una celda cambió en las dos,
+    queda el valor de la más nueva.
+    -
+    'anteriores': Los cambios de la foto más vieja.
+
+    'nuevos': Los cambios de la foto más nueva.
+    """
+
+    if not anteriores:
+        return nuevos
+
+    return tuple({(celda.col, celda.fil): celda for celda in anteriores + nuevos}.values())
+
+
+class DobleBufferFotos:
+    """
+    Dos lugares para fotos del juego: en uno se publica la más nueva mientras que del otro
+    se sigue leyendo la anterior, y al terminar de publicar se intercambian.
+    Si se publica una foto antes de que se haya leído la anterior, sus cambios de celdas
+    se heredan, tal que quien lea nunca se pierda uno aunque se saltee fotos.
+    """
+
+    def __init__(self) -> None:
+        "Inicializa el buffer vacío."
+
+        self._fotos: list[Optional[FotoJuego]] = [None, None]
+        self._frente: int = 0
+        self._leida: bool = True
+        self._candado: Lock = Lock()
+
+
+    def publicar(self, foto: FotoJuego) -> None:
+        """
+        Deja una foto nueva como la más reciente.
+        -
+        'foto': La foto a publicar.
+        """
+
+        with self._candado:
+            anterior = self._fotos[self._frente]
+            if anterior is not None and not self._leida:
+                foto = foto._replace(celdas=combinar_cambios(anterior.celdas, foto.celdas))
+
+            atras = 1 - self._frente
+            self._fotos[atras] = foto
+            self._frente = atras
+            self._leida = False
+
+
+    def tomar(self) -> Optional[FotoJuego]:
+        "Devuelve la foto más reciente, o `None` si todavía no se publicó ninguna."
+
+        with self._candado:
+            self._leida = True
+            return self._fotos[self._frente]
+
+
+class SimulacionJuego:
+    """
+    Clase que avanza el juego en un hilo aparte, a pasos fijos de tiempo, y publica una
+    foto del resultado de cada paso para que el hilo principal la dibuje. Así un frame
+    lento no atrasa la física, y lo que tarda en dibujarse no se suma a lo que tarda en
+    responder a las teclas.
+    Mientras corre, nadie más debería tocar el juego: para cambiar de nivel, reacomodarlo,
+    etc. primero hay que detenerla.
+    """
+
+    def __init__(self,
+                 juego: "Juego",
+                 procesar_teclas: FuncionTeclas,
+                 ms_por_paso: float=MS_POR_PASO) -> None:
+        """
+        Inicializa la simulación y publica una primera foto del juego, sin empezar a
+        avanzarlo todavía.
+        -
+        'juego': El juego a simular, que ya debe estar dentro de un nivel.
+
+        'procesar_teclas': Una función que aplica al jugador las teclas apretadas, y las
+                           que lleguen en los eventos que recibe.
+
+        'ms_por_paso': Cuánto tiempo avanza el juego en cada paso.
+        """
+
+        self.juego: "Juego" = juego
+        self.procesar_teclas: FuncionTeclas = procesar_teclas
+        self.ms_por_paso: float = ms_por_paso
+        self.buffer: DobleBufferFotos = DobleBufferFotos()
+        self.error: Optional[BaseException] = None
+
+        self._entrada: "SimpleQueue[Event]" = SimpleQueue()
+        self._paso: int = 0
+        self._hilo: Optional[Thread] = None
+        self._corriendo: bool = False
+
+        # Se empieza con una foto del juego tal como está, sin contar las celdas como cambios
+        self._visibles: dict[tuple[int, int], bool] = {
+            (col, fil): celda.visible
+            for col, fil, celda in self.juego.nivel_actual.celdas_dinamicas()
+        }
+        self._publicar()
+
+
+    def _cambios_celdas(self) -> tuple[CeldaCambiada, ...]:
+        "Devuelve las celdas cuya visibilidad cambió desde la última vez que se revisó."
+
+        cambios = []
+        for col, fil, celda in self.juego.nivel_actual.celdas_dinamicas():
+            if self._visibles.get((col, fil)) != celda.visible:
+                self._visibles[(col, fil)] = celda.visible
+                cambios.append(CeldaCambiada(col, fil, celda.visible))
+
+        return tuple(cambios)
+
+
+    def _publicar(self) -> None:
+        "Saca una foto del estado actual del juego y la publica."
+
+        gano, hay_siguiente = self.juego.gano()
+        self.buffer.publicar(FotoJuego(paso=self._paso,
+                                       jugador=self.juego.jugador.foto(),
+                                       celdas=self._cambios_celdas(),
+                                       perdio=self.juego.perdio(),
+                                       gano=gano,
+                                       hay_siguiente=hay_siguiente))
+
+
+    def paso(self) -> None:
+        "Avanza el juego un solo paso y publica cómo quedó."
+
+        eventos = []
+        while True:
+            try:
+                eventos.append(self._entrada.get_nowait())
+            except Empty:
+                break
+
+        self.juego.reiniciar_vel_jugador()
+        self.procesar_teclas(eventos, self.juego.nivel_actual)
+        self.juego.avanzar(self.ms_por_paso)
+        self._paso += 1
+        self._publicar()
+
+
+    def _correr(self) -> None:
+        "Avanza el juego a ritmo fijo hasta que se la detenga. Corre en un hilo aparte."
+
+        duracion = self.ms_por_paso / 1000
+        siguiente = perf_counter()
+
+        try:
+            while self._corriendo:
+                ahora = perf_counter()
+                if ahora < siguiente:
+                    sleep(siguiente - ahora)
+                    continue
+
+                self.paso()
+                siguiente += duracion
+                if ahora - siguiente > duracion * MAX_PASOS_ATRASADOS:
+                    siguiente = ahora
+        # El error se vuelve a lanzar en el hilo principal, al tomar la siguiente foto
+        except BaseException as exc: # pylint: disable=broad-exception-caught
+            self.error = exc
+            self._corriendo = False
+
+
+    def iniciar(self) -> None:
+        "Empieza a simular el juego en un hilo aparte."
+
+        if self._corriendo:
+            return
+
+        self._corriendo = True
+        self._hilo = Thread(target=self._correr, name="simulacion", daemon=True)
+        self._hilo.start()
+
+
+    def detener(self) -> None:
+        "Detiene la simulación, esperando a que termine el paso que esté haciendo."
+
+        self._corriendo = False
+        if self._hilo is not None:
+            self._hilo.join()
+            self._hilo = None
+
+
+    def esta_corriendo(self) -> bool:
+        "Verifica si la simulación está avanzando el juego."
+
+        return self._corriendo
+
+
+    def enviar(self, eventos: list["Event"]) -> None:
+        """
+        Le pasa a la simulación los eventos de teclas que le interesan, para procesarlos
+        en el siguiente paso.
+        -
+        'eventos': La lista de eventos de Pygame del frame.
+        """
+
+        for ev in eventos:
+            if ev.type == KEYDOWN:
+                self._entrada.put(ev)
+
+
+    def tomar(self) -> FotoJuego:
+        "Devuelve la foto más reciente del juego. Si la simulación falló, lanza su error."
+
+        if self.error is not None:
+            raise self.error
+
+        return self.buffer.tomar()
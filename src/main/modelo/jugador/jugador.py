@@ -2,14 +2,13 @@
 Módulo para la clase del jugador.
 """
 
-from typing import TYPE_CHECKING, Callable, Optional, TypeAlias
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, TypeAlias
 
 from pygame import Rect
-from pygame.display import get_surface
 from pygame.math import Vector2
 
 from ...controlador.eventos import EventosJuego
-from ..utils import Temporizador
+from ..utils import METRICAS_PANTALLA, Temporizador
 from .estado_jugador import EstadoJugador
 
 if TYPE_CHECKING:
@@ -23,6 +22,21 @@ TuplaColision: TypeAlias = tuple[bool, Optional["Celda"], bool]
 CondColision: TypeAlias = Callable[["Celda"], bool]
 
 
+class FotoJugador(NamedTuple):
+    "Lo necesario para dibujar al jugador en un momento dado, sin tocar al jugador mismo."
+
+    hitbox: tuple[int, int, int, int] # x, y, ancho y alto, en píxeles
+    estado: EstadoJugador
+    hp: int
+    max_hp: int
+    invulnerable: bool
+    salto_cooldown: float # Qué fracción del cooldown falta, entre 0 y 1
+    dash_cooldown: float
+    vel: tuple[float, float]
+    acc: tuple[float, float]
+    mira_derecha: bool
+
+
 class Jugador:
     "Clase del jugador."
 
@@ -181,6 +195,25 @@ class Jugador:
             self.acc = Vector2(0, 0)
 
 
+    def escalar(self, factor_x: float, factor_y: float) -> None:
+        """
+        Cambia la escala del jugador junto con la del nivel, por ejemplo al redimensionar
+        la ventana: la hitbox, la posición inicial, la velocidad y los impulsos de salto y
+        dash, que son relativos al tamaño de las celdas.
+        -
+        'factor_x/factor_y': Por cuánto multiplicar las medidas horizontales y verticales.
+        """
+
+        pos_x, pos_y = self.hitbox.topleft # pylint: disable=unpacking-non-sequence
+        self.hitbox = Rect(pos_x * factor_x, pos_y * factor_y,
+                           self.hitbox.width * factor_x, self.hitbox.height * factor_y)
+        self.pos_inicial = Vector2(self.pos_inicial.x * factor_x,
+                                   self.pos_inicial.y * factor_y)
+        self.vel = Vector2(self.vel.x * factor_x, self.vel.y * factor_y)
+        self.salto *= factor_y
+        self.dash *= factor_x
+
+
     def _colisiona_con_celda(self,
                              nivel: "Nivel",
                              cond_extra: CondColision=lambda celda: True) -> TuplaColision:
@@ -474,12 +507,32 @@ class Jugador:
         return exito
 
 
-    def _actualizar_timers(self) -> None:
-        "Va contando todos los timers que tiene el jugador."
+    def contar_timers(self, cuanto: float=1.0) -> None:
+        """
+        Va contando todos los timers que tiene el jugador.
+        -
+        'cuanto': Cuántos milisegundos descontar.
+        """
+
+        self.invulnerabilidad.actualizar(cuanto)
+        self.salto_cooldown.actualizar(cuanto)
+        self.dash_cooldown.actualizar(cuanto)
+
+
+    def foto(self) -> FotoJugador:
+        "Devuelve una copia inmutable de lo que hace falta para dibujar al jugador."
 
-        self.invulnerabilidad.actualizar(1)
-        self.salto_cooldown.actualizar(1)
-        self.dash_cooldown.actualizar(1)
+        return FotoJugador(hitbox=(self.hitbox.x, self.hitbox.y,
+                                   self.hitbox.width, self.hitbox.height),
+                           estado=self.estado,
+                           hp=self.hp,
+                           max_hp=self.max_hp,
+                           invulnerable=self.es_invulnerable(),
+                           salto_cooldown=self.salto_cooldown.porcentaje(),
+                           dash_cooldown=self.dash_cooldown.porcentaje(),
+                           vel=(self.vel.x, self.vel.y),
+                           acc=(self.acc.x, self.acc.y),
+                           mira_derecha=self.mira_derecha)
 
 
     def actualizar_estado_x(self) -> None:
@@ -524,7 +577,7 @@ class Jugador:
 
         for ev in eventos:
             if ev.type == EventosJuego.CONTAR_TIMERS:
-                self._actualizar_timers()
+                self.contar_timers()
 
 
     def procesar_mov(self,
@@ -542,7 +595,7 @@ class Jugador:
         'nivel': El nivel actual del juego con sus celdas, con las que verificar colisiones.
         """
 
-        ancho, _ = get_surface().get_size()
+        ancho, _ = METRICAS_PANTALLA.tam
 
         # ecuaciones horarias de posición
         self.acc.x += self.vel.x * (-fric_plat
@@ -2,5 +2,10 @@
 Paquete para mapas de niveles.
 """
 
+from .cache_niveles import *
 from .info_celda import *
+from .lector_niveles import *
 from .nivel import *
+from .pack_niveles import *
+from .plantillas_niveles import *
+from .precargador_niveles import *
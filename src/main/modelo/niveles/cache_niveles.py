@@ -0,0 +1,158 @@
+"""
+Módulo para la caché en disco de niveles ya interpretados.
+"""
+
+from hashlib import sha1
+from os import getpid, utime
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, UnpicklingError
+from pickle import dumps as pkl_dumps
+from pickle import loads as pkl_loads
+from threading import Lock, get_ident
+from typing import TYPE_CHECKING, Any, Optional, TypeAlias
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+DatosCache: TypeAlias = dict[str, Any]
+
+RUTA_CACHE_NIVELES: "PathLike" = "./cache/niveles"
+EXT_CACHE: str = ".pkl"
+MAX_BYTES_CACHE: int = 8 * 1024 * 1024 # 8 MiB
+# Cambiar esto si cambia lo que se guarda, para no usar entradas de versiones anteriores
+VERSION_CACHE: int = 3
+
+
+class CacheNiveles:
+    """
+    Caché en disco de las matrices de niveles ya interpretadas, identificadas por el hash
+    del contenido del archivo original. Así, un nivel que no cambió nunca se vuelve a
+    interpretar desde el texto, venga de la ruta que venga.
+    Cuando el directorio supera el tamaño máximo se borran primero las entradas usadas
+    hace más tiempo. Para no recorrer el directorio en cada guardado, se lleva la cuenta
+    de cuánto ocupa y sólo se lo recorre cuando parece pasarse.
+    """
+
+    def __init__(self,
+                 dir_cache: "PathLike"=RUTA_CACHE_NIVELES,
+                 max_bytes: int=MAX_BYTES_CACHE) -> None:
+        """
+        Inicializa la caché. El directorio se crea recién al guardar la primera entrada.
+        -
+        'dir_cache': El directorio donde guardar las entradas.
+
+        'max_bytes': El tamaño máximo que puede ocupar el directorio, en bytes.
+        """
+
+        self.dir_cache: Path = Path(dir_cache)
+        self.max_bytes: int = max_bytes
+        self._total: Optional[int] = None # Lo que ocupa el directorio; `None` si no se midió
+        self._candado: Lock = Lock()
+
+
+    @property
+    def bytes_ocupados(self) -> Optional[int]:
+        "Devuelve cuánto se estima que ocupa el directorio, o `None` si todavía no se midió."
+
+        return self._total
+
+
+    @staticmethod
+    def clave_de(contenido: bytes) -> str:
+        """
+        Devuelve la clave con la que se guarda un nivel en la caché.
+        -
+        'contenido': Los bytes del archivo de nivel.
+        """
+
+        return sha1(VERSION_CACHE.to_bytes(4, "little") + contenido).hexdigest()
+
+
+    def _ruta_de(self, clave: str) -> Path:
+        """
+        Devuelve la ruta del archivo de una entrada.
+        -
+        'clave': La clave de la entrada.
+        """
+
+        return self.dir_cache / f"{clave}{EXT_CACHE}"
+
+
+    def cargar(self, clave: str) -> Optional[DatosCache]:
+        """
+        Devuelve los datos guardados para una clave, o `None` si no hay o están dañados.
+        -
+        'clave': La clave de la entrada.
+        """
+
+        ruta = self._ruta_de(clave)
+        try:
+            datos = pkl_loads(ruta.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, UnpicklingError, AttributeError, ImportError, ValueError):
+            ruta.unlink(missing_ok=True)
+            return None
+
+        # La fecha de modificación hace de 'último uso' para saber qué borrar primero
+        try:
+            utime(ruta)
+        except OSError:
+            pass
+
+        return datos
+
+
+    def guardar(self, clave: str, datos: DatosCache) -> None:
+        """
+        Guarda los datos de un nivel. Si no se puede escribir, simplemente no se guarda.
+        -
+        'clave': La clave de la entrada.
+
+        'datos': Los datos a guardar.
+        """
+
+        ruta = self._ruta_de(clave)
+        contenido = pkl_dumps(datos, protocol=HIGHEST_PROTOCOL)
+        try:
+            tam_anterior = ruta.stat().st_size
+        except OSError:
+            tam_anterior = 0
+
+        try:
+            self.dir_cache.mkdir(parents=True, exist_ok=True)
+            # Se escribe con otro nombre y se renombra, para que nunca se lea a medias. El
+            # nombre lleva el hilo, porque la precarga puede guardar a la vez que el juego
+            ruta_temp = ruta.with_name(f"{ruta.name}.{getpid()}.{get_ident()}.tmp")
+            ruta_temp.write_bytes(contenido)
+            ruta_temp.replace(ruta)
+        except OSError:
+            return
+
+        with self._candado:
+            if self._total is not None:
+                self._total += len(contenido) - tam_anterior
+            hay_que_medir = self._total is None or self._total > self.max_bytes
+
+        if hay_que_medir:
+            self.recortar()
+
+
+    def recortar(self) -> None:
+        "Borra las entradas usadas hace más tiempo hasta que la caché entre en su tamaño."
+
+        try:
+            entradas = [(arch.stat(), arch) for arch in self.dir_cache.glob(f"*{EXT_CACHE}")]
+        except OSError:
+            return
+
+        total = sum(stat.st_size for stat, _ in entradas)
+        for stat, arch in sorted(entradas, key=lambda entrada: entrada[0].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+
+            arch.unlink(missing_ok=True)
+            total -= stat.st_size
+
+        with self._candado:
+            self._total = total
@@ -0,0 +1,440 @@
+"""
+Módulo para el lector de archivos de nivel.
+"""
+
+from math import degrees, isfinite, pi, radians
+from typing import (TYPE_CHECKING, Callable, Iterable, Iterator, NamedTuple,
+                    Optional, TypeAlias)
+
+from ..celdas import TiposCelda
+from .info_celda import InfoCelda
+
+if TYPE_CHECKING:
+    from .info_celda import MatrizInfoCeldas
+
+FilaInfoCeldas: TypeAlias = list[InfoCelda]
+FilaLeida: TypeAlias = tuple[int, FilaInfoCeldas] # (número de fila, celdas)
+FuncionFila: TypeAlias = Callable[[int, FilaInfoCeldas], None]
+FuncionCabecera: TypeAlias = Callable[["CabeceraNivel"], None]
+PosJugador: TypeAlias = tuple[Optional[int], Optional[int]]
+
+COMENTARIO_CHAR: str = "#"
+SEP: str = ","
+CANT_CAMPOS: int = 4
+ROT_MAX: float = 360.0 # En grados
+TIPOS_VALIDOS: frozenset[int] = frozenset(tipo.value for tipo in TiposCelda)
+
+# ----- Formato v2 -----
+MARCA_CABECERA: str = "@nivel"
+VERSION_FORMATO: int = 2
+SEP_REPETICION: str = "*"
+# Valores que se omiten al final de una celda: rotación, visibilidad e ID
+VALORES_DEFAULT: tuple[int, ...] = (0, 1, 0)
+CAMPOS_CABECERA: tuple[str, ...] = ("v", "ancho", "alto", "jugadores",
+                                    "trofeos", "llaves", "puertas")
+NOMBRES_CAMPOS: tuple[str, ...] = ("tipo de celda", "rotación (en cuartos de vuelta)",
+                                   "visibilidad", "ID")
+# ----------------------
+
+
+class CabeceraNivel(NamedTuple):
+    "Los datos de la primera línea de un nivel en formato v2."
+
+    version: int
+    ancho: int
+    alto: int
+    titulo: str
+    jugadores: int = 0
+    trofeos: int = 0
+    llaves: int = 0
+    puertas: int = 0
+
+
+class ErrorFormatoNivel(ValueError):
+    """
+    Cuando un archivo de nivel está mal formado.
+    El mensaje indica el archivo, la línea y la columna (ambas desde 1) del problema.
+    """
+
+    def __init__(self, mensaje: str, ruta: str, linea: int, columna: int) -> None:
+        """
+        Inicializa el error.
+        -
+        'mensaje': La descripción del problema.
+
+        'ruta': El archivo donde ocurrió.
+
+        'linea': El número de línea en el archivo.
+
+        'columna': El número de columna (en caracteres) dentro de la línea.
+        """
+
+        super().__init__(f"{ruta}:{linea}:{columna}: {mensaje}")
+        self.ruta: str = ruta
+        self.linea: int = linea
+        self.columna: int = columna
+
+
+def _tokens(linea: str) -> Iterator[tuple[int, str]]:
+    """
+    Separa una línea en sus celdas, devolviendo también la columna donde empieza cada una.
+    -
+    'linea': La línea, ya sin comentarios.
+    """
+
+    inicio = None
+    for col, char in enumerate(linea):
+        if char.isspace():
+            if inicio is not None:
+                yield inicio + 1, linea[inicio:col]
+                inicio = None
+        elif inicio is None:
+            inicio = col
+
+    if inicio is not None:
+        yield inicio + 1, linea[inicio:]
+
+
+def interpretar_celda(token: str, ruta: str, num_linea: int, columna: int) -> InfoCelda:
+    """
+    Interpreta y valida una celda con formato 'tipo,rotación,visibilidad,id'.
+    -
+    'token': El texto de la celda.
+
+    'ruta': El archivo leído, para los mensajes de error.
+
+    'num_linea/columna': Dónde está la celda en el archivo, para los mensajes de error.
+    """
+
+    campos = token.split(SEP)
+    if len(campos) != CANT_CAMPOS:
+        raise ErrorFormatoNivel(f"la celda '{token}' tiene {len(campos)} campo(s), pero "
+                                f"debería tener {CANT_CAMPOS} (tipo,rotación,visibilidad,id)",
+                                ruta, num_linea, columna)
+
+    tipo_raw, rot_raw, vis_raw, id_raw = campos
+
+    try:
+        tipo = int(tipo_raw)
+    except ValueError:
+        tipo = None
+    if tipo not in TIPOS_VALIDOS:
+        raise ErrorFormatoNivel(f"tipo de celda inválido '{tipo_raw}'",
+                                ruta, num_linea, columna)
+
+    try:
+        rot = float(rot_raw)
+    except ValueError:
+        rot = None
+    if rot is None or not isfinite(rot) or not -ROT_MAX <= rot <= ROT_MAX:
+        raise ErrorFormatoNivel(f"rotación inválida '{rot_raw}' (debe estar entre "
+                                f"{-ROT_MAX} y {ROT_MAX} grados)",
+                                ruta, num_linea, columna + len(tipo_raw) + 1)
+
+    if vis_raw not in ("0", "1"):
+        raise ErrorFormatoNivel(f"visibilidad inválida '{vis_raw}' (debe ser 0 o 1)",
+                                ruta, num_linea, columna + len(tipo_raw) + len(rot_raw) + 2)
+
+    try:
+        c_id = int(id_raw)
+    except ValueError:
+        c_id = -1
+    if c_id < 0:
+        raise ErrorFormatoNivel(f"ID inválido '{id_raw}' (debe ser un entero no negativo)",
+                                ruta, num_linea,
+                                columna + len(tipo_raw) + len(rot_raw) + len(vis_raw) + 3)
+
+    return InfoCelda(TiposCelda(tipo), radians(rot), vis_raw == "1", c_id)
+
+
+def _entero(texto: str) -> Optional[int]:
+    """
+    Convierte un texto a entero, o devuelve `None` si no es uno.
+    -
+    'texto': El texto a convertir.
+    """
+
+    try:
+        return int(texto)
+    except ValueError:
+        return None
+
+
+def interpretar_celda_v2(token: str,
+                         ruta: str,
+                         num_linea: int,
+                         columna: int) -> tuple[int, InfoCelda]:
+    """
+    Interpreta y valida una celda del formato v2, con forma '[N*]tipo[,cuartos[,vis[,id]]]'.
+    Los campos que faltan al final toman sus valores por defecto. Devuelve cuántas veces
+    se repite la celda y la celda misma.
+    -
+    'token': El texto de la celda.
+
+    'ruta': El archivo leído, para los mensajes de error.
+
+    'num_linea/columna': Dónde está la celda en el archivo, para los mensajes de error.
+    """
+
+    repeticiones = 1
+    veces_raw, hay_repeticion, celda_raw = token.partition(SEP_REPETICION)
+    if hay_repeticion:
+        repeticiones = (int(veces_raw) if veces_raw.isdigit() else 0)
+        if repeticiones < 1:
+            raise ErrorFormatoNivel(f"cantidad de repeticiones inválida '{veces_raw}'",
+                                    ruta, num_linea, columna)
+        columna += len(veces_raw) + 1
+    else:
+        celda_raw = veces_raw
+
+    campos = celda_raw.split(SEP)
+    if len(campos) > CANT_CAMPOS:
+        raise ErrorFormatoNivel(f"la celda '{celda_raw}' tiene {len(campos)} campos, pero "
+                                f"debería tener como mucho {CANT_CAMPOS}",
+                                ruta, num_linea, columna)
+
+    valores = [_entero(campo) for campo in campos] + list(VALORES_DEFAULT[len(campos) - 1:])
+    tipo, cuartos, vis, c_id = valores
+    validos = (tipo in TIPOS_VALIDOS,
+               cuartos is not None and 0 <= cuartos <= 3,
+               vis in (0, 1),
+               c_id is not None and c_id >= 0)
+
+    for ind, (campo, valido) in enumerate(zip(campos, validos)):
+        if not valido:
+            raise ErrorFormatoNivel(f"{NOMBRES_CAMPOS[ind]} inválido '{campo}'", ruta, num_linea,
+                                    columna + sum(len(previo) + 1 for previo in campos[:ind]))
+
+    return repeticiones, InfoCelda(TiposCelda(tipo), cuartos * pi / 2, bool(vis), c_id)
+
+
+def _sin_comentario(linea: str) -> str:
+    """
+    Quita el fin de línea y el comentario de una línea. En la cabecera el título va al
+    final y puede tener '#', así que ahí sólo cuenta como comentario si está antes.
+    -
+    'linea': La línea tal como se leyó.
+    """
+
+    linea = linea.rstrip("\r\n")
+    if linea.lstrip().startswith(MARCA_CABECERA):
+        campos, separador, titulo = linea.partition("titulo=")
+        if COMENTARIO_CHAR not in campos:
+            return campos + separador + titulo
+
+    return linea.split(COMENTARIO_CHAR)[0]
+
+
+def interpretar_cabecera(linea: str, ruta: str, num_linea: int) -> CabeceraNivel:
+    """
+    Interpreta la línea de cabecera del formato v2, con forma
+    '@nivel v=2 ancho=N alto=N ... titulo=El título'. El título va siempre al final.
+    -
+    'linea': La línea, ya sin comentarios. Todo lo que sigue a 'titulo=' es el título,
+             aunque tenga '#'.
+
+    'ruta': El archivo leído, para los mensajes de error.
+
+    'num_linea': El número de línea, para los mensajes de error.
+    """
+
+    campos_raw, _, titulo = linea.strip()[len(MARCA_CABECERA):].partition("titulo=")
+    campos = {}
+    for campo in campos_raw.split():
+        nombre, _, valor = campo.partition("=")
+        if nombre not in CAMPOS_CABECERA or not valor.isdigit():
+            raise ErrorFormatoNivel(f"campo de cabecera inválido '{campo}'",
+                                    ruta, num_linea, linea.find(campo) + 1)
+        campos[nombre] = int(valor)
+
+    faltantes = [nombre for nombre in ("v", "ancho", "alto") if nombre not in campos]
+    if faltantes:
+        raise ErrorFormatoNivel(f"a la cabecera le falta: {', '.join(faltantes)}",
+                                ruta, num_linea, 1)
+
+    if campos["v"] != VERSION_FORMATO:
+        raise ErrorFormatoNivel(f"versión de formato desconocida '{campos['v']}'",
+                                ruta, num_linea, 1)
+
+    version = campos.pop("v")
+    return CabeceraNivel(version=version, titulo=titulo.strip(), **campos)
+
+
+def leer_cabecera(lineas: Iterable[str], ruta: str="<nivel>") -> Optional[CabeceraNivel]:
+    """
+    Lee sólo la cabecera de un nivel, sin mirar la grilla. Devuelve `None` si el nivel
+    está en el formato v1, que no tiene cabecera.
+    -
+    'lineas': Las líneas del archivo. Puede ser el archivo abierto mismo.
+
+    'ruta': El nombre del archivo, para los mensajes de error.
+    """
+
+    for num_linea, linea in enumerate(lineas, start=1):
+        linea = _sin_comentario(linea)
+        if not linea.strip():
+            continue
+
+        if linea.lstrip().startswith(MARCA_CABECERA):
+            return interpretar_cabecera(linea, ruta, num_linea)
+
+        return None
+
+    return None
+
+
+def leer_filas(lineas: Iterable[str],
+               ruta: str="<nivel>",
+               al_leer_cabecera: Optional[FuncionCabecera]=None) -> Iterator[FilaLeida]:
+    """
+    Lee un nivel fila por fila a medida que llegan las líneas, validando cada celda y
+    que todas las filas tengan el mismo ancho. Se detiene en el primer error, lanzando
+    un `ErrorFormatoNivel` que dice dónde está.
+    El formato (v1 o v2) se detecta solo, según si la primera línea es una cabecera.
+    -
+    'lineas': Las líneas del archivo. Puede ser el archivo abierto mismo.
+
+    'ruta': El nombre del archivo, para los mensajes de error.
+
+    'al_leer_cabecera': Una función opcional a la que entregarle la cabecera, si hay.
+    """
+
+    cabecera = None
+    primera = True
+    ancho = None
+    fil = 0
+    num_linea = 0
+
+    for num_linea, linea in enumerate(lineas, start=1):
+        linea = _sin_comentario(linea)
+        if not linea.strip():
+            continue
+
+        if primera:
+            primera = False
+            if linea.lstrip().startswith(MARCA_CABECERA):
+                cabecera = interpretar_cabecera(linea, ruta, num_linea)
+                ancho = cabecera.ancho
+                if al_leer_cabecera is not None:
+                    al_leer_cabecera(cabecera)
+                continue
+
+        if cabecera is None:
+            fila = [interpretar_celda(token, ruta, num_linea, columna)
+                    for columna, token in _tokens(linea)]
+        else:
+            fila = []
+            for columna, token in _tokens(linea):
+                repeticiones, info = interpretar_celda_v2(token, ruta, num_linea, columna)
+                fila.extend([info] * repeticiones)
+
+        if ancho is None:
+            ancho = len(fila)
+        elif len(fila) != ancho:
+            raise ErrorFormatoNivel(f"la fila tiene {len(fila)} celda(s), pero "
+                                    f"{'la cabecera indica' if cabecera else 'las anteriores tienen'}"
+                                    f" {ancho}", ruta, num_linea, len(linea.rstrip()) + 1)
+
+        if cabecera is not None and fil >= cabecera.alto:
+            raise ErrorFormatoNivel(f"hay más filas que las {cabecera.alto} que indica la "
+                                    "cabecera", ruta, num_linea, 1)
+
+        yield fil, fila
+        fil += 1
+
+    if cabecera is not None and fil != cabecera.alto:
+        raise ErrorFormatoNivel(f"hay {fil} fila(s), pero la cabecera indica {cabecera.alto}",
+                                ruta, num_linea + 1, 1)
+
+
+def leer_nivel(lineas: Iterable[str],
+               ruta: str="<nivel>",
+               al_leer_fila: Optional[FuncionFila]=None) -> tuple[Optional["MatrizInfoCeldas"],
+                                                               PosJugador,
+                                                               Optional[CabeceraNivel]]:
+    """
+    Lee un nivel entero, devolviendo su matriz, la posición del jugador (que puede no
+    estar) y la cabecera (si el nivel está en formato v2). Si se pasa una función por
+    fila, se le entrega cada fila en lugar de armar la matriz, y en ese caso la matriz
+    devuelta es `None`.
+    -
+    'lineas': Las líneas del archivo. Puede ser el archivo abierto mismo.
+
+    'ruta': El nombre del archivo, para los mensajes de error.
+
+    'al_leer_fila': Una función opcional que recibe el número de fila y sus celdas.
+    """
+
+    matriz = (None if al_leer_fila is not None else [])
+    cabeceras = []
+    jug_x, jug_y = None, None
+
+    for fil, fila in leer_filas(lineas, ruta, al_leer_cabecera=cabeceras.append):
+        if jug_x is None:
+            for col, info in enumerate(fila):
+                if info.tipo == TiposCelda.POS_JUGADOR:
+                    jug_x, jug_y = col, fil
+                    break
+
+        if al_leer_fila is not None:
+            al_leer_fila(fil, fila)
+        else:
+            matriz.append(fila)
+
+    return matriz, (jug_x, jug_y), (cabeceras[0] if cabeceras else None)
+
+
+def _celda_v2(info: InfoCelda) -> str:
+    """
+    Escribe una celda en el formato v2, omitiendo los campos finales que tienen su
+    valor por defecto.
+    -
+    'info': La celda a escribir.
+    """
+
+    campos = [info.tipo.value, round(degrees(info.rot) / 90) % 4, int(info.visible), info.id]
+    while len(campos) > 1 and campos[-1] == VALORES_DEFAULT[len(campos) - 2]:
+        campos.pop()
+
+    return SEP.join(map(str, campos))
+
+
+def escribir_nivel(matriz: "MatrizInfoCeldas", titulo: str) -> Iterator[str]:
+    """
+    Genera las líneas de un nivel en formato v2: una cabecera y luego cada fila, con las
+    celdas iguales seguidas escritas una sola vez como 'N*celda'.
+    -
+    'matriz': La matriz llena de la información de celdas.
+
+    'titulo': El título del nivel.
+    """
+
+    conteos = {tipo: 0 for tipo in TiposCelda}
+    for fila in matriz:
+        for info in fila:
+            conteos[info.tipo] += 1
+
+    yield (f"{MARCA_CABECERA} v={VERSION_FORMATO} ancho={len(matriz[0]) if matriz else 0} "
+           f"alto={len(matriz)} jugadores={conteos[TiposCelda.POS_JUGADOR]} "
+           f"trofeos={conteos[TiposCelda.TROFEO]} llaves={conteos[TiposCelda.LLAVE]} "
+           f"puertas={conteos[TiposCelda.PUERTA]} titulo={titulo}")
+
+    for fila in matriz:
+        tokens = []
+        anterior, repeticiones = None, 0
+        for info in fila:
+            celda = _celda_v2(info)
+            if celda == anterior:
+                repeticiones += 1
+                continue
+
+            if anterior is not None:
+                tokens.append(anterior if repeticiones == 1
+                              else f"{repeticiones}{SEP_REPETICION}{anterior}")
+            anterior, repeticiones = celda, 1
+
+        if anterior is not None:
+            tokens.append(anterior if repeticiones == 1
+                          else f"{repeticiones}{SEP_REPETICION}{anterior}")
+
+        yield " ".join(tokens)
@@ -2,17 +2,19 @@
 Módulo para un nivel del juego.
 """
 
-from math import degrees, radians
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, TypeAlias
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TypeAlias
 
 from pygame import Rect
-from pygame.display import get_surface
 from pygame.math import Vector2
 
 from ..celdas import (Llave, PlataformaPincho, PlataformaSimple, Puerta,
                       Salida, TiposCelda, Trofeo)
-from .info_celda import InfoCelda, MatrizInfoCeldas
+from ..utils import METRICAS_PANTALLA
+from .cache_niveles import CacheNiveles
+from .info_celda import MatrizInfoCeldas
+from .lector_niveles import escribir_nivel, leer_nivel
+from .pack_niveles import dividir_ruta_pack, leer_bytes_nivel
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -21,11 +23,11 @@ if TYPE_CHECKING:
 
 InfoNivel: TypeAlias = dict[str, Any]
 MatrizCeldas: TypeAlias = list[list[Optional["Celda"]]]
+EstadoNivel: TypeAlias = tuple[tuple["Celda", tuple[Any, ...]], ...]
 
 EXT: str = ".nivel"
-COMENTARIO_CHAR: str = "#"
-SEP = ","
 RUTA_NIVELES_DEFAULT: "PathLike" = "./niveles"
+CACHE_NIVELES: CacheNiveles = CacheNiveles()
 CLASES_CELDAS: dict[TiposCelda, type["Celda"]] = {
     TiposCelda.PLATAFORMA: PlataformaSimple,
     TiposCelda.PINCHO: PlataformaPincho,
@@ -34,6 +36,12 @@ CLASES_CELDAS: dict[TiposCelda, type["Celda"]] = {
     TiposCelda.TROFEO: Trofeo,
     TiposCelda.SALIDA: Salida
 }
+# Los atributos de cada tipo de celda que pueden cambiar mientras se juega
+ATRIBUTOS_DINAMICOS: dict[TiposCelda, tuple[str, ...]] = {
+    TiposCelda.LLAVE: ("visible", "recolectada"),
+    TiposCelda.PUERTA: ("visible", "esta_cerrada"),
+    TiposCelda.TROFEO: ("visible", "recolectado")
+}
 
 
 class ExtensionIncorrecta(Exception):
@@ -47,7 +55,11 @@ class JugadorNoEncontrado(Exception):
 class Nivel:
     "Clase de un nivel del juego."
 
-    def __init__(self, ruta_nivel: "PathLike", sig_nivel: Optional["PathLike"]=None) -> None:
+    def __init__(self,
+                 ruta_nivel: Optional["PathLike"]=None,
+                 sig_nivel: Optional["PathLike"]=None,
+                 *,
+                 datos_nivel: Optional[InfoNivel]=None) -> None:
         """
         Inicializa un nivel.
         -
@@ -55,9 +67,17 @@ class Nivel:
                       para cargar el nivel.
 
         'sig_nivel': Una mención a la ruta del siguiente nivel, en caso de querer guardarlo.
+
+        'datos_nivel': Los datos del nivel ya cargados en memoria. Si se especifican, no se
+                       lee nada de 'ruta_nivel'.
         """
 
-        datos_nivel = self.cargar_desde_ruta(ruta_nivel)
+        if ruta_nivel is None and datos_nivel is None:
+            raise ValueError("Se debe especificar o una ruta de nivel o los datos del nivel.")
+
+        if datos_nivel is None:
+            datos_nivel = self.cargar_desde_ruta(ruta_nivel)
+
         self.titulo: str = datos_nivel["titulo"]
         matriz_info: MatrizInfoCeldas = datos_nivel["matriz"]
         self.pos_inicial: Vector2 = Vector2(datos_nivel["pos_jugador"]) # En col/fil, NO pixeles
@@ -67,6 +87,7 @@ class Nivel:
 
         self.victoria: bool = False
         self.sig: Optional["PathLike"] = sig_nivel
+        self._estado_inicial: EstadoNivel = self._capturar_estado()
 
 
     @property
@@ -94,8 +115,58 @@ class Nivel:
     def incremento_celda(self) -> tuple[float, float]:
         "Devuelve el tamaño individual que cada celda ha de tener en el nivel."
 
-        ancho_pantalla, alto_pantalla = get_surface().get_size()
-        return ancho_pantalla / self.ancho, alto_pantalla / self.alto
+        return METRICAS_PANTALLA.incremento_celda(self.forma)
+
+
+    def _capturar_estado(self) -> EstadoNivel:
+        "Guarda los valores actuales de los atributos que cambian durante el juego."
+
+        estado = []
+        for fila in self.matriz:
+            for celda in fila:
+                if celda is None or celda.tipo not in ATRIBUTOS_DINAMICOS:
+                    continue
+
+                estado.append((celda, tuple(getattr(celda, atributo)
+                                            for atributo in ATRIBUTOS_DINAMICOS[celda.tipo])))
+
+        return tuple(estado)
+
+
+    def reiniciar(self) -> None:
+        """
+        Deja el nivel tal como estaba recién cargado: las llaves y trofeos vuelven a su
+        lugar y las puertas se cierran, sin tener que volver a crear las celdas.
+        """
+
+        for celda, valores in self._estado_inicial:
+            for atributo, valor in zip(ATRIBUTOS_DINAMICOS[celda.tipo], valores):
+                setattr(celda, atributo, valor)
+
+        self.victoria = False
+
+
+    def celdas_dinamicas(self) -> Iterator[tuple[int, int, "Celda"]]:
+        "Recorre las celdas que pueden cambiar mientras se juega, junto con su columna y fila."
+
+        for j, fila in enumerate(self.matriz):
+            for i, celda in enumerate(fila):
+                if celda is not None and celda.tipo in ATRIBUTOS_DINAMICOS:
+                    yield i, j, celda
+
+
+    def reubicar_celdas(self) -> None:
+        """
+        Vuelve a calcular la posición y tamaño en píxeles de cada celda según las medidas
+        actuales de la pantalla, por ejemplo al redimensionar la ventana. El estado de las
+        celdas no cambia.
+        """
+
+        incr_x, incr_y = self.incremento_celda
+        for j, fila in enumerate(self.matriz):
+            for i, celda in enumerate(fila):
+                if celda is not None:
+                    celda.rect = Rect(incr_x * i, incr_y * j, incr_x, incr_y)
 
 
     def coords_matriz(self, px_x: float, px_y: float) -> tuple[int, int]:
@@ -169,72 +240,124 @@ class Nivel:
         return celda is not None and celda.tipo == TiposCelda.SALIDA
 
 
+    @classmethod
+    def desde_matriz(cls,
+                     matriz: MatrizInfoCeldas,
+                     titulo: str,
+                     sig_nivel: Optional["PathLike"]=None) -> "Nivel":
+        """
+        Crea un nivel directamente desde una matriz en memoria, sin pasar por un archivo.
+        -
+        'matriz': La matriz llena de la información de celdas.
+
+        'titulo': El título a mostrar del nivel.
+
+        'sig_nivel': Una mención a la ruta del siguiente nivel, en caso de querer guardarlo.
+        """
+
+        return cls(sig_nivel=sig_nivel, datos_nivel=cls.datos_desde_matriz(matriz, titulo))
+
+
+    @staticmethod
+    def datos_desde_matriz(matriz: MatrizInfoCeldas,
+                           titulo: str,
+                           ignorar_pos_jugador: bool=False) -> InfoNivel:
+        """
+        Arma los datos de un nivel a partir de una matriz ya cargada en memoria.
+        -
+        'matriz': La matriz llena de la información de celdas.
+
+        'titulo': El título del nivel.
+
+        'ignorar_pos_jugador': Si debería ignorarse el hecho de que no haya una celda de jugador.
+        """
+
+        jug_x, jug_y = None, None
+        for j, fila in enumerate(matriz):
+            for i, info in enumerate(fila):
+                if info.tipo == TiposCelda.POS_JUGADOR:
+                    jug_x, jug_y = i, j
+                    break
+
+            if jug_x is not None:
+                break
+
+        if not ignorar_pos_jugador and (jug_x is None or jug_y is None):
+            raise JugadorNoEncontrado("No se pudo encontrar la celda de posición del jugador "
+                                      "en esta matriz.")
+
+        return {
+            "titulo": titulo.upper(),
+            "matriz": matriz,
+            "pos_jugador": (jug_x, jug_y)
+        }
+
+
     @staticmethod
-    def cargar_desde_ruta(ruta_nivel: "PathLike", ignorar_pos_jugador: bool=False) -> InfoNivel:
+    def cargar_desde_ruta(ruta_nivel: "PathLike",
+                          ignorar_pos_jugador: bool=False,
+                          usar_cache: bool=True) -> InfoNivel:
         """
-        Carga una matriz de nivel desde una ruta.
+        Carga una matriz de nivel desde una ruta, que puede ser la de un nivel dentro de
+        un pack. Si el contenido del archivo ya se interpretó antes, la matriz se toma de la caché
+        de niveles en vez de volver a leer el texto.
         -
         'ruta_nivel': El directorio donde se encuentra el archivo de nivel.
 
         'ignorar_pos_jugador': Si debería ignorarse el hecho de que no haya una celda de jugador.
+
+        'usar_cache': Si buscar y guardar el nivel en la caché de niveles.
         """
 
         ruta = Path(ruta_nivel)
 
-        if not ruta.exists():
+        # Los niveles dentro de un pack no existen como archivos sueltos
+        if dividir_ruta_pack(ruta) is None and not ruta.exists():
             raise FileNotFoundError(f"El archivo '{ruta.as_posix()}' no existe.")
 
         if ruta.suffix.lower() != EXT.lower():
             raise ExtensionIncorrecta(f"El archivo '{ruta.as_posix()}' debería tener extensión "
                                       f"'{EXT.lower()}', pero termina en '{ruta.suffix.lower()}'")
 
-        matriz = []
-        j = 0
-        jug_x, jug_y = None, None
-        with ruta.open(mode="r", encoding="utf-8") as archivo:
-            for linea in archivo:
-                i = 0
-                linea = "".join(linea.rstrip("\n").split(COMENTARIO_CHAR)[0])
-                if not linea:
-                    continue
-
-                linea_matriz = []
-                linea_celdas = linea.split()
-                for info_raw in linea_celdas:
-                    tipo, rotacion, visibilidad, c_id = info_raw.split(SEP)
-                    if int(tipo) == TiposCelda.POS_JUGADOR:
-                        jug_x, jug_y = i, j
+        contenido = leer_bytes_nivel(ruta)
+        clave = CacheNiveles.clave_de(contenido)
+        datos = (CACHE_NIVELES.cargar(clave) if usar_cache else None)
 
-                    linea_matriz.append(InfoCelda(TiposCelda(int(tipo)),
-                                                  radians(float(rotacion)),
-                                                  bool(int(visibilidad)),
-                                                  int(c_id)))
-                    i += 1
-
-                matriz.append(linea_matriz)
-                j += 1
+        if datos is None:
+            matriz, pos_jugador, cabecera = leer_nivel(contenido.decode("utf-8").splitlines(),
+                                                       ruta.as_posix())
+            datos = {"matriz": matriz, "pos_jugador": pos_jugador, "cabecera": cabecera}
+            if usar_cache:
+                CACHE_NIVELES.guardar(clave, datos)
 
+        jug_x, jug_y = datos["pos_jugador"]
         if not ignorar_pos_jugador and (jug_x is None or jug_y is None):
             raise JugadorNoEncontrado("No se pudo encontrar la celda de posición del jugador "
                                       "en esta matriz.")
 
+        cabecera = datos["cabecera"]
         return  {
-            "titulo": " ".join(ruta.stem.split("_")).upper(),
-            "matriz": matriz,
+            "titulo": (cabecera.titulo if cabecera is not None and cabecera.titulo
+                       else " ".join(ruta.stem.split("_"))).upper(),
+            "matriz": datos["matriz"],
             "pos_jugador": (jug_x, jug_y)
         }
 
 
     @staticmethod
     def exportar_nivel(matriz: MatrizInfoCeldas,
-                       ruta_nivel: Optional["PathLike"]=None) -> None:
+                       ruta_nivel: Optional["PathLike"]=None,
+                       titulo: Optional[str]=None) -> None:
         """
-        Exporta un nivel a un archivo para su uso posterior.
+        Exporta un nivel a un archivo para su uso posterior, en el formato v2.
         -
         'matriz': La matriz llena de la información de celdas.
 
         'ruta_nivel': La ruta donde guardar el archivo. Si hay uno que se llama igual
                       se sobreescribe.
+
+        'titulo': El título a guardar en la cabecera. Si no se especifica, se usa el
+                  nombre del archivo.
         """
 
         if ruta_nivel is None:
@@ -245,14 +368,12 @@ class Nivel:
         if not ruta.parent.exists():
             ruta.parent.mkdir(parents=True, exist_ok=True)
 
+        if titulo is None:
+            titulo = " ".join(ruta.stem.split("_"))
+
         with ruta.open(mode="w", encoding="utf-8") as archivo:
-            for fila in matriz:
-                fila_str = []
-                for info in fila:
-                    tipo, rot, visib, c_id = info
-                    fila_str.append(f"{tipo.value}{SEP}{degrees(rot)}{SEP}{int(visib)}"
-                                    f"{SEP}{c_id}")
-                archivo.write(f"{' '.join(fila_str)}\n")
+            for linea in escribir_nivel(matriz, titulo.upper()):
+                archivo.write(f"{linea}\n")
 
 
     def regenerar_matriz(self,
@@ -268,9 +389,8 @@ class Nivel:
                    espacio vacío en su lugar.
         """
 
-        ancho, alto = get_surface().get_size()
         col, fil = len(matriz[0]), len(matriz)
-        incr_x, incr_y = ancho / col, alto / fil
+        incr_x, incr_y = METRICAS_PANTALLA.incremento_celda((col, fil))
         matriz_celdas = []
         puertas = "puertas"
         llaves = "llaves"
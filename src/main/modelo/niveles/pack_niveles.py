@@ -0,0 +1,347 @@
+"""
+Módulo para los packs de niveles empaquetados en un solo archivo.
+
+Un archivo '.nivelpack' tiene:
+    - Una cabecera fija: la marca 'NIVPACK', la versión, la cantidad de niveles y el
+      largo de la tabla de contenidos.
+    - La tabla de contenidos, en JSON: los niveles en orden, con dónde empieza cada uno
+      (contando desde el final de la tabla), cuánto ocupa y los datos de su cabecera
+      (título, tamaño, conteos).
+    - Los niveles mismos, cada uno en formato v2 y comprimido con zlib.
+"""
+
+from json import dumps as json_dumps
+from json import loads as json_loads
+from mmap import ACCESS_READ, mmap
+from os import stat_result
+from pathlib import Path
+from struct import Struct
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Iterable, Optional, TypeAlias, Union
+from zlib import compress, decompress
+from zlib import error as ZlibError
+
+from .lector_niveles import escribir_nivel, leer_cabecera, leer_nivel
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+EntradaPack: TypeAlias = dict[str, Any]
+
+EXT_PACK: str = ".nivelpack"
+MARCA_PACK: bytes = b"NIVPACK"
+VERSION_PACK: int = 1
+CABECERA_PACK: Struct = Struct("<7sBII") # marca, versión, cantidad de niveles, largo de la tabla
+# Los campos de cada entrada de la tabla de contenidos, y de qué tipo tienen que ser
+CAMPOS_ENTRADA: dict[str, type] = {"nombre": str,
+                                   "offset": int,
+                                   "tam": int,
+                                   "titulo": str,
+                                   "ancho": int,
+                                   "alto": int,
+                                   "jugadores": int,
+                                   "trofeos": int,
+                                   "llaves": int,
+                                   "puertas": int}
+
+# Packs ya abiertos, para no volver a abrirlos por cada nivel
+_PACKS_ABIERTOS: dict[str, "PackNiveles"] = {}
+_CANDADO_PACKS: Lock = Lock()
+
+
+class PackInvalido(Exception):
+    "Cuando un archivo de pack está dañado o no es un pack."
+
+
+class PackNiveles:
+    """
+    Clase para leer un pack de niveles. El archivo se mapea en memoria, así que abrirlo
+    sólo lee la tabla de contenidos, y cada nivel se lee recién cuando se pide.
+    """
+
+    def __init__(self, ruta_pack: "PathLike") -> None:
+        """
+        Abre un pack de niveles.
+        -
+        'ruta_pack': La ruta del archivo '.nivelpack'.
+        """
+
+        self.ruta: Path = Path(ruta_pack)
+        self.mtime: int = self.ruta.stat().st_mtime_ns
+
+        with self.ruta.open(mode="rb") as archivo:
+            try:
+                self._datos: mmap = mmap(archivo.fileno(), 0, access=ACCESS_READ)
+            except ValueError as exc: # Archivo vacío
+                raise PackInvalido(f"El pack '{self.ruta.as_posix()}' está vacío.") from exc
+
+        self._inicio_niveles: int = 0
+        try:
+            self.entradas: list[EntradaPack] = self._leer_tabla()
+        except PackInvalido:
+            self._datos.close()
+            raise
+
+        self._indices: dict[str, int] = {entrada["nombre"]: ind
+                                         for ind, entrada in enumerate(self.entradas)}
+
+
+    def _leer_tabla(self) -> list[EntradaPack]:
+        "Lee y valida la cabecera y la tabla de contenidos del pack."
+
+        if len(self._datos) < CABECERA_PACK.size:
+            raise PackInvalido(f"El archivo '{self.ruta.as_posix()}' no es un pack de niveles.")
+
+        marca, version, cantidad, largo_tabla = CABECERA_PACK.unpack_from(self._datos, 0)
+        if marca != MARCA_PACK:
+            raise PackInvalido(f"El archivo '{self.ruta.as_posix()}' no es un pack de niveles.")
+
+        if version != VERSION_PACK:
+            raise PackInvalido(f"El pack '{self.ruta.as_posix()}' tiene una versión "
+                               f"desconocida ({version}).")
+
+        inicio = CABECERA_PACK.size
+        try:
+            entradas = json_loads(self._datos[inicio:inicio + largo_tabla].decode("utf-8"))
+        except ValueError as exc:
+            raise PackInvalido(f"La tabla del pack '{self.ruta.as_posix()}' está "
+                               "dañada.") from exc
+
+        self._inicio_niveles = inicio + largo_tabla
+        tam_niveles = len(self._datos) - self._inicio_niveles
+        try:
+            coincide = (isinstance(entradas, list)
+                        and len(entradas) == cantidad
+                        and all(self._entrada_valida(entrada, tam_niveles)
+                                for entrada in entradas))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise PackInvalido(f"La tabla del pack '{self.ruta.as_posix()}' está "
+                               "dañada.") from exc
+
+        if not coincide:
+            raise PackInvalido(f"La tabla del pack '{self.ruta.as_posix()}' no coincide "
+                               "con su contenido.")
+
+        return entradas
+
+
+    @staticmethod
+    def _entrada_valida(entrada: EntradaPack, tam_niveles: int) -> bool:
+        """
+        Verifica que una entrada de la tabla de contenidos tenga todos sus campos, con el
+        tipo correcto, y que el nivel que indica esté dentro del archivo.
+        -
+        'entrada': La entrada a revisar.
+
+        'tam_niveles': Cuántos bytes hay en el archivo después de la tabla.
+        """
+
+        if not isinstance(entrada, dict):
+            return False
+
+        for campo, tipo in CAMPOS_ENTRADA.items():
+            valor = entrada[campo]
+            # `bool` es subclase de `int`, pero no es un valor que tenga sentido acá
+            if not isinstance(valor, tipo) or isinstance(valor, bool):
+                return False
+
+        return 0 <= entrada["offset"] and 0 <= entrada["tam"] <= tam_niveles - entrada["offset"]
+
+
+    def __len__(self) -> int:
+        "Devuelve la cantidad de niveles en el pack."
+
+        return len(self.entradas)
+
+
+    def __enter__(self) -> "PackNiveles":
+        "Permite usar el pack con `with`."
+
+        return self
+
+
+    def __exit__(self, *_args) -> None:
+        "Cierra el pack al salir del bloque `with`."
+
+        self.cerrar()
+
+
+    @property
+    def nombres(self) -> tuple[str, ...]:
+        "Devuelve los nombres de los niveles, en el orden del pack."
+
+        return tuple(entrada["nombre"] for entrada in self.entradas)
+
+
+    def rutas(self) -> tuple[str, ...]:
+        """
+        Devuelve las rutas de todos los niveles del pack, en orden. Son de la forma
+        'ruta/del/pack.nivelpack/nombre.nivel', y se pueden usar como cualquier otra
+        ruta de nivel.
+        """
+
+        return tuple(f"{self.ruta.as_posix()}/{nombre}" for nombre in self.nombres)
+
+
+    def info(self, nivel: Union[int, str]) -> EntradaPack:
+        """
+        Devuelve la entrada de la tabla de contenidos de un nivel.
+        -
+        'nivel': El índice o el nombre del nivel.
+        """
+
+        if isinstance(nivel, str):
+            if nivel not in self._indices:
+                raise FileNotFoundError(f"El nivel '{nivel}' no está en el pack "
+                                        f"'{self.ruta.as_posix()}'.")
+            nivel = self._indices[nivel]
+
+        return self.entradas[nivel]
+
+
+    def leer_bytes(self, nivel: Union[int, str]) -> bytes:
+        """
+        Devuelve el contenido de un nivel del pack, ya descomprimido.
+        -
+        'nivel': El índice o el nombre del nivel.
+        """
+
+        entrada = self.info(nivel)
+        inicio = self._inicio_niveles + entrada["offset"]
+        try:
+            return decompress(self._datos[inicio:inicio + entrada["tam"]])
+        except ZlibError as exc:
+            raise PackInvalido(f"El nivel '{entrada['nombre']}' del pack "
+                               f"'{self.ruta.as_posix()}' está dañado.") from exc
+
+
+    def cerrar(self) -> None:
+        "Libera el archivo del pack."
+
+        self._datos.close()
+
+
+    @staticmethod
+    def crear(destino: "PathLike", rutas_niveles: Iterable["PathLike"]) -> Path:
+        """
+        Empaqueta varios niveles en un único archivo, en el orden dado. Los niveles
+        pueden estar en cualquier formato; dentro del pack se guardan en el v2.
+        -
+        'destino': La ruta del archivo a crear. Si ya existe, se sobreescribe.
+
+        'rutas_niveles': Las rutas de los niveles a empaquetar.
+        """
+
+        entradas, blobs = [], []
+        offset = 0
+        for ruta_nivel in rutas_niveles:
+            ruta = Path(ruta_nivel)
+            if any(entrada["nombre"] == ruta.name for entrada in entradas):
+                raise ValueError(f"Hay más de un nivel llamado '{ruta.name}' para el pack.")
+
+            texto = leer_bytes_nivel(ruta).decode("utf-8")
+            matriz, _, cabecera = leer_nivel(texto.splitlines(), ruta.as_posix())
+            titulo = (cabecera.titulo if cabecera is not None and cabecera.titulo
+                      else " ".join(ruta.stem.split("_"))).upper()
+
+            lineas = list(escribir_nivel(matriz, titulo))
+            cabecera = leer_cabecera(lineas)
+            blob = compress("\n".join(lineas).encode("utf-8"), 9)
+            entradas.append({"nombre": ruta.name,
+                             "offset": offset,
+                             "tam": len(blob),
+                             "titulo": titulo,
+                             "ancho": cabecera.ancho,
+                             "alto": cabecera.alto,
+                             "jugadores": cabecera.jugadores,
+                             "trofeos": cabecera.trofeos,
+                             "llaves": cabecera.llaves,
+                             "puertas": cabecera.puertas})
+            blobs.append(blob)
+            offset += len(blob)
+
+        tabla = json_dumps(entradas, ensure_ascii=False).encode("utf-8")
+        ruta_destino = Path(destino)
+        ruta_destino.parent.mkdir(parents=True, exist_ok=True)
+        with ruta_destino.open(mode="wb") as archivo:
+            archivo.write(CABECERA_PACK.pack(MARCA_PACK, VERSION_PACK, len(entradas), len(tabla)))
+            archivo.write(tabla)
+            for blob in blobs:
+                archivo.write(blob)
+
+        return ruta_destino
+
+
+def es_pack(ruta: "PathLike") -> bool:
+    """
+    Decide si una ruta es un archivo de pack de niveles.
+    -
+    'ruta': La ruta en cuestión.
+    """
+
+    ruta = Path(ruta)
+    return ruta.suffix.lower() == EXT_PACK and ruta.is_file()
+
+
+def dividir_ruta_pack(ruta_nivel: "PathLike") -> Optional[tuple[Path, str]]:
+    """
+    Si la ruta es la de un nivel dentro de un pack, devuelve la ruta del pack y el
+    nombre del nivel. Si no, devuelve `None`.
+    -
+    'ruta_nivel': La ruta del nivel.
+    """
+
+    ruta = Path(ruta_nivel)
+    if ruta.parent.suffix.lower() != EXT_PACK:
+        return None
+
+    return ruta.parent, ruta.name
+
+
+def abrir_pack(ruta_pack: "PathLike") -> PackNiveles:
+    """
+    Devuelve el pack abierto, reutilizando el que ya se había abierto si el archivo no
+    cambió desde entonces.
+    -
+    'ruta_pack': La ruta del archivo '.nivelpack'.
+    """
+
+    clave = Path(ruta_pack).as_posix()
+    mtime = Path(ruta_pack).stat().st_mtime_ns
+
+    with _CANDADO_PACKS:
+        pack = _PACKS_ABIERTOS.get(clave)
+        if pack is None or pack.mtime != mtime:
+            if pack is not None:
+                pack.cerrar()
+            pack = PackNiveles(ruta_pack)
+            _PACKS_ABIERTOS[clave] = pack
+
+    return pack
+
+
+def stat_nivel(ruta_nivel: "PathLike") -> stat_result:
+    """
+    Devuelve los datos del archivo de un nivel. Para un nivel dentro de un pack, son
+    los del pack.
+    -
+    'ruta_nivel': La ruta del nivel.
+    """
+
+    en_pack = dividir_ruta_pack(ruta_nivel)
+    return (en_pack[0] if en_pack is not None else Path(ruta_nivel)).stat()
+
+
+def leer_bytes_nivel(ruta_nivel: "PathLike") -> bytes:
+    """
+    Devuelve el contenido de un archivo de nivel, esté suelto o dentro de un pack.
+    -
+    'ruta_nivel': La ruta del nivel.
+    """
+
+    en_pack = dividir_ruta_pack(ruta_nivel)
+    if en_pack is None:
+        return Path(ruta_nivel).read_bytes()
+
+    ruta_pack, nombre = en_pack
+    return abrir_pack(ruta_pack).leer_bytes(nombre)
@@ -0,0 +1,129 @@
+"""
+Módulo para la caché de plantillas de niveles.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TypeAlias
+
+from ..utils import METRICAS_PANTALLA
+from .nivel import Nivel
+from .pack_niveles import stat_nivel
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+ClavePlantilla: TypeAlias = tuple[str, int, tuple[int, int]]
+
+MAX_PLANTILLAS: int = 8
+
+
+class PlantillasNiveles:
+    """
+    Clase que recuerda los últimos niveles cargados, tal que volver a jugar uno no requiera
+    leerlo y armarlo de nuevo: sólo se reinicia su estado.
+    Cada nivel se identifica por su ruta, su fecha de modificación y el tamaño de la
+    pantalla, ya que las celdas dependen de éste.
+    """
+
+    def __init__(self, max_plantillas: int=MAX_PLANTILLAS) -> None:
+        """
+        Inicializa la caché de plantillas.
+        -
+        'max_plantillas': La cantidad máxima de niveles a recordar. Se olvidan primero los
+                          que hace más tiempo que no se usan.
+        """
+
+        self.max_plantillas: int = max_plantillas
+        self.plantillas: OrderedDict[ClavePlantilla, Nivel] = OrderedDict()
+
+
+    @staticmethod
+    def _clave_de(ruta_nivel: "PathLike") -> ClavePlantilla:
+        """
+        Arma la clave con la que se guarda un nivel.
+        -
+        'ruta_nivel': La ruta del archivo de nivel.
+        """
+
+        return (Path(ruta_nivel).as_posix(), stat_nivel(ruta_nivel).st_mtime_ns,
+                METRICAS_PANTALLA.tam)
+
+
+    def tiene(self, ruta_nivel: "PathLike") -> bool:
+        """
+        Verifica si hay una plantilla vigente para un nivel.
+        -
+        'ruta_nivel': La ruta del archivo de nivel.
+        """
+
+        try:
+            return self._clave_de(ruta_nivel) in self.plantillas
+        except OSError:
+            return False
+
+
+    def guardar(self, ruta_nivel: "PathLike", nivel: Nivel) -> None:
+        """
+        Guarda un nivel que se cargó por otro lado, como plantilla para más adelante.
+        -
+        'ruta_nivel': La ruta del archivo de nivel.
+
+        'nivel': El nivel cargado desde esa ruta.
+        """
+
+        clave = self._clave_de(ruta_nivel)
+        # Una versión vieja del mismo archivo ya no sirve
+        for vieja in [otra for otra in self.plantillas if otra[0] == clave[0]]:
+            self.plantillas.pop(vieja)
+
+        self.plantillas[clave] = nivel
+        self.plantillas.move_to_end(clave)
+
+        while len(self.plantillas) > self.max_plantillas:
+            self.plantillas.popitem(last=False)
+
+
+    def obtener(self, ruta_nivel: "PathLike", ruta_sig: Optional["PathLike"]=None) -> Nivel:
+        """
+        Devuelve el nivel listo para jugar. Si ya se tenía guardado se reinicia su estado;
+        si no, se carga desde el archivo y se guarda.
+        -
+        'ruta_nivel': La ruta del archivo de nivel.
+
+        'ruta_sig': La ruta del siguiente nivel.
+        """
+
+        clave = self._clave_de(ruta_nivel)
+        nivel = self.plantillas.get(clave)
+
+        if nivel is None:
+            nivel = Nivel(ruta_nivel, ruta_sig)
+            self.guardar(ruta_nivel, nivel)
+        else:
+            self.plantillas.move_to_end(clave)
+            nivel.reiniciar()
+            nivel.sig = ruta_sig
+
+        return nivel
+
+
+    def reubicar(self, nivel: Nivel) -> None:
+        """
+        Si el nivel está guardado como plantilla, lo pasa a la clave del tamaño actual de
+        la pantalla. Se usa después de reubicar sus celdas al redimensionar, ya que éstas
+        dejan de servir para el tamaño anterior.
+        -
+        'nivel': El nivel cuyas celdas se reubicaron.
+        """
+
+        for clave, guardado in list(self.plantillas.items()):
+            if guardado is nivel:
+                self.plantillas.pop(clave)
+                self.plantillas[clave[:2] + (METRICAS_PANTALLA.tam,)] = nivel
+
+
+    def vaciar(self) -> None:
+        "Olvida todas las plantillas."
+
+        self.plantillas.clear()
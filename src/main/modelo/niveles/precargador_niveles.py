@@ -0,0 +1,134 @@
+"""
+Módulo para el precargador de niveles.
+"""
+
+from pathlib import Path
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Callable, Optional, TypeAlias
+
+from .nivel import Nivel
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+ClavePrecarga: TypeAlias = tuple[str, Optional[str]]
+FuncionCalentar: TypeAlias = Callable[[Nivel], None]
+
+
+class PrecargadorNiveles:
+    """
+    Clase que carga el siguiente nivel en un hilo aparte mientras se juega el actual.
+    Cuando llega el momento de pasar de nivel, éste ya está leído y con sus celdas
+    asociadas, tal que el cambio es inmediato.
+    """
+
+    def __init__(self, calentar: Optional[FuncionCalentar]=None) -> None:
+        """
+        Inicializa el precargador.
+        -
+        'calentar': Una función opcional que se corre en el mismo hilo tras cargar el
+                    nivel, para dejar listo lo que haga falta para mostrarlo (sprites, etc).
+        """
+
+        self.calentar: Optional[FuncionCalentar] = calentar
+        self._clave: Optional[ClavePrecarga] = None
+        self._nivel: Optional[Nivel] = None
+        self._hilo: Optional[Thread] = None
+        self._candado: Lock = Lock()
+
+
+    @staticmethod
+    def _clave_de(ruta_nivel: "PathLike", ruta_sig: Optional["PathLike"]) -> ClavePrecarga:
+        """
+        Arma la clave con la que se identifica a una precarga.
+        -
+        'ruta_nivel': La ruta del nivel.
+
+        'ruta_sig': La ruta del nivel que le sigue.
+        """
+
+        return (Path(ruta_nivel).as_posix(),
+                (Path(ruta_sig).as_posix() if ruta_sig is not None else None))
+
+
+    def _cargar(self, clave: ClavePrecarga, ruta_nivel: "PathLike",
+                ruta_sig: Optional["PathLike"]) -> None:
+        """
+        Carga el nivel y lo guarda si sigue siendo el pedido. Corre en un hilo aparte.
+        -
+        'clave': La clave de la precarga.
+
+        'ruta_nivel': La ruta del nivel a cargar.
+
+        'ruta_sig': La ruta del nivel que le sigue.
+        """
+
+        # Si falla, se deja en `None` y el error aparece al cargarlo de forma normal
+        nivel = None
+        try:
+            nivel = Nivel(ruta_nivel, ruta_sig)
+            if self.calentar is not None:
+                self.calentar(nivel)
+        except Exception: # pylint: disable=broad-exception-caught
+            pass
+
+        with self._candado:
+            if clave == self._clave:
+                self._nivel = nivel
+
+
+    def pedir(self, ruta_nivel: "PathLike", ruta_sig: Optional["PathLike"]=None) -> None:
+        """
+        Empieza a cargar un nivel en segundo plano, descartando cualquier precarga anterior.
+        -
+        'ruta_nivel': La ruta del nivel a precargar.
+
+        'ruta_sig': La ruta del nivel que le sigue, para guardarla en el nivel.
+        """
+
+        clave = self._clave_de(ruta_nivel, ruta_sig)
+        with self._candado:
+            if clave == self._clave:
+                return
+
+            self._clave = clave
+            self._nivel = None
+
+        self._hilo = Thread(target=self._cargar, args=(clave, ruta_nivel, ruta_sig), daemon=True)
+        self._hilo.start()
+
+
+    def tomar(self,
+              ruta_nivel: "PathLike",
+              ruta_sig: Optional["PathLike"]=None) -> Optional[Nivel]:
+        """
+        Devuelve el nivel precargado si corresponde a las rutas dadas, y lo olvida.
+        Si todavía se está cargando, se espera a que termine, ya que es siempre más rápido
+        que empezar de nuevo. Si no se había pedido o falló, se devuelve `None`.
+        -
+        'ruta_nivel': La ruta del nivel buscado.
+
+        'ruta_sig': La ruta del nivel que le sigue.
+        """
+
+        clave = self._clave_de(ruta_nivel, ruta_sig)
+        if clave != self._clave:
+            return None
+
+        if self._hilo is not None:
+            self._hilo.join()
+
+        with self._candado:
+            nivel = self._nivel
+            self._clave = None
+            self._nivel = None
+
+        return nivel
+
+
+    def descartar(self) -> None:
+        "Olvida cualquier precarga, terminada o no."
+
+        with self._candado:
+            self._clave = None
+            self._nivel = None
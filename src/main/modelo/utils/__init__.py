@@ -2,4 +2,5 @@
 Paquete para clases y objetos de utilidad.
 """
 
+from .metricas_pantalla import *
 from .temporizador import *
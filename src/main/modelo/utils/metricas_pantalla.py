@@ -0,0 +1,91 @@
+"""
+Módulo para las medidas de la pantalla.
+"""
+
+from typing import Optional, TypeAlias
+
+from pygame.display import get_surface
+
+TamPantalla: TypeAlias = tuple[int, int]
+FormaMatriz: TypeAlias = tuple[int, int]
+
+
+class MetricasPantalla:
+    """
+    Medidas de la pantalla, y de lo que se calcula a partir de ellas, hechas una sola vez
+    por cada tamaño en vez de en cada consulta.
+    Cada vez que el tamaño cambia se pasa a una nueva generación, tal que quien guarde algo
+    calculado a partir de estas medidas sepa que tiene que rehacerlo.
+    """
+
+    def __init__(self) -> None:
+        "Inicializa las medidas. Se toman de la pantalla recién la primera vez que se piden."
+
+        self._tam: Optional[TamPantalla] = None
+        self.generacion: int = 0
+        self._incrementos: dict[FormaMatriz, tuple[float, float]] = {}
+
+
+    def actualizar(self, tam: Optional[TamPantalla]=None) -> bool:
+        """
+        Vuelve a tomar las medidas. Devuelve si el tamaño cambió, en cuyo caso empieza una
+        nueva generación y se descarta todo lo calculado para el tamaño anterior.
+        -
+        'tam': El nuevo tamaño. Si no se especifica, se usa el de la pantalla actual.
+        """
+
+        if tam is None:
+            tam = get_surface().get_size()
+
+        tam = (int(tam[0]), int(tam[1]))
+        if tam == self._tam:
+            return False
+
+        self._tam = tam
+        self.generacion += 1
+        self._incrementos.clear()
+        return True
+
+
+    @property
+    def tam(self) -> TamPantalla:
+        "Devuelve el ancho y alto de la pantalla, en píxeles."
+
+        if self._tam is None:
+            self.actualizar()
+
+        return self._tam
+
+
+    @property
+    def ancho(self) -> int:
+        "Devuelve el ancho de la pantalla, en píxeles."
+
+        return self.tam[0]
+
+
+    @property
+    def alto(self) -> int:
+        "Devuelve el alto de la pantalla, en píxeles."
+
+        return self.tam[1]
+
+
+    def incremento_celda(self, forma: FormaMatriz) -> tuple[float, float]:
+        """
+        Devuelve el tamaño que tiene cada celda de una matriz que ocupa toda la pantalla.
+        -
+        'forma': Las columnas y filas de la matriz.
+        """
+
+        incremento = self._incrementos.get(forma)
+        if incremento is None:
+            ancho, alto = self.tam
+            incremento = (ancho / forma[0], alto / forma[1])
+            self._incrementos[forma] = incremento
+
+        return incremento
+
+
+# Las medidas de la pantalla del juego, compartidas por todo lo que las consulte
+METRICAS_PANTALLA: MetricasPantalla = MetricasPantalla()
@@ -0,0 +1,5 @@
+"""
+Paquete para lo que se muestra mientras el juego carga.
+"""
+
+from .pantalla_carga import *
@@ -0,0 +1,62 @@
+"""
+Módulo para la pantalla de carga.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from pygame import Rect
+from pygame.draw import rect
+
+from ..fuentes import FuenteMinecraftia
+
+if TYPE_CHECKING:
+    from pygame import Surface
+
+COLOR_FONDO_CARGA: str = "#000055"
+COLOR_BARRA: str = "#ffffff"
+
+
+class PantallaCarga:
+    "Pantalla con una barra de progreso, para mientras se precargan los recursos."
+
+    def __init__(self,
+                 color_fondo: str=COLOR_FONDO_CARGA,
+                 color_barra: str=COLOR_BARRA) -> None:
+        """
+        Inicializa la pantalla de carga.
+        -
+        'color_fondo': El color del fondo.
+
+        'color_barra': El color de la barra de progreso y del texto.
+        """
+
+        self.color_fondo: str = color_fondo
+        self.color_barra: str = color_barra
+        self._fuente: Optional[FuenteMinecraftia] = None
+
+
+    def dibujar(self, superficie: "Surface", progreso: float) -> None:
+        """
+        Dibuja la pantalla de carga.
+        -
+        'superficie': La superficie sobre la que dibujar.
+
+        'progreso': Qué fracción de la carga ya se hizo, entre 0.0 y 1.0.
+        """
+
+        ancho, alto = superficie.get_size()
+        progreso = min(max(progreso, 0.0), 1.0)
+
+        if self._fuente is None:
+            self._fuente = FuenteMinecraftia(tam=int(alto * 0.03))
+
+        superficie.fill(self.color_fondo)
+
+        borde = Rect(ancho * 0.25, alto * 0.55, ancho * 0.5, alto * 0.04)
+        rect(superficie, self.color_barra, borde, width=2)
+        relleno = borde.inflate(-8, -8)
+        relleno.width = int(relleno.width * progreso)
+        rect(superficie, self.color_barra, relleno)
+
+        texto = self._fuente.render(f"Cargando... {int(progreso * 100)}%", True, self.color_barra)
+        superficie.blit(texto, texto.get_rect(midbottom=(ancho // 2, borde.top - alto * 0.02)))
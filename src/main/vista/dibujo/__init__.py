@@ -0,0 +1,6 @@
+"""
+Paquete para juntar lo que se dibuja en cada frame y dibujarlo todo junto.
+"""
+
+from .lista_dibujo import *
+from .motor_texturas import *
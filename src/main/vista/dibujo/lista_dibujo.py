@@ -0,0 +1,169 @@
+"""
+Módulo para la lista de lo que se dibuja en un frame.
+"""
+
+from collections import defaultdict
+from enum import IntEnum
+from typing import TYPE_CHECKING, Iterator, Optional, TypeAlias, Union
+
+from pygame import Rect
+from pygame.math import Vector2
+
+if TYPE_CHECKING:
+    from pygame import Surface
+
+Destino: TypeAlias = Union[Vector2, tuple[float, float], Rect]
+ComandoDibujo: TypeAlias = tuple["Surface", Destino, Optional[Rect], int]
+
+
+class CapasDibujo(IntEnum):
+    "Capas en las que se dibuja un frame, de la de más abajo a la de más arriba."
+
+    CELDAS = 10
+    JUGADOR = 20
+    DEBUG = 30
+    INTERFAZ = 40
+
+
+# En estas capas nada se superpone, así que se pueden agrupar las imágenes iguales
+CAPAS_SIN_SUPERPOSICION: frozenset[int] = frozenset({CapasDibujo.CELDAS})
+
+
+class CapaDibujo:
+    """
+    Una capa de una lista de dibujo. Tiene el mismo `blit()` que una superficie, tal que
+    se le puede pasar a cualquier cosa que sepa dibujarse sobre una.
+    """
+
+    def __init__(self, comandos: list[ComandoDibujo]) -> None:
+        """
+        Inicializa la capa.
+        -
+        'comandos': La lista donde anotar lo que se dibuja en esta capa.
+        """
+
+        self.comandos: list[ComandoDibujo] = comandos
+
+
+    def blit(self,
+             source: "Surface",
+             dest: Destino,
+             area: Optional[Rect]=None,
+             special_flags: int=0) -> None:
+        """
+        Anota una imagen para dibujarla después, junto con todo lo demás.
+        -
+        'source': La imagen a dibujar.
+
+        'dest': Dónde dibujarla.
+
+        'area': Qué parte de la imagen dibujar. Si es `None`, se dibuja entera.
+
+        'special_flags': Las opciones de mezcla, igual que en `Surface.blit()`.
+        """
+
+        # Los vectores se copian, ya que pueden cambiar antes de que se dibuje
+        if isinstance(dest, Vector2):
+            dest = (dest.x, dest.y)
+
+        self.comandos.append((source, dest, area, special_flags))
+
+
+Lienzo: TypeAlias = Union["Surface", CapaDibujo]
+
+
+class ListaDibujo:
+    """
+    Clase que junta todo lo que se dibuja en un frame en vez de dibujarlo de a una imagen
+    por vez, para después mandarlo con una sola llamada por capa a `Surface.blits()`.
+    También lleva la cuenta de cuánto se dibuja.
+    """
+
+    def __init__(self) -> None:
+        "Inicializa la lista vacía."
+
+        self._capas: defaultdict[int, list[ComandoDibujo]] = defaultdict(list)
+        self._vistas: dict[int, CapaDibujo] = {}
+
+        # Lo dibujado en el frame actual, y en el anterior (que ya está completo)
+        self.imagenes: int = 0
+        self.llamadas: int = 0
+        self.imagenes_frame_anterior: int = 0
+        self.llamadas_frame_anterior: int = 0
+
+
+    def capa(self, capa: int) -> CapaDibujo:
+        """
+        Devuelve una capa, sobre la que se puede hacer `blit()` como en una superficie.
+        -
+        'capa': El número de la capa. Las de número más alto se dibujan encima.
+        """
+
+        vista = self._vistas.get(capa)
+        if vista is None:
+            vista = CapaDibujo(self._capas[capa])
+            self._vistas[capa] = vista
+
+        return vista
+
+
+    def __len__(self) -> int:
+        "Devuelve cuántas imágenes hay anotadas sin dibujar."
+
+        return sum(len(comandos) for comandos in self._capas.values())
+
+
+    def vaciar(self, hasta_capa: Optional[int]=None) -> Iterator[list[ComandoDibujo]]:
+        """
+        Devuelve lo anotado capa por capa, de la de más abajo a la de más arriba, para que
+        quien lo recorra lo dibuje como quiera. Cada capa se vacía y se cuenta como una
+        llamada recién después de recorrerla.
+        -
+        'hasta_capa': La última capa a devolver; las de más arriba quedan anotadas. Si es
+                      `None`, se devuelven todas.
+        """
+
+        for capa in sorted(self._capas):
+            comandos = self._capas[capa]
+            if hasta_capa is not None and capa > hasta_capa:
+                break
+            if not comandos:
+                continue
+
+            if capa in CAPAS_SIN_SUPERPOSICION:
+                comandos.sort(key=lambda comando: id(comando[0]))
+
+            yield comandos
+            self.imagenes += len(comandos)
+            self.llamadas += 1
+            # Se vacía en el lugar, ya que las vistas de las capas apuntan a esta lista
+            comandos.clear()
+
+
+    def dibujar(self, superficie: "Surface", hasta_capa: Optional[int]=None) -> int:
+        """
+        Dibuja lo anotado, capa por capa, y vacía esas capas. Devuelve cuántas imágenes
+        se dibujaron.
+        -
+        'superficie': La superficie sobre la que dibujar.
+
+        'hasta_capa': La última capa a dibujar; las de más arriba quedan anotadas. Si es
+                      `None`, se dibujan todas.
+        """
+
+        dibujadas = 0
+        for comandos in self.vaciar(hasta_capa):
+            superficie.blits(comandos, doreturn=False)
+            dibujadas += len(comandos)
+
+        return dibujadas
+
+
+    def nuevo_frame(self) -> None:
+        "Cierra la cuenta del frame que terminó y empieza la del siguiente."
+
+        self.imagenes_frame_anterior = self.imagenes
+        self.llamadas_frame_anterior = self.llamadas
+        self.imagenes = 0
+        self.llamadas = 0
+
@@ -0,0 +1,222 @@
+"""
+Módulo para dibujar el nivel con texturas de SDL2, en vez de superficies.
+"""
+
+from enum import StrEnum
+from os import environ
+from typing import TYPE_CHECKING, NamedTuple, Optional, TypeAlias
+from weakref import WeakKeyDictionary
+
+from pygame import SCALED, SRCALPHA, Color, Rect, Surface
+from pygame._sdl2.video import Renderer, Texture, Window
+from pygame.display import set_mode
+
+from ..sprites import origen_de
+
+if TYPE_CHECKING:
+    from .lista_dibujo import ComandoDibujo, ListaDibujo
+
+TamPantalla: TypeAlias = tuple[int, int]
+
+VAR_RENDER_DRIVER: str = "SDL_RENDER_DRIVER"
+# Los modos de mezcla de SDL que se usan acá
+BLEND_NINGUNO: int = 0
+BLEND_ALFA: int = 1
+
+
+class MotorDibujo(StrEnum):
+    "Con qué se dibuja el nivel."
+
+    SUPERFICIES = "superficies" # Con `Surface.blits()`, siempre en software
+    TEXTURAS = "texturas" # Con el renderer de SDL2 de la ventana
+
+
+class TexturaResuelta(NamedTuple):
+    "Cómo dibujar una imagen con la textura de la imagen de la que sale."
+
+    textura: Texture
+    tam_base: tuple[int, int] # El tamaño de la textura
+    tam: tuple[int, int] # El tamaño de la imagen, que es lo que ocuparía con `blit()`
+    angulo: float # En sentido horario, como lo usa SDL
+    espejo_x: bool
+    espejo_y: bool
+    alpha: int
+
+
+class MotorTexturas:
+    """
+    Clase que dibuja las capas del nivel con el renderer de SDL2 de la ventana.
+    Cada imagen base se sube una sola vez como textura, y las rotaciones, reflejos y
+    transparencias de sus variantes se aplican recién al dibujarla. Lo demás (interfaz,
+    menús) se sigue dibujando sobre una superficie, que se sube entera encima de todo.
+    """
+
+    def __init__(self, renderer: Renderer, tam: TamPantalla) -> None:
+        """
+        Inicializa el motor.
+        -
+        'renderer': El renderer sobre el que dibujar.
+
+        'tam': El tamaño lógico de la pantalla.
+        """
+
+        self.renderer: Renderer = renderer
+        self.tam: TamPantalla = tam
+        # Donde se dibuja todo lo que no es el nivel, en vez de la pantalla de Pygame
+        self.pantalla: Surface = Surface(tam, SRCALPHA, 32)
+        self._capa_pantalla: Texture = Texture(renderer, tam, streaming=True)
+        self._lienzo: Optional[Texture] = None
+        self._texturas: "WeakKeyDictionary[Surface, Texture]" = WeakKeyDictionary()
+        self._resueltas: "WeakKeyDictionary[Surface, TexturaResuelta]" = WeakKeyDictionary()
+        self._hay_nivel: bool = False # Si en este frame ya se dibujó un nivel abajo
+
+
+    @classmethod
+    def abrir_pantalla(cls, tam: TamPantalla, software: bool=False) -> "MotorTexturas":
+        """
+        Crea la ventana del juego y devuelve un motor que dibuja con su renderer.
+        La ventana se abre con `SCALED`, que es la forma en que Pygame deja usar el mismo
+        renderer que usa `pygame.display`; así todo lo que consulta la pantalla de Pygame
+        (por ejemplo, su tamaño) sigue funcionando igual.
+        -
+        'tam': El tamaño de la ventana.
+
+        'software': Si usar el renderer por software de SDL en vez de uno acelerado.
+        """
+
+        if software:
+            environ[VAR_RENDER_DRIVER] = "software"
+
+        set_mode(tam, SCALED)
+        return cls(Renderer.from_window(Window.from_display_module()), tam)
+
+
+    def textura(self, imagen: Surface) -> Texture:
+        """
+        Devuelve la textura de una imagen, subiéndola si es la primera vez que se pide.
+        Se descarta sola cuando la imagen deja de usarse.
+        -
+        'imagen': La imagen en cuestión.
+        """
+
+        textura = self._texturas.get(imagen)
+        if textura is None:
+            textura = Texture.from_surface(self.renderer, imagen)
+            self._texturas[imagen] = textura
+
+        return textura
+
+
+    def _resolver(self, imagen: Surface) -> TexturaResuelta:
+        """
+        Averigua con qué textura y cómo dibujar una imagen, que puede ser una variante
+        (rotada, espejada o transparente) de otra.
+        -
+        'imagen': La imagen a dibujar.
+        """
+
+        resuelta = self._resueltas.get(imagen)
+        if resuelta is None:
+            origen = origen_de(imagen)
+            resuelta = TexturaResuelta(textura=self.textura(origen.base),
+                                       tam_base=origen.base.get_size(),
+                                       tam=imagen.get_size(),
+                                       angulo=-origen.rot % 360,
+                                       espejo_x=origen.espejo_x,
+                                       espejo_y=origen.espejo_y,
+                                       alpha=origen.alpha)
+            self._resueltas[imagen] = resuelta
+
+        return resuelta
+
+
+    def _dibujar_comandos(self, comandos: list["ComandoDibujo"]) -> None:
+        """
+        Dibuja una capa de la lista de dibujo. Las opciones de mezcla especiales de
+        `Surface.blit()` no se usan en el nivel, así que se ignoran.
+        -
+        'comandos': Lo anotado en la capa.
+        """
+
+        for imagen, dest, area, _ in comandos:
+            pos_x, pos_y = int(dest[0]), int(dest[1])
+
+            # Un recorte es de la imagen tal cual está, así que se usa su propia textura
+            if area is not None:
+                self.textura(imagen).draw(srcrect=area,
+                                          dstrect=(pos_x, pos_y, area.width, area.height))
+                continue
+
+            resuelta = self._resolver(imagen)
+            ancho, alto = resuelta.tam_base
+            destino = Rect(pos_x, pos_y, ancho, alto)
+            # Al rotar, la imagen crece alrededor del centro de la original
+            if resuelta.angulo:
+                destino.center = (pos_x + resuelta.tam[0] // 2, pos_y + resuelta.tam[1] // 2)
+
+            resuelta.textura.alpha = resuelta.alpha
+            resuelta.textura.draw(dstrect=destino,
+                                  angle=resuelta.angulo,
+                                  flip_x=resuelta.espejo_x,
+                                  flip_y=resuelta.espejo_y)
+
+
+    def dibujar(self,
+                lista: "ListaDibujo",
+                hasta_capa: Optional[int]=None,
+                fondo: str="black",
+                tam_interno: Optional[TamPantalla]=None) -> int:
+        """
+        Limpia la ventana y dibuja lo anotado en una lista de dibujo, vaciándola.
+        Devuelve cuántas imágenes se dibujaron.
+        -
+        'lista': La lista de dibujo.
+
+        'hasta_capa': La última capa a dibujar; las de más arriba quedan anotadas. Si es
+                      `None`, se dibujan todas.
+
+        'fondo': El color con el que limpiar la ventana.
+
+        'tam_interno': Si se especifica, se dibuja en una textura de este tamaño que
+                       después se estira a toda la ventana, como la resolución interna
+                       del renderizador de nivel.
+        """
+
+        destino = self.renderer.target
+        if tam_interno is not None:
+            if self._lienzo is None or self._lienzo.get_rect().size != tam_interno:
+                self._lienzo = Texture(self.renderer, tam_interno, target=True)
+            self.renderer.target = self._lienzo
+
+        self.renderer.draw_color = Color(fondo)
+        self.renderer.clear()
+
+        dibujadas = 0
+        for comandos in lista.vaciar(hasta_capa):
+            self._dibujar_comandos(comandos)
+            dibujadas += len(comandos)
+
+        if tam_interno is not None:
+            self.renderer.target = destino
+            self._lienzo.draw()
+
+        self._hay_nivel = True
+        return dibujadas
+
+
+    def presentar(self) -> None:
+        """
+        Sube la superficie con la interfaz encima de lo que ya se dibujó y muestra el
+        frame en la ventana. Reemplaza a `pygame.display.flip()`.
+        """
+
+        if not self._hay_nivel:
+            self.renderer.draw_color = Color("black")
+            self.renderer.clear()
+
+        # Sin nivel abajo, la superficie es opaca y no hace falta mezclarla
+        self._capa_pantalla.blend_mode = (BLEND_ALFA if self._hay_nivel else BLEND_NINGUNO)
+        self._capa_pantalla.update(self.pantalla)
+        self._capa_pantalla.draw()
+        self.renderer.present()
+        self._hay_nivel = False
@@ -3,13 +3,17 @@ Módulo para el menú de cargar niveles.
 """
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, TypeAlias
+from typing import TYPE_CHECKING, NamedTuple, Optional, TypeAlias
 
-from pygame.display import get_surface
+from pygame.constants import K_PAGEDOWN, K_PAGEUP, KEYDOWN, MOUSEWHEEL
 from pygame_menu import BaseImage
+from pygame_menu.locals import INPUT_TEXT
 
+from ....controlador.archivos import CatalogoNiveles
+from ....modelo.utils import METRICAS_PANTALLA
+from ...niveles import GeneradorMiniaturas
 from ...temas import TemaFresh
-from ..supermenu import SuperMenu, MENUS_IMG
+from ..supermenu import MENUS_IMG, SuperMenu, imagen_menu
 from .menu_controles import ARROW_LEFT_IMG_PATH
 
 if TYPE_CHECKING:
@@ -17,15 +21,17 @@ if TYPE_CHECKING:
 
     from pygame import Surface
     from pygame_menu import Menu
-    from pygame_menu.widgets import Button
+    from pygame_menu._types import EventVectorType
+    from pygame_menu.widgets import Button, Label, TextInput
 
     from ....controlador.estado import JuegoHandler
     from ..supermenu import KwargsDict
 
-BotonesNiveles: TypeAlias = dict[str, "Button"]
+BotonesNiveles: TypeAlias = list["Button"]
+IndiceNiveles: TypeAlias = list["EntradaNivel"]
 
-NIVEL_EXT: str = ".nivel"
 RUTA_NIVELES: "PathLike" = "./niveles"
+FILAS_VISIBLES: int = 4
 # --- Assets ---
 NIVEL_IMG: "PathLike" = f"{MENUS_IMG}/nivel.png"
 NIVEL_PACK_IMG: "PathLike" = f"{MENUS_IMG}/nivel_pack.png"
@@ -36,8 +42,23 @@ class DirectorioNoExiste(FileNotFoundError):
     "Cuando un directorio que se busca no existe en realidad."
 
 
+class EntradaNivel(NamedTuple):
+    "Una entrada del índice de niveles que se puede elegir en el menú."
+
+    titulo: str
+    pack: str
+    niveles: tuple["PathLike", ...]
+    es_pack: bool
+    en_raiz: bool # Si se muestra cuando no se está buscando nada
+    clave: str # Texto en minúsculas sobre el que se busca
+
+
 class MenuCargar(SuperMenu):
-    "Clase del menú de cargar niveles."
+    """
+    Clase del menú de cargar niveles.
+    Sólo existen los botones de las filas visibles; al desplazarse o buscar se reciclan
+    cambiándoles el título, el ícono y a qué entrada del índice apuntan.
+    """
 
     def __init__(self, juego_handler: "JuegoHandler") -> None:
         """
@@ -50,28 +71,42 @@ class MenuCargar(SuperMenu):
         super().__init__(juego_handler)
 
         self.btn_volver: Optional["Button"] = None
-        self.botones_niveles: BotonesNiveles = {}
+        self.caja_busqueda: Optional["TextInput"] = None
+        self.etiqueta_pagina: Optional["Label"] = None
+        self.botones_niveles: BotonesNiveles = []
+        self.catalogo: CatalogoNiveles = CatalogoNiveles(RUTA_NIVELES,
+                                                         logger=self.juego_handler.logger)
+        self._iconos: dict[tuple["PathLike", float], BaseImage] = {}
+        self.miniaturas: GeneradorMiniaturas = GeneradorMiniaturas(
+            logger=self.juego_handler.logger
+        )
+
+        # -- Índice en memoria --
+        self.indice: IndiceNiveles = []
+        self.filtrados: IndiceNiveles = []
+        self.busqueda: str = ""
+        self.desplazamiento: int = 0
+        # -----------------------
 
 
     def _actualizar_volver_btn(self) -> None:
         "Actualiza la imagen para volver del menú."
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_icon = alto * 0.05
 
         self.btn_volver.translate(ancho * 0.75, -(alto * 0.1))
 
         dec_volver = self.btn_volver.get_decorator()
         dec_volver.add_baseimage(-(ancho * 0.095), (alto * 0.002),
-                                 BaseImage(ARROW_LEFT_IMG_PATH).resize(tam_icon * 1.2, tam_icon),
+                                 imagen_menu(ARROW_LEFT_IMG_PATH).resize(tam_icon * 1.2, tam_icon),
                                  centered=True)
 
 
     def get_super_kwargs(self) -> "KwargsDict":
         "Devuelve el diccionario de argumentos a usar en la clase madre."
 
-        pantalla = get_surface()
-        ancho, alto = pantalla.get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         return dict(title="Cargar Niveles",
                     width=ancho,
@@ -82,34 +117,80 @@ class MenuCargar(SuperMenu):
                     theme=TemaFresh())
 
 
-    def _dir_es_compatible(self, directorio: Path) -> bool:
+    def _get_icono(self, ruta_img: "PathLike", tam: float) -> BaseImage:
         """
-        Decide si un directorio es un archivo de nivel válido.
+        Devuelve el ícono de un botón, cargándolo sólo la primera vez que se pide
+        con ese tamaño.
         -
-        'directorio': La ruta en cuestión.
+        'ruta_img': La ruta de la imagen del ícono.
+
+        'tam': El tamaño (ancho y alto) del ícono.
         """
 
-        return directorio.is_file() and directorio.suffix.lower() == NIVEL_EXT
+        clave = (ruta_img, tam)
+        if clave not in self._iconos:
+            self._iconos[clave] = imagen_menu(ruta_img).resize(tam, tam)
 
+        return self._iconos[clave]
 
-    def _dir_habitado(self, directorio: Path) -> bool:
+
+    def _get_icono_entrada(self, entrada: EntradaNivel, tam: float) -> BaseImage:
         """
-        Decide si un directorio no está vacío y contine archivos de niveles válidos.
+        Devuelve el ícono de una entrada: la miniatura del nivel si ya está lista, o el
+        ícono genérico mientras tanto.
         -
-        'directorio': La ruta en cuestión.
+        'entrada': La entrada del índice.
+
+        'tam': El alto del ícono.
         """
 
-        for arch in directorio.iterdir():
-            if self._dir_es_compatible(arch):
-                return True
+        if entrada.es_pack:
+            return self._get_icono(NIVEL_PACK_IMG, tam)
 
-        return False
+        ruta_nivel = entrada.niveles[0]
+        info = self.catalogo.info(ruta_nivel)
+        ruta_png = self.miniaturas.pedir(ruta_nivel, (info["mtime"] if info is not None else 0))
+        if ruta_png is None:
+            return self._get_icono(NIVEL_IMG, tam)
 
+        clave = (ruta_png, tam)
+        if clave not in self._iconos:
+            miniatura = BaseImage(ruta_png)
+            ancho_min, alto_min = miniatura.get_size()
+            self._iconos[clave] = miniatura.resize(min(tam * ancho_min / alto_min, tam * 2.5),
+                                                   tam)
 
-    def cargar_botones(self) -> None:
-        "Carga los botones de niveles."
+        return self._iconos[clave]
 
-        self.actualizar_rutas_niveles(RUTA_NIVELES)
+
+    def _crear_widgets(self) -> None:
+        "Crea por única vez la caja de búsqueda, las filas de botones y la navegación."
+
+        ancho, alto = METRICAS_PANTALLA.tam
+
+        self.caja_busqueda = self.add.text_input(
+            title="Buscar: ",
+            default="",
+            input_type=INPUT_TEXT,
+            textinput_id="buscar_nivel",
+            onchange=self._procesar_busqueda
+        )
+
+        for i in range(FILAS_VISIBLES):
+            self.botones_niveles.append(self.add.button(
+                "",
+                self._elegir_fila,
+                i,
+                button_id=f"btn_nivel_{i}"
+            ))
+
+        self.etiqueta_pagina = self.add.label(
+            title="",
+            label_id="lbl_pagina",
+            font_size=int(alto * 0.03),
+            float=True,
+            float_origin_position=True
+        ).translate(ancho * 0.62, alto * 0.02)
 
         self.btn_volver = self.add.button(
             title="Volver",
@@ -120,78 +201,225 @@ class MenuCargar(SuperMenu):
         self._actualizar_volver_btn()
 
 
+    def cargar_botones(self) -> None:
+        "Carga los botones de niveles."
+
+        if not self.botones_niveles:
+            self._crear_widgets()
+
+        self.actualizar_rutas_niveles(RUTA_NIVELES)
+
+
     def actualizar_rutas_niveles(self,
                                  ruta_madre: "PathLike",
                                  purgar: bool=True) -> None:
         """
-        Carga todas las rutas de niveles que encuentra bajo el directorio especificado.
+        Arma el índice en memoria con todas las rutas de niveles que encuentra bajo el
+        directorio especificado, y refresca las filas visibles.
         -
         'ruta_madre': El directorio donde buscar.
 
-        'purgar': Si eliminar preventivamente todos los widgets que habían antes.
+        'purgar': Si descartar preventivamente todas las entradas que había antes.
         """
 
-        if purgar:
-            self.clear()
-
         ruta = Path(ruta_madre)
 
         if not ruta.exists():
             raise DirectorioNoExiste(f"Directorio especificado '{ruta.as_posix()}' no encontrado.")
 
-        ancho, alto = get_surface().get_size()
-        tam_icono = alto * 0.075
+        if self.catalogo.ruta_madre != ruta:
+            self.catalogo = CatalogoNiveles(ruta, logger=self.juego_handler.logger)
+        self.catalogo.actualizar()
+
+        if purgar:
+            self.indice = []
+
+        self.indice.extend(self._generar_indice(ruta))
+        self.busqueda = ""
+        if self.caja_busqueda is not None:
+            self.caja_busqueda.set_value("")
+
+        self.filtrados = self._filtrar(self.indice, self.busqueda)
+        self.desplazamiento = 0
+        self._refrescar_filas()
+
+
+    def _titulo_de(self, ruta_nivel: "PathLike") -> str:
+        """
+        Devuelve el título catalogado de un nivel, o el nombre de su archivo si no lo hay.
+        -
+        'ruta_nivel': La ruta del nivel.
+        """
+
+        info = self.catalogo.info(ruta_nivel)
+        return (info["titulo"] if info is not None else Path(ruta_nivel).name)
+
+
+    def _generar_indice(self, ruta: Path) -> IndiceNiveles:
+        """
+        Genera las entradas del índice a partir del catálogo: los packs y niveles sueltos
+        de la raíz, y además cada nivel dentro de un pack para poder buscarlo aparte.
+        -
+        'ruta': El directorio raíz de los niveles.
+        """
+
+        indice = []
+
+        for ruta_dir in self.catalogo.subdirectorios(ruta):
+            niveles = self.catalogo.niveles_en(ruta_dir)
+            if not niveles:
+                continue
+
+            pack = Path(ruta_dir).name
+            indice.append(EntradaNivel(f"{pack}/", pack, niveles, True, True, pack.lower()))
+            for ruta_nivel in niveles:
+                titulo = self._titulo_de(ruta_nivel)
+                indice.append(EntradaNivel(f"{pack}/{Path(ruta_nivel).name}", pack,
+                                           (ruta_nivel,), False, False,
+                                           f"{titulo} {pack}".lower()))
+
+        for ruta_nivel in self.catalogo.niveles_en(ruta):
+            nombre = Path(ruta_nivel).name
+            titulo = self._titulo_de(ruta_nivel)
+            indice.append(EntradaNivel(nombre, "", (ruta_nivel,), False, True,
+                                       f"{titulo} {nombre}".lower()))
 
-        for direc in ruta.iterdir():
-            if direc.is_dir() and self._dir_habitado(direc):
-                self.botones_niveles[direc.name] = self.add.button(
-                    title=f"{direc.name}/",
-                    action=self.juego_handler.iniciar_juego,
-                    button_id=f"btn_dir_{direc.name}",
-                    accept_kwargs=True,
-                    niveles=self._inspeccionar_dir_niveles(direc)
-                )
-                ruta_img = NIVEL_PACK_IMG
-
-            elif self._dir_es_compatible(direc):
-                self.botones_niveles[direc.name] = self.add.button(
-                    title=direc.name,
-                    action=self.juego_handler.iniciar_juego,
-                    button_id=f"btn_file_{direc.name}",
-                    accept_kwargs=True,
-                    niveles=(direc.as_posix(),)
-                )
-                ruta_img = NIVEL_IMG
+        return indice
 
+
+    @staticmethod
+    def _filtrar(entradas: IndiceNiveles, busqueda: str) -> IndiceNiveles:
+        """
+        Filtra las entradas que coinciden con la búsqueda. Sin búsqueda, sólo quedan las
+        entradas de la raíz.
+        -
+        'entradas': Las entradas a filtrar.
+
+        'busqueda': El texto buscado, en minúsculas.
+        """
+
+        if not busqueda:
+            return [entrada for entrada in entradas if entrada.en_raiz]
+
+        palabras = busqueda.split()
+        return [entrada for entrada in entradas
+                if all(palabra in entrada.clave for palabra in palabras)]
+
+
+    def _procesar_busqueda(self, texto: str, **_kwargs) -> None:
+        """
+        Refiltra el índice cuando cambia el texto de búsqueda. Si sólo se agregó texto
+        al final, se filtra sobre los resultados anteriores en vez del índice entero.
+        -
+        'texto': El contenido de la caja de búsqueda.
+
+        '**kwargs': Argumentos desconocidos que entraron en el callback.
+        """
+
+        nueva = " ".join(texto.lower().split())
+        if nueva == self.busqueda:
+            return
+
+        base = (self.filtrados if self.busqueda and nueva.startswith(self.busqueda)
+                else self.indice)
+        self.busqueda = nueva
+        self.filtrados = self._filtrar(base, nueva)
+        self.desplazamiento = 0
+        self._refrescar_filas()
+
+
+    def desplazar(self, cuanto: int) -> None:
+        """
+        Desplaza las filas visibles sobre las entradas filtradas.
+        -
+        'cuanto': Cuántas filas desplazarse. Si es negativo, se desplaza hacia arriba.
+        """
+
+        maximo = max(len(self.filtrados) - FILAS_VISIBLES, 0)
+        nuevo = min(max(self.desplazamiento + cuanto, 0), maximo)
+        if nuevo != self.desplazamiento:
+            self.desplazamiento = nuevo
+            self._refrescar_filas()
+
+
+    def _refrescar_filas(self) -> None:
+        "Recicla los botones visibles para que muestren las entradas actuales."
+
+        ancho, alto = METRICAS_PANTALLA.tam
+        tam_icono = alto * 0.075
+
+        for i, boton in enumerate(self.botones_niveles):
+            ind = self.desplazamiento + i
+            if ind >= len(self.filtrados):
+                boton.hide()
+                continue
+
+            entrada = self.filtrados[ind]
+            boton.set_title(entrada.titulo)
+            boton.show()
+
+            icono = self._get_icono_entrada(entrada, tam_icono)
+            ancho_icono, _ = icono.get_size()
+            decorador = boton.get_decorator()
+            decorador.remove_all()
+            decorador.add_baseimage(
+                -(boton.get_width() * 0.5 + ancho * 0.03 + (ancho_icono - tam_icono) * 0.5), 0,
+                icono,
+                centered=True,
+            )
+
+        if self.etiqueta_pagina is not None:
+            total = len(self.filtrados)
+            if total > FILAS_VISIBLES:
+                hasta = min(self.desplazamiento + FILAS_VISIBLES, total)
+                self.etiqueta_pagina.set_title(f"{self.desplazamiento + 1}-{hasta} de {total}")
+            elif total == 0:
+                self.etiqueta_pagina.set_title("Sin resultados")
             else:
-                ruta_img = None
+                self.etiqueta_pagina.set_title("")
 
 
-            if ruta_img is not None:
-                dec_btn = self.botones_niveles[direc.name].get_decorator()
-                dec_btn.add_baseimage(
-                    -(self.botones_niveles[direc.name].get_width() * 0.5 + ancho * 0.03), 0,
-                    BaseImage(ruta_img).resize(tam_icono, tam_icono),
-                    centered=True,
-                )
+    def _elegir_fila(self, fila: int) -> None:
+        """
+        Inicia el juego con la entrada que muestra una fila.
+        -
+        'fila': El número de fila visible elegida.
+        """
 
+        ind = self.desplazamiento + fila
+        if ind < len(self.filtrados):
+            self.juego_handler.iniciar_juego(self.filtrados[ind].niveles)
 
-    def _inspeccionar_dir_niveles(self, ruta_niv: Path) -> tuple["PathLike", ...]:
+
+    def update(self, events: "EventVectorType") -> bool:
         """
-        Inspecciona y devuelve una tupla de todas las rutas compatibles
-        de niveles.
+        Actualiza el menú, desplazando las filas con la rueda del mouse o con
+        'RePág'/'AvPág'.
         -
-        'ruta_niv': Un objeto de ruta que contiene directorios dentro, los cuales son los
-                    que se analizan.
+        'events': Los eventos con los que actualizar el menú.
         """
 
-        lista_rutas = []
+        for ev in events:
+            if ev.type == MOUSEWHEEL:
+                self.desplazar(-ev.y)
+
+            elif ev.type == KEYDOWN and ev.key == K_PAGEUP:
+                self.desplazar(-FILAS_VISIBLES)
+
+            elif ev.type == KEYDOWN and ev.key == K_PAGEDOWN:
+                self.desplazar(FILAS_VISIBLES)
+
+        listas = self.miniaturas.recoger()
+        if listas and any(entrada.niveles[0] in listas for entrada in self._entradas_visibles()):
+            self._refrescar_filas()
+
+        return super().update(events)
 
-        for direc in ruta_niv.iterdir():
-            if self._dir_es_compatible(direc):
-                lista_rutas.append(direc.as_posix())
 
-        return tuple(lista_rutas)
+    def _entradas_visibles(self) -> IndiceNiveles:
+        "Devuelve las entradas que muestran actualmente las filas visibles."
+
+        return self.filtrados[self.desplazamiento:self.desplazamiento + FILAS_VISIBLES]
 
 
     def dibujar_titulo_cargar_nv(self, superficie: "Surface") -> None:
@@ -203,12 +431,35 @@ class MenuCargar(SuperMenu):
         'superficie': La superficie sobre la que dibujar.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         self.dibujar_titulo(superficie,
                             (ancho * 0.4, alto * 0.0),
                             (ancho * 0.5, alto * 0.4))
 
 
+    def conservar(self, anterior: "SuperMenu") -> None:
+        """
+        Si el menú anterior ya mostraba niveles, vuelve a cargarlos con la misma búsqueda
+        y desplazamiento.
+        -
+        'anterior': La instancia que se reemplaza.
+        """
+
+        if not isinstance(anterior, MenuCargar) or not anterior.botones_niveles:
+            return
+
+        self.cargar_botones()
+        self.caja_busqueda.set_value(anterior.busqueda)
+        self._procesar_busqueda(anterior.busqueda)
+        self.desplazar(anterior.desplazamiento)
+
+
+    def cerrar(self) -> None:
+        "Termina el hilo que genera las miniaturas de los niveles."
+
+        self.miniaturas.cerrar()
+
+
     def draw(self, surface: Optional["Surface"]=None, clear_surface: bool=False) -> "Menu":
         """
         Dibuja el menú de cargar niveles.
@@ -5,18 +5,17 @@ Módulo de menú de controles.
 from typing import TYPE_CHECKING, Optional, TypeAlias, Union
 
 from pygame.constants import K_ESCAPE, KEYDOWN, NOEVENT, USEREVENT
-from pygame.display import get_surface
 from pygame.event import Event, post
 from pygame.event import wait as ev_wait
 from pygame.key import name as key_name
-from pygame_menu import BaseImage
 from pygame_menu.widgets import Label
 
 from ....controlador.controles import TiposAccion
 from ....controlador.eventos import EventosJuego
+from ....modelo.utils import METRICAS_PANTALLA
 from ...fuentes import FuenteMinecraftia
 from ...temas import TemaFresh
-from ..supermenu import SuperMenu, MENUS_IMG
+from ..supermenu import MENUS_IMG, SuperMenu, imagen_menu
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -121,7 +120,7 @@ class MenuControles(SuperMenu):
         'contenido': El texto de la descripción
         """
 
-        _, alto = get_surface().get_size()
+        _, alto = METRICAS_PANTALLA.tam
 
         desc = self.add.label(
             title=contenido,
@@ -190,7 +189,7 @@ class MenuControles(SuperMenu):
     def _actualizar_desc_pos(self) -> None:
         "Actualiza la etiqueta de descripción."
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         for i, linea in enumerate(self.descripcion):
             linea.translate(ancho * 0.3, (i + 1) * alto * 0.03)
@@ -199,14 +198,14 @@ class MenuControles(SuperMenu):
     def _actualizar_volver_btn(self) -> None:
         "Actualiza la imagen para volver del menú."
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_icon = alto * 0.05
 
         self.btn_volver.translate(ancho * 0.06, alto * 0.01)
 
         dec_volver = self.btn_volver.get_decorator()
         dec_volver.add_baseimage(-(ancho * 0.075), (alto * 0.002),
-                                 BaseImage(ARROW_LEFT_IMG_PATH).resize(tam_icon * 1.2, tam_icon),
+                                 imagen_menu(ARROW_LEFT_IMG_PATH).resize(tam_icon * 1.2, tam_icon),
                                  centered=True)
 
 
@@ -275,7 +274,7 @@ class MenuControles(SuperMenu):
         'accion': El nombre de la acción a cambiar.
         """
 
-        _, alto = get_surface().get_size()
+        _, alto = METRICAS_PANTALLA.tam
 
         btn = self.widgets_controles[accion][AGREGAR]
         btn.set_title(ESPERANDO)
@@ -308,7 +307,7 @@ class MenuControles(SuperMenu):
     def _reposicionar_teclas_quitar(self) -> None:
         "Intenta mover las teclas de quitar, para que queden alineadas."
 
-        _, alto = get_surface().get_size()
+        _, alto = METRICAS_PANTALLA.tam
         # pylint: disable=consider-using-dict-items
         botones_quitar = [self.widgets_controles[accion][QUITAR]
                          for accion in self.widgets_controles]
@@ -328,7 +327,7 @@ class MenuControles(SuperMenu):
         'accion': El nombre de la acción a cambiar.
         """
 
-        _, alto = get_surface().get_size()
+        _, alto = METRICAS_PANTALLA.tam
         controles_dict = self.juego_handler.controles.controles
         btn_agregar = self.widgets_controles[accion][AGREGAR]
         mensaje = ""
@@ -359,7 +358,7 @@ class MenuControles(SuperMenu):
     def get_super_kwargs(self) -> "KwargsDict":
         "Devuelve el diccionario de argumentos a usar en la clase madre."
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         cant_acciones = len(TiposAccion)
 
         return dict(title="Controles",
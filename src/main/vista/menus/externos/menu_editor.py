@@ -4,11 +4,12 @@ Menú para el editor de niveles.
 
 from typing import TYPE_CHECKING, Any
 
-from pygame.display import get_surface
 from pygame_menu._types import Optional
 from pygame_menu.locals import INPUT_TEXT
 
 from ....controlador.editor import PosicionesMensajesEditor
+from ....modelo.niveles import ErrorFormatoNivel
+from ....modelo.utils import METRICAS_PANTALLA
 from ...fuentes import FuenteMinecraftia
 from ...temas import TemaEditor
 from ..supermenu import SuperMenu
@@ -43,7 +44,7 @@ class MenuEditor(SuperMenu):
 
         self.nombre_nivel: str = "Nivel de Prueba"
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         tam_mensajes = int(alto * 0.015)
         borde_izq_dif = -(ancho * 0.1)
@@ -91,7 +92,7 @@ class MenuEditor(SuperMenu):
             font_name=FuenteMinecraftia(tam=tam_mensajes)
         ).translate(borde_izq_dif, alto * 0.0)
         self.mensaje_escape: "Label" = self.add.label(
-            title="TECLA 'ESCAPE' para salir.",
+            title="TECLA 'ESCAPE' para salir, 'F5' para probar el nivel.",
             label_id="ids_escape",
             float=True,
             float_origin_position=True,
@@ -220,6 +221,12 @@ class MenuEditor(SuperMenu):
                 "de niveles",
                 PosicionesMensajesEditor.INFO_ARRIBA
             )
+        except ErrorFormatoNivel as exc:
+            self.juego_handler.editor_handler.refrescar_mensaje(f"Nivel mal formado en "
+                f"línea {exc.linea}, columna {exc.columna}",
+                PosicionesMensajesEditor.INFO_ARRIBA
+            )
+            self.juego_handler.logger.warning(str(exc))
 
 
     def _exportar_nivel(self) -> None:
@@ -231,8 +238,7 @@ class MenuEditor(SuperMenu):
     def get_super_kwargs(self) -> "KwargsDict":
         "Devuelve el diccionario de argumentos a usar en la clase madre."
 
-        pantalla = get_surface()
-        ancho, alto = pantalla.get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         return dict(title="",
                     width=ancho,
@@ -250,7 +256,7 @@ class MenuEditor(SuperMenu):
         'superficie': La superficie sobre la que dibujar.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         mx, my = self.juego_handler.editor_handler.mouse
         fuente = FuenteMinecraftia(tam=int(alto * 0.02))
         fuente_grande = FuenteMinecraftia(tam=int(alto * 0.025))
@@ -280,6 +286,18 @@ class MenuEditor(SuperMenu):
                 superficie.blit(fuente_grande_img, (ancho * 0.15, alto * 0.2))
 
 
+    def conservar(self, anterior: "SuperMenu") -> None:
+        """
+        Conserva el nombre del nivel escrito en el menú anterior.
+        -
+        'anterior': La instancia que se reemplaza.
+        """
+
+        if isinstance(anterior, MenuEditor):
+            self.nombre_nivel = anterior.nombre_nivel
+            self.caja_nombre.set_value(self.nombre_nivel)
+
+
     def draw(self, surface: Optional["Surface"]=None, clear_surface: bool=False) -> "Menu":
         """
         Dibuja el menú del editor.
@@ -4,12 +4,10 @@ Módulo de menú de opciones.
 
 from typing import TYPE_CHECKING, Optional
 
-from pygame.display import get_surface
-from pygame_menu import BaseImage
-
+from ....modelo.utils import METRICAS_PANTALLA
 from ...fuentes import FuenteMinecraftia
 from ...temas import TemaFresh
-from ..supermenu import MENUS_IMG, SuperMenu
+from ..supermenu import MENUS_IMG, SuperMenu, imagen_menu
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -44,7 +42,7 @@ class MenuOpciones(SuperMenu):
 
         super().__init__(juego_handler)
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         min_slid, max_slid = (0, 100)
 
         blanco = "#ffffff"
@@ -121,7 +119,7 @@ class MenuOpciones(SuperMenu):
     def get_super_kwargs(self) -> "KwargsDict":
         "Devuelve el diccionario de argumentos a usar en la clase madre."
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         return dict(title="Opciones",
                     width=ancho,
@@ -140,7 +138,7 @@ class MenuOpciones(SuperMenu):
                   utiliza el que encuentra en el controlador del juego.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_icon = alto * 0.075
         dec_audio = self.audio_switch.get_decorator()
 
@@ -152,7 +150,7 @@ class MenuOpciones(SuperMenu):
 
         self._sfx_img_id = dec_audio.add_baseimage(
             -(ancho * 0.236), 0,
-            BaseImage(AUDIO_ON_PATH if estado
+            imagen_menu(AUDIO_ON_PATH if estado
                       else AUDIO_OFF_PATH).resize(tam_icon, tam_icon),
             centered=True
         )
@@ -187,7 +185,7 @@ class MenuOpciones(SuperMenu):
                      que encuentra en el controlador del juego.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_icon = alto * 0.075
         dec_vol = self.vol_slider.get_decorator()
 
@@ -199,7 +197,7 @@ class MenuOpciones(SuperMenu):
 
         self._vol_img_id = dec_vol.add_baseimage(
             -(ancho * 0.29), 0,
-            BaseImage(VOL_ON_PATH if nuevo_vol > 0.0
+            imagen_menu(VOL_ON_PATH if nuevo_vol > 0.0
                       else VOL_OFF_PATH).resize(tam_icon, tam_icon),
             centered=True
         )
@@ -219,22 +217,22 @@ class MenuOpciones(SuperMenu):
     def _actualizar_controles_img(self) -> None:
         "Actualiza la imagen para abrir el menú de controles."
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_icon = alto * 0.07
         dec_controles = self.btn_controles.get_decorator()
 
         dec_controles.add_baseimage(-(ancho * 0.135), (alto * 0.007),
-                                 BaseImage(CONTROLS_PATH).resize(tam_icon * 1.3, tam_icon),
+                                 imagen_menu(CONTROLS_PATH).resize(tam_icon * 1.3, tam_icon),
                                  centered=True)
 
 
     def _actualizar_volver_img(self) -> None:
         "Actualiza la imagen para volver del menú."
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_icon = alto * 0.075
         dec_volver = self.btn_volver.get_decorator()
 
         dec_volver.add_baseimage(-(ancho * 0.1), (alto * 0.007),
-                                 BaseImage(BACK_IMG_PATH).resize(tam_icon, tam_icon),
+                                 imagen_menu(BACK_IMG_PATH).resize(tam_icon, tam_icon),
                                  centered=True)
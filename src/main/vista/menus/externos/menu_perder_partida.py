@@ -2,14 +2,11 @@
 Módulo para la ventana de perder una partida.
 """
 
-
 from typing import TYPE_CHECKING
 
-from pygame.display import get_surface
-from pygame_menu import BaseImage
-
+from ....modelo.utils import METRICAS_PANTALLA
 from ...temas import TemaFresh
-from ..supermenu import SuperMenu
+from ..supermenu import SuperMenu, imagen_menu
 from .menu_controles import ARROW_LEFT_IMG_PATH
 from .menu_opciones import BACK_IMG_PATH
 from .menu_principal import EXIT_IMG_PATH
@@ -51,17 +48,17 @@ class MenuPerderPartida(SuperMenu):
         dec_volver = self.btn_volver.get_decorator()
         dec_salir = self.btn_salir.get_decorator()
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_icon = alto * 0.075
 
         dec_jugar.add_baseimage(-(ancho * 0.1855), 0,
-                                BaseImage(PLAY_AGAIN_IMG_PATH).resize(tam_icon, tam_icon),
+                                imagen_menu(PLAY_AGAIN_IMG_PATH).resize(tam_icon, tam_icon),
                                 centered=True)
         dec_volver.add_baseimage(-(ancho * 0.27), -(alto * 0.01),
-                                 BaseImage(GO_BACK_IMG_PATH).resize(tam_icon, tam_icon),
+                                 imagen_menu(GO_BACK_IMG_PATH).resize(tam_icon, tam_icon),
                                  centered=True)
         dec_salir.add_baseimage(-(ancho * 0.1775), -(alto * 0.01),
-                                BaseImage(EXIT_IMG_PATH).resize(tam_icon, tam_icon).flip(x=True,
+                                imagen_menu(EXIT_IMG_PATH).resize(tam_icon, tam_icon).flip(x=True,
                                                                                          y=False),
                                 centered=True)
 
@@ -69,8 +66,7 @@ class MenuPerderPartida(SuperMenu):
     def get_super_kwargs(self) -> "KwargsDict":
         "Devuelve el diccionario de argumentos a usar en la clase madre."
 
-        pantalla = get_surface()
-        ancho, alto = pantalla.get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         return dict(title="¡Has perdido!",
                     width=ancho * 0.55,
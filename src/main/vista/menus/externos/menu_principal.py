@@ -4,12 +4,10 @@ Módulo de menú principal.
 
 from typing import TYPE_CHECKING, Optional
 
-from pygame.display import get_surface
-from pygame_menu import BaseImage
-
+from ....modelo.utils import METRICAS_PANTALLA
 from ...fuentes import FuenteMinecraftia
 from ...temas import TemaFresh
-from ..supermenu import MENUS_IMG, SuperMenu
+from ..supermenu import MENUS_IMG, SuperMenu, imagen_menu
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -53,7 +51,7 @@ class MenuPrincipal(SuperMenu):
         self.btn_salir: "Button" = self.add.button(title="Salir",
                                                    action=self.juego_handler.salir)
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         self.msg_version: "Label" = self.add.label(
             title=f"v{self.juego_handler.version_str}",
@@ -72,19 +70,19 @@ class MenuPrincipal(SuperMenu):
         tam_icon = alto * 0.075
 
         dec_jugar.add_baseimage(-(ancho * 0.092), 0,
-                                BaseImage(PLAY_IMG_PATH).resize(tam_icon, tam_icon),
+                                imagen_menu(PLAY_IMG_PATH).resize(tam_icon, tam_icon),
                                 centered=True)
         dec_cargar.add_baseimage(-(ancho * 0.105), 0,
-                                BaseImage(LOAD_IMG_PATH).resize(tam_icon * 1.1, tam_icon),
+                                imagen_menu(LOAD_IMG_PATH).resize(tam_icon * 1.1, tam_icon),
                                 centered=True)
         dec_editor.add_baseimage(-(ancho * 0.09), 0,
-                                 BaseImage(EDITOR_IMG_PATH).resize(tam_icon * 1.2, tam_icon),
+                                 imagen_menu(EDITOR_IMG_PATH).resize(tam_icon * 1.2, tam_icon),
                                    centered=True)
         dec_opciones.add_baseimage(-(ancho * 0.125), 0,
-                                   BaseImage(COG_IMG_PATH).resize(tam_icon * 1.1, tam_icon),
+                                   imagen_menu(COG_IMG_PATH).resize(tam_icon * 1.1, tam_icon),
                                    centered=True)
         dec_salir.add_baseimage(-(ancho * 0.078), 0,
-                                BaseImage(EXIT_IMG_PATH).resize(tam_icon, tam_icon).flip(x=True,
+                                imagen_menu(EXIT_IMG_PATH).resize(tam_icon, tam_icon).flip(x=True,
                                                                                          y=False),
                                 centered=True)
 
@@ -92,8 +90,7 @@ class MenuPrincipal(SuperMenu):
     def get_super_kwargs(self) -> "KwargsDict":
         "Devuelve el diccionario de argumentos a usar en la clase madre."
 
-        pantalla = get_surface()
-        ancho, alto = pantalla.get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         return dict(title="Menú Principal",
                     width=ancho,
@@ -113,7 +110,7 @@ class MenuPrincipal(SuperMenu):
         'superficie': La superficie sobre la que dibujar.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         self.dibujar_titulo(superficie,
                             (ancho * 0.4, alto * 0.0),
                             (ancho * 0.5, alto * 0.4))
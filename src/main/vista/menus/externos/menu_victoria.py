@@ -4,11 +4,9 @@ Módulo de menú de victoria.
 
 from typing import TYPE_CHECKING
 
-from pygame.display import get_surface
-from pygame_menu import BaseImage
-
+from ....modelo.utils import METRICAS_PANTALLA
 from ...temas import TemaFresh
-from ..supermenu import SuperMenu
+from ..supermenu import SuperMenu, imagen_menu
 from .menu_principal import PLAY_IMG_PATH
 from .menu_controles import ARROW_LEFT_IMG_PATH
 
@@ -44,15 +42,15 @@ class MenuVictoria(SuperMenu):
         dec_jugar = self.btn_jugar.get_decorator()
         btn_volver_menu_ppal = self.btn_volver_menu_ppal.get_decorator()
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_icon = alto * 0.075
 
         dec_jugar.add_baseimage(-(ancho * 0.187), -(alto * 0.01),
-                                BaseImage(PLAY_IMG_PATH).resize(tam_icon, tam_icon),
+                                imagen_menu(PLAY_IMG_PATH).resize(tam_icon, tam_icon),
                                 centered=True)
         btn_volver_menu_ppal.add_baseimage(
             -(ancho * 0.27), -(alto * 0.01),
-            BaseImage(ARROW_LEFT_IMG_PATH).resize(tam_icon, tam_icon),
+            imagen_menu(ARROW_LEFT_IMG_PATH).resize(tam_icon, tam_icon),
             centered=True)
 
         self.actualizar_etiqueta_trofeos()
@@ -60,8 +58,7 @@ class MenuVictoria(SuperMenu):
     def get_super_kwargs(self) -> "KwargsDict":
         "Devuelve el diccionario de argumentos a usar en la clase madre."
 
-        pantalla = get_surface()
-        ancho, alto = pantalla.get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         return dict(title="¡Has ganado!",
                     width=ancho * 0.55,
@@ -6,17 +6,17 @@ from math import pi
 from typing import TYPE_CHECKING
 
 from pygame import Rect
-from pygame.display import get_surface
 from pygame.draw import arc
-from pygame.image import load as img_load
 from pygame.transform import scale
-from pygame_menu import BaseImage
 from pygame_menu._types import Optional
 from pygame_menu.menu import Menu
 
+from ....controlador.archivos import RECURSOS
+from ....modelo.utils import METRICAS_PANTALLA
+from ...dibujo import CapasDibujo
 from ...fuentes import FuenteMinecraftia
 from ...temas import TemaEditor
-from ..supermenu import SuperMenu
+from ..supermenu import SuperMenu, imagen_menu
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from pygame_menu.widgets import Button, Label
 
     from ....controlador.estado import JuegoHandler
+    from ....modelo.jugador import FotoJugador
     from ..supermenu import KwargsDict
 
 # ----- Imágenes -----
@@ -58,7 +59,10 @@ class MenuNivel(SuperMenu):
 
         super().__init__(juego_handler)
 
-        ancho, alto = get_surface().get_size()
+        # Los corazones ya escalados, por imagen y tamaño
+        self._corazones: dict[tuple["PathLike", int], "Surface"] = {}
+
+        ancho, alto = METRICAS_PANTALLA.tam
         nivel = self.juego_handler.nivel
         tam_icono = alto * 0.05
 
@@ -83,14 +87,14 @@ class MenuNivel(SuperMenu):
         dec_trofeos = self.trofeos.get_decorator()
 
         dec_trofeos.add_baseimage(-(ancho * 0.045), -(alto * 0.005),
-                                  BaseImage(TROFEO).resize(tam_icono, tam_icono),
+                                  imagen_menu(TROFEO).resize(tam_icono, tam_icono),
                                   centered=True)
 
 
     def actualizar_widgets(self) -> None:
         "Cambia algunos atributos de los widgets cuando se inicia un nivel."
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         nivel = self.juego_handler.nivel
 
         self.titulo_nivel.set_title(nivel.titulo)
@@ -105,8 +109,7 @@ class MenuNivel(SuperMenu):
     def get_super_kwargs(self) -> "KwargsDict":
         "Devuelve el diccionario de argumentos a usar en la clase madre."
 
-        pantalla = get_surface()
-        ancho, alto = pantalla.get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
         return dict(title="",
                     width=ancho,
@@ -117,17 +120,19 @@ class MenuNivel(SuperMenu):
                     theme=TemaEditor())
 
 
-    def dibujar_anillos_stamina(self, superficie: "Surface") -> None:
+    def dibujar_anillos_stamina(self, superficie: "Surface", foto: "FotoJugador") -> None:
         """
         Dibuja los anillos que indican el cooldown de algunas habilidades.
         -
         'superficie': La superficie sobre la que dibujar.
+
+        'foto': La foto del jugador en el frame actual.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
 
-        salto = self.juego_handler.juego.jugador.salto_cooldown
-        dash = self.juego_handler.juego.jugador.dash_cooldown
+        salto = foto.salto_cooldown
+        dash = foto.dash_cooldown
         start = (0.5 * pi)
         stop = (2.1 * pi)
         grosor = int(alto * 0.005)
@@ -135,41 +140,61 @@ class MenuNivel(SuperMenu):
         anillo_grande = alto * 0.1045
 
         arc(superficie,
-            color=(COLOR_SALTO if salto.esta_contando() else COLOR_SALTO_ACTIVO),
+            color=(COLOR_SALTO if salto > 0.0 else COLOR_SALTO_ACTIVO),
             rect=Rect(ancho * 0.0157, alto * 0.028,
                       anillo_grande, anillo_grande),
             width=grosor,
             start_angle=start,
-            stop_angle=(start + ((stop - start) * (1.0 - salto.porcentaje()))))
+            stop_angle=(start + ((stop - start) * (1.0 - salto))))
 
         arc(superficie,
-            color=(COLOR_DASH if dash.esta_contando() else COLOR_DASH_ACTIVO),
+            color=(COLOR_DASH if dash > 0.0 else COLOR_DASH_ACTIVO),
             rect=Rect(ancho * 0.01877, alto * 0.03333335,
                       anillo_chico, anillo_chico),
             width=grosor,
             start_angle=start,
-            stop_angle=(start + ((stop - start) * (1.0 - dash.porcentaje()))))
+            stop_angle=(start + ((stop - start) * (1.0 - dash))))
 
 
-    def dibujar_corazones(self, superficie: "Surface") -> None:
+    def _corazon(self, ruta: "PathLike", tam: int) -> "Surface":
         """
-        Dibuja los corazones de vida.
+        Devuelve la imagen de un corazón escalada, escalándola sólo la primera vez.
         -
-        'superficie': La superficie sobre la que dibujar.
+        'ruta': La ruta de la imagen.
+
+        'tam': El tamaño del corazón, en píxeles.
+        """
+
+        cor = self._corazones.get((ruta, tam))
+        if cor is None:
+            cor = scale(RECURSOS.imagen(ruta), (tam, tam))
+            self._corazones[(ruta, tam)] = cor
+
+        return cor
+
+
+    def dibujar_corazones(self, superficie: "Surface", foto: "FotoJugador") -> None:
         """
+        Dibuja los corazones de vida, todos juntos con la lista de dibujo.
+        -
+        'superficie': La superficie sobre la que dibujar.
 
-        jug = self.juego_handler.juego.jugador
+        'foto': La foto del jugador en el frame actual.
+        """
 
-        if jug.hp < 0:
+        if foto.hp < 0:
             return
 
-        ancho, alto = get_surface().get_size()
+        lista = self.juego_handler.lista_dibujo
+        capa = lista.capa(CapasDibujo.INTERFAZ)
+
+        ancho, alto = METRICAS_PANTALLA.tam
         tam_grande = int(ancho * 0.04)
         tam_chico = int(ancho * 0.028)
 
-        llenos = jug.hp // 2
-        mitad = jug.hp % 2
-        vacios = (jug.max_hp - jug.hp) // 2
+        llenos = foto.hp // 2
+        mitad = foto.hp % 2
+        vacios = (foto.max_hp - foto.hp) // 2
 
         for i in range(llenos + mitad + vacios):
             if i < llenos:
@@ -180,24 +205,30 @@ class MenuNivel(SuperMenu):
                 img = CORAZON_VACIO
 
             if i == 0:
-                cor = scale(img_load(CORAZON_ROTO if jug.hp == 1 else img).convert_alpha(),
-                            (tam_grande, tam_grande))
-                superficie.blit(cor, (ancho * 0.04, alto * 0.025))
+                cor = self._corazon((CORAZON_ROTO if foto.hp == 1 else img), tam_grande)
+                capa.blit(cor, (ancho * 0.04, alto * 0.025))
                 continue
 
-            cor = scale(img_load(img).convert_alpha(), (tam_chico, tam_chico))
-            superficie.blit(cor, (ancho * 0.035 * (i + 1.5), alto * 0.035))
+            capa.blit(self._corazon(img, tam_chico), (ancho * 0.035 * (i + 1.5), alto * 0.035))
+
+        lista.dibujar(superficie)
 
 
     def dibujar_nivel(self, superficie: "Surface") -> None:
         """
         Dibuja todos los elementos de la interfaz de nivel, como las puntos de vida, etc...
+        Se leen de la foto del jugador del frame, ya que el jugador mismo puede estar
+        cambiando en el hilo de simulación.
         -
         'superficie': La superficie sobre la que dibujar.
         """
 
-        self.dibujar_anillos_stamina(superficie)
-        self.dibujar_corazones(superficie)
+        foto = self.juego_handler.foto_jugador
+        if foto is None:
+            return
+
+        self.dibujar_anillos_stamina(superficie, foto)
+        self.dibujar_corazones(superficie, foto)
 
 
     def draw(self, surface: Optional["Surface"]=None, clear_surface: bool=False) -> Menu:
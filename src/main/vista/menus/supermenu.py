@@ -5,9 +5,10 @@ Módulo para la clase base de menús personalizados.
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Optional, TypeAlias, Union
 
-from pygame.image import load as img_load
 from pygame.transform import scale
-from pygame_menu import Menu
+from pygame_menu import BaseImage, Menu
+
+from ...controlador.archivos import RECURSOS
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -25,6 +26,22 @@ MENUS_IMG: "PathLike" = "./media/img/menus"
 TITLE_IMG_PATH: "PathLike" = "./media/img/titulo/cube_jumper.png"
 
 
+def imagen_menu(ruta_img: "PathLike") -> BaseImage:
+    """
+    Crea una imagen para los widgets de los menús a partir de la que ya tiene el cargador
+    de recursos, en vez de leer el archivo otra vez.
+    -
+    'ruta_img': La ruta de la imagen.
+    """
+
+    # Igual que hace `BaseImage.copy()`, ya que no hay otra forma de darle la superficie
+    # pylint: disable=protected-access
+    imagen = BaseImage(ruta_img, load_from_file=False)
+    imagen._surface = RECURSOS.imagen(ruta_img).copy()
+    imagen._original_surface = imagen._surface.copy()
+    return imagen
+
+
 class SuperMenu(ABC, Menu):
     "Clase base de menú personalizado."
 
@@ -58,6 +75,20 @@ class SuperMenu(ABC, Menu):
         raise NotImplementedError
 
 
+    def conservar(self, anterior: "SuperMenu") -> None:
+        """
+        Toma lo que el usuario haya cambiado en otra instancia de este mismo menú, cuando se
+        vuelve a crear (por ejemplo, al redimensionar la ventana). Por defecto no hay nada
+        que conservar.
+        -
+        'anterior': La instancia que se reemplaza.
+        """
+
+
+    def cerrar(self) -> None:
+        "Libera lo que el menú tenga trabajando en segundo plano. Por defecto no hay nada."
+
+
     def dibujar_titulo(self,
                        superficie: "Surface",
                        dest: Coord,
@@ -75,7 +106,7 @@ class SuperMenu(ABC, Menu):
                con el que viene.
         """
 
-        im = img_load(TITLE_IMG_PATH).convert_alpha()
+        im = RECURSOS.imagen(TITLE_IMG_PATH)
         if tam is not None:
             im = scale(im, tam)
 
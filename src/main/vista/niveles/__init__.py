@@ -2,4 +2,5 @@
 Paquete para renderizadores que dibujan los elementos de los niveles.
 """
 
+from .miniaturas import *
 from .renderizador_nivel import *
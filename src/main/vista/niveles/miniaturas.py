@@ -0,0 +1,177 @@
+"""
+Módulo para el generador de miniaturas de niveles.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from hashlib import sha1
+from multiprocessing import get_context
+from os import getpid
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TypeAlias
+
+from pygame import Rect, Surface
+from pygame.image import save as img_save
+
+from ...modelo.celdas import TiposCelda
+from ...modelo.niveles import Nivel, leer_bytes_nivel
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from ...controlador.logger import LoggerJuego
+
+ClaveMiniatura: TypeAlias = tuple[str, int]
+DicFuturos: TypeAlias = dict[ClaveMiniatura, Future]
+DicMiniaturas: TypeAlias = dict[ClaveMiniatura, Optional[str]]
+
+RUTA_CACHE_MINIATURAS: "PathLike" = "./cache/miniaturas"
+TAM_CELDA_MINIATURA: int = 4 # En pixeles
+MAX_PROCESOS: int = 2
+COLORES_MINIATURA: dict[TiposCelda, str] = {
+    TiposCelda.POS_JUGADOR: "#3f48c8",
+    TiposCelda.AIRE: "#bbbbbb",
+    TiposCelda.PLATAFORMA: "#555555",
+    TiposCelda.PINCHO: "#cc2222",
+    TiposCelda.LLAVE: "#eecc00",
+    TiposCelda.PUERTA: "#8a5a2b",
+    TiposCelda.TROFEO: "#ffdd55",
+    TiposCelda.SALIDA: "#22bb44"
+}
+
+
+def renderizar_miniatura(ruta_nivel: str, dir_cache: str, tam_celda: int) -> str:
+    """
+    Genera la miniatura PNG de un nivel y devuelve su ruta. La miniatura se guarda con
+    el hash del contenido del nivel como nombre, así que si ya existe no se vuelve a
+    generar. Esta función corre en un proceso aparte.
+    -
+    'ruta_nivel': La ruta del archivo de nivel.
+
+    'dir_cache': El directorio donde guardar las miniaturas.
+
+    'tam_celda': El tamaño en pixeles de cada celda en la miniatura.
+    """
+
+    ruta = Path(ruta_nivel)
+    clave = sha1(leer_bytes_nivel(ruta)).hexdigest()
+    ruta_png = Path(dir_cache) / f"{clave}_{tam_celda}.png"
+
+    if ruta_png.exists():
+        return ruta_png.as_posix()
+
+    matriz = Nivel.cargar_desde_ruta(ruta, ignorar_pos_jugador=True)["matriz"]
+    alto = len(matriz)
+    ancho = (len(matriz[0]) if alto else 0)
+
+    superficie = Surface((max(ancho * tam_celda, 1), max(alto * tam_celda, 1)))
+    superficie.fill(COLORES_MINIATURA[TiposCelda.AIRE])
+    for j, fila in enumerate(matriz):
+        for i, info in enumerate(fila):
+            if info.tipo != TiposCelda.AIRE and info.visible:
+                superficie.fill(COLORES_MINIATURA[info.tipo],
+                                Rect(i * tam_celda, j * tam_celda, tam_celda, tam_celda))
+
+    ruta_png.parent.mkdir(parents=True, exist_ok=True)
+    # Se escribe con otro nombre y se renombra, para que nunca se lea un PNG a medias. El
+    # nombre lleva el proceso, porque dos niveles iguales pueden generarse a la vez
+    ruta_temp = ruta_png.with_name(f"{ruta_png.stem}.{getpid()}.tmp.png")
+    img_save(superficie, ruta_temp.as_posix())
+    ruta_temp.replace(ruta_png)
+
+    return ruta_png.as_posix()
+
+
+class GeneradorMiniaturas:
+    """
+    Genera miniaturas de niveles en segundo plano, en un grupo de procesos.
+    Nunca bloquea a quien las pide: mientras no estén listas, no se devuelve nada y se
+    debería mostrar otra imagen en su lugar.
+    """
+
+    def __init__(self,
+                 dir_cache: "PathLike"=RUTA_CACHE_MINIATURAS,
+                 tam_celda: int=TAM_CELDA_MINIATURA,
+                 logger: Optional["LoggerJuego"]=None) -> None:
+        """
+        Inicializa el generador de miniaturas.
+        -
+        'dir_cache': El directorio donde se guardan las miniaturas.
+
+        'tam_celda': El tamaño en pixeles de cada celda en la miniatura.
+
+        'logger': El registrador del juego.
+        """
+
+        self.dir_cache: Path = Path(dir_cache)
+        self.tam_celda: int = tam_celda
+        self.logger: Optional["LoggerJuego"] = logger
+        self.miniaturas: DicMiniaturas = {} # 'None' si no se pudo generar
+        self._pendientes: DicFuturos = {}
+        self._procesos: Optional[ProcessPoolExecutor] = None
+
+
+    def _get_procesos(self) -> ProcessPoolExecutor:
+        "Devuelve el grupo de procesos, creándolo la primera vez que se necesita."
+
+        if self._procesos is None:
+            self._procesos = ProcessPoolExecutor(max_workers=MAX_PROCESOS,
+                                                 mp_context=get_context("spawn"))
+
+        return self._procesos
+
+
+    def pedir(self, ruta_nivel: "PathLike", version: int=0) -> Optional[str]:
+        """
+        Devuelve la ruta de la miniatura de un nivel si ya está lista. Si no, encarga
+        generarla y devuelve `None`.
+        -
+        'ruta_nivel': La ruta del archivo de nivel.
+
+        'version': Algo que cambie cuando cambia el nivel, como su fecha de modificación,
+                   tal que no se recuerde una miniatura vieja.
+        """
+
+        clave = (Path(ruta_nivel).as_posix(), version)
+        if clave in self.miniaturas:
+            return self.miniaturas[clave]
+
+        if clave not in self._pendientes:
+            self._pendientes[clave] = self._get_procesos().submit(renderizar_miniatura,
+                                                                  clave[0],
+                                                                  self.dir_cache.as_posix(),
+                                                                  self.tam_celda)
+
+        return None
+
+
+    def recoger(self) -> set[str]:
+        "Recoge las miniaturas que terminaron de generarse y devuelve sus rutas de nivel."
+
+        listas = set()
+
+        for clave, futuro in tuple(self._pendientes.items()):
+            if not futuro.done():
+                continue
+
+            self._pendientes.pop(clave)
+            error = futuro.exception()
+            if error is not None:
+                self.miniaturas[clave] = None
+                if self.logger is not None:
+                    self.logger.warning(f"No se pudo generar la miniatura de '{clave[0]}': "
+                                        f"{error}")
+            else:
+                self.miniaturas[clave] = futuro.result()
+
+            listas.add(clave[0])
+
+        return listas
+
+
+    def cerrar(self) -> None:
+        "Cancela los pedidos pendientes y termina los procesos."
+
+        if self._procesos is not None:
+            self._procesos.shutdown(wait=False, cancel_futures=True)
+            self._procesos = None
+        self._pendientes.clear()
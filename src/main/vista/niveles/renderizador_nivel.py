@@ -7,20 +7,28 @@ from typing import TYPE_CHECKING, Optional, TypeAlias
 
 from pygame import Rect, Surface
 from pygame.constants import K_F3, KEYDOWN
-from pygame.display import get_surface
 from pygame.draw import circle, rect
 from pygame.math import Vector2
+from pygame.transform import scale
 
+from ...controlador.archivos import RutaJSON
 from ...controlador.editor import (DIRECCIONES_SPRITES, MISSING_IMG_PATH,
                                    MatrizSprites)
-from ...modelo.utils import Temporizador
+from ...modelo.utils import METRICAS_PANTALLA, Temporizador
+from ..dibujo import CapasDibujo, MotorDibujo
 from ..fuentes import FuenteMinecraftia
-from ..sprites import Animacion
+from ..sprites import Animacion, cargar_imagenes_escaladas
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     from pygame.event import Event
 
     from ...controlador.estado import JuegoHandler
+    from ...modelo.estado import CeldaCambiada, FotoJuego
+    from ...modelo.jugador import FotoJugador
+    from ...modelo.niveles import Nivel
+    from ..dibujo import Lienzo, MotorTexturas
 
 ListaPuntos: TypeAlias = dict[tuple[int, int], Temporizador]
 MatrizVisibilidad: TypeAlias = list[list[bool]]
@@ -31,6 +39,7 @@ COLOR_ADY: str = "#dddd00"
 COLOR_ADY_2: str = "#aaaa00"
 COLOR_PUNTO: str = "#ff0000"
 INVISIBLE: tuple[int, int, int, int] = (0, 0, 0, 0)
+VIDEO_CONFIG: "PathLike" = "./config/video.json"
 
 
 class RenderizadorNivel:
@@ -40,20 +49,43 @@ class RenderizadorNivel:
     más que botones y etiquetas, dibuja los sprites mismos de las celdas, así como los fondos.
     """
 
-    def __init__(self, juego_handler: "JuegoHandler") -> None:
+    def __init__(self,
+                 juego_handler: "JuegoHandler",
+                 px_celda_interna: Optional[int]=None) -> None:
         """
         Inicializa el renderizador de nivel.
         -
         'juego_handler': El handler que engloba todo aspecto del juego.
+
+        'px_celda_interna': Si se especifica, el nivel se dibuja en una superficie chica
+                            con esta cantidad de píxeles por celda, que después se agranda
+                            de una sola vez al tamaño de la ventana. Si no, se dibuja
+                            directo a la resolución de la ventana.
         """
 
         self.juego_handler: "JuegoHandler" = juego_handler
+        self.ruta_configs: RutaJSON = RutaJSON(VIDEO_CONFIG)
+        video_configs = self.ruta_configs.cargar()
+        self.px_celda_interna: Optional[int] = video_configs.get("px_celda_interna",
+                                                                 px_celda_interna)
+        # Esto sólo se lee al iniciar el juego, pero se guarda junto con lo demás
+        self.motor_dibujo: str = video_configs.get("motor_dibujo", MotorDibujo.SUPERFICIES)
+        self.render_por_software: bool = video_configs.get("render_por_software", False)
+        self.simulacion_en_hilo: bool = video_configs.get("simulacion_en_hilo", False)
+        self._lienzo: Optional[Surface] = None
         self.matriz_sprites: Optional[MatrizSprites] = None
         self._visibles: Optional[MatrizVisibilidad] = None
         self.mostrar_debug: bool = False
         self.debug_puntos: ListaPuntos = {}
 
 
+    @property
+    def motor_texturas(self) -> Optional["MotorTexturas"]:
+        "Devuelve el motor de texturas con el que dibujar el nivel, si se usa."
+
+        return self.juego_handler.motor_texturas
+
+
     def hay_nivel(self) -> bool:
         "Verifica si el juego tiene un nivel asignado."
 
@@ -66,19 +98,79 @@ class RenderizadorNivel:
         self.mostrar_debug = not self.mostrar_debug
 
 
-    def get_sprite(self, col: int, fil: int) -> Optional[Animacion]:
+    def incremento_dibujo(self, nivel: "Nivel") -> tuple[float, float]:
+        """
+        Devuelve el tamaño con el que se dibuja cada celda de un nivel: el de la
+        resolución interna si se usa, o el de la ventana si no.
+        -
+        'nivel': El nivel en cuestión.
+        """
+
+        if self.px_celda_interna is None:
+            return nivel.incremento_celda
+
+        return (float(self.px_celda_interna), float(self.px_celda_interna))
+
+
+    @property
+    def escala_dibujo(self) -> tuple[float, float]:
+        """
+        Devuelve por cuánto multiplicar las coordenadas de la ventana para pasarlas a las
+        de la superficie donde se dibuja el nivel.
+        """
+
+        if self.px_celda_interna is None or not self.hay_nivel():
+            return (1.0, 1.0)
+
+        nivel = self.juego_handler.nivel
+        incr_x, incr_y = nivel.incremento_celda
+        dib_x, dib_y = self.incremento_dibujo(nivel)
+        return (dib_x / incr_x, dib_y / incr_y)
+
+
+    def tam_lienzo(self) -> Optional[tuple[int, int]]:
+        "Devuelve el tamaño de la resolución interna para el nivel actual, si se usa."
+
+        if self.px_celda_interna is None or not self.hay_nivel():
+            return None
+
+        col, fil = self.juego_handler.nivel.forma
+        return (col * self.px_celda_interna, fil * self.px_celda_interna)
+
+
+    def _preparar_lienzo(self) -> None:
+        """
+        Crea la superficie de la resolución interna, si se usa, al tamaño del nivel.
+        Con el motor de texturas, es éste quien la crea.
+        """
+
+        tam = self.tam_lienzo()
+        if tam is None or self.motor_texturas is not None:
+            self._lienzo = None
+            return
+
+        if self._lienzo is None or self._lienzo.get_size() != tam:
+            self._lienzo = Surface(tam).convert()
+
+
+    def get_sprite(self, col: int, fil: int,
+                   visible: Optional[bool]=None) -> Optional[Animacion]:
         """
         Genera un sprite para la celda en las coordenadas pedidas.
         -
         'col/fil': La columna y fila de la matriz de celdas.
+
+        'visible': Si la celda es visible. Si no se especifica, se le pregunta a la celda.
         """
 
         celda = self.juego_handler.nivel.celda(col, fil)
+        if celda is not None and visible is None:
+            visible = celda.visible
 
-        if celda is None or not celda.visible:
+        if celda is None or not visible:
             return None
 
-        incr_x, incr_y = self.juego_handler.nivel.incremento_celda
+        incr_x, incr_y = self.incremento_dibujo(self.juego_handler.nivel)
 
         return Animacion(
             pos=Vector2(col * incr_x, fil * incr_y),
@@ -136,11 +228,11 @@ class RenderizadorNivel:
         superficie.fill(COLOR_FONDO)
 
 
-    def dibujar_sprites(self, superficie: Surface) -> None:
+    def dibujar_sprites(self, superficie: "Lienzo") -> None:
         """
         Dibuja todos los sprites de la matriz del nivel.
         -
-        'superficie': La superficie sobre la que dibujar.
+        'superficie': La superficie (o capa de la lista de dibujo) sobre la que dibujar.
         """
 
         for fila in self.matriz_sprites:
@@ -167,6 +259,22 @@ class RenderizadorNivel:
                 self.matriz_sprites[j][i] = self.get_sprite(i, j)
 
 
+    def _aplicar_cambios(self, cambios: tuple["CeldaCambiada", ...]) -> None:
+        """
+        Actualiza los sprites de las celdas cuya visibilidad cambió según una foto del
+        juego, en vez de revisar las celdas mismas.
+        -
+        'cambios': Las celdas que cambiaron.
+        """
+
+        for col, fil, visible in cambios:
+            if visible == self._visibles[fil][col]:
+                continue
+
+            self._visibles[fil][col] = visible
+            self.matriz_sprites[fil][col] = self.get_sprite(col, fil, visible)
+
+
     def _renderizar_info(self, contenido: str, tam: int=12) -> list[Surface]:
         """
         Renderiza un string de varias líneas en varias superficies listas
@@ -185,38 +293,45 @@ class RenderizadorNivel:
         return rend
 
 
-    def dibujar_debug_info(self, superficie: Surface) -> None:
+    def dibujar_debug_info(self, superficie: "Lienzo", foto: Optional["FotoJugador"]) -> None:
         """
         Dibuja información destinada a depurar el juego.
         -
-        'superficie': La superficie sobre la que dibujar.
+        'superficie': La superficie (o capa de la lista de dibujo) sobre la que dibujar.
+
+        'foto': La foto del jugador en el frame actual. Se lee de ella y no del jugador
+                mismo, que puede estar cambiando en el hilo de simulación.
         """
 
-        if not self.mostrar_debug:
+        if not self.mostrar_debug or foto is None:
             return
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
+        # Los poderes de salto y dash no cambian mientras se juega
         jug = self.juego_handler.juego.jugador
-        cooldown_msg = lambda num: num if num else "Listo!"
-        jug_col, jug_fil = self.juego_handler.nivel.coords_matriz(jug.hitbox.centerx,
-                                                                  jug.hitbox.centery)
+        hitbox = Rect(foto.hitbox)
+        cooldown_msg = lambda fraccion: f"{fraccion:.0%}" if fraccion else "Listo!"
+        jug_col, jug_fil = self.juego_handler.nivel.coords_matriz(hitbox.centerx,
+                                                                  hitbox.centery)
         incr_x, incr_y = self.juego_handler.nivel.incremento_celda
+        lista = self.juego_handler.lista_dibujo
 
         info = (
-f"""Pos={jug.pos}
-Vel={jug.vel}
-Acc={jug.acc}
-tam={jug.hitbox.width, jug.hitbox.height}
-Vidas={jug.hp}
-Estado='{jug.estado}'
-¿Mira hacia la derecha?={"Sí" if jug.mira_derecha else "No"}
-Salto={jug.salto}   |   Cooldown={cooldown_msg(jug.salto_cooldown.actual)}
-Dash={jug.dash}      |   Cooldown={cooldown_msg(jug.dash_cooldown.actual)}
-Inv={cooldown_msg(jug.invulnerabilidad.actual)}
+f"""Pos={Vector2(hitbox.topleft)}
+Vel={Vector2(foto.vel)}
+Acc={Vector2(foto.acc)}
+tam={hitbox.width, hitbox.height}
+Vidas={foto.hp}
+Estado='{foto.estado}'
+¿Mira hacia la derecha?={"Sí" if foto.mira_derecha else "No"}
+Salto={jug.salto}   |   Cooldown={cooldown_msg(foto.salto_cooldown)}
+Dash={jug.dash}      |   Cooldown={cooldown_msg(foto.dash_cooldown)}
+Inv={"Sí" if foto.invulnerable else "No"}
+Dibujos={lista.imagenes_frame_anterior} en {lista.llamadas_frame_anterior} llamadas
 Version='v{self.juego_handler.version_str}'"""
 )
 
-        self.debug_puntos[jug.hitbox.center] = Temporizador(200)
+        self.debug_puntos[hitbox.center] = Temporizador(200)
 
         for (pos_x, pos_y), temp in self.debug_puntos.items():
             tam = int(alto * 0.004)
@@ -256,20 +371,42 @@ Version='v{self.juego_handler.version_str}'"""
         self.debug_puntos = puntos_copia
 
 
+    def calentar_sprites(self, nivel: "Nivel") -> None:
+        """
+        Deja leídas en memoria y escaladas las imágenes de todas las celdas que usa un
+        nivel, tal que generar sus sprites después no tenga que ir al disco. Se puede
+        llamar desde otro hilo.
+        -
+        'nivel': El nivel cuyas imágenes precargar.
+        """
+
+        tipos = {celda.tipo for fila in nivel.matriz for celda in fila if celda is not None}
+        for tipo in tipos:
+            cargar_imagenes_escaladas(DIRECCIONES_SPRITES.get(tipo, MISSING_IMG_PATH),
+                                      self.incremento_dibujo(nivel))
+
+
     def reiniciar_nivel(self) -> None:
         "Reinicia los datos de nivel."
 
+        self._preparar_lienzo()
         self.matriz_sprites = self.generar_sprites()
         self._visibles = self._generar_visibilidad()
 
 
-    def actualizar(self, superficie: Surface, eventos: list["Event"]) -> None:
+    def actualizar(self,
+                   superficie: Surface,
+                   eventos: list["Event"],
+                   foto: Optional["FotoJuego"]=None) -> None:
         """
         Actualiza todos los elementos de la interfaz del nivel.
         -
         'superficie': La superficie sobre la que dibujar.
 
         'eventos': Lista de eventos de Pygame.
+
+        'foto': Si el juego se simula en otro hilo, la foto a dibujar. Las celdas se
+                actualizan según sus cambios en vez de revisarlas una por una.
         """
 
         if not self.hay_nivel():
@@ -282,7 +419,49 @@ Version='v{self.juego_handler.version_str}'"""
             if ev.type == KEYDOWN and ev.key == K_F3:
                 self.alternar_debug()
 
-        self.dibujar_fondo(superficie)
-        self._analizar_visibilidad()
-        self.dibujar_sprites(superficie)
+        if self.motor_texturas is not None:
+            superficie.fill(INVISIBLE) # El fondo lo pone el motor, debajo de la interfaz
+        else:
+            self.dibujar_fondo(self._lienzo if self._lienzo is not None else superficie)
+        if foto is None:
+            self._analizar_visibilidad()
+        else:
+            self._aplicar_cambios(foto.celdas)
+        self.dibujar_sprites(self.juego_handler.lista_dibujo.capa(CapasDibujo.CELDAS))
         self._actualizar_puntos()
+
+
+    def componer(self, superficie: Surface) -> None:
+        """
+        Si se usa la resolución interna, dibuja en ella las celdas y el jugador anotados
+        en la lista de dibujo, y la agranda de una sola vez sobre la ventana. Con el motor
+        de texturas, éste dibuja el fondo, las celdas y el jugador con el renderer. En
+        ambos casos, lo que va encima (depuración, interfaz) queda anotado para dibujarse
+        a resolución completa.
+        -
+        'superficie': La superficie de la ventana.
+        """
+
+        lista = self.juego_handler.lista_dibujo
+
+        if self.motor_texturas is not None:
+            self.motor_texturas.dibujar(lista,
+                                        hasta_capa=CapasDibujo.JUGADOR,
+                                        fondo=COLOR_FONDO,
+                                        tam_interno=self.tam_lienzo())
+            return
+
+        if self._lienzo is None:
+            return
+
+        lista.dibujar(self._lienzo, hasta_capa=CapasDibujo.JUGADOR)
+        scale(self._lienzo, superficie.get_size(), superficie)
+
+
+    def guardar_config(self) -> None:
+        "Guarda la configuración de video para que persista en la siguiente ejecución del juego."
+
+        self.ruta_configs.guardar({"px_celda_interna": self.px_celda_interna,
+                                   "motor_dibujo": self.motor_dibujo,
+                                   "render_por_software": self.render_por_software,
+                                   "simulacion_en_hilo": self.simulacion_en_hilo})
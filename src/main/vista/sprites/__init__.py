@@ -3,4 +3,7 @@ Paquete para sprites y animaciones.
 """
 
 from .animacion import *
+from .cache_superficies import *
+from .formato_superficies import *
+from .hoja_sprites import *
 from .sprite_manager import *
@@ -3,33 +3,227 @@ Módulo para una animación.
 """
 
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeAlias
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple, Optional, TypeAlias, Union
 
-from pygame.image import load as img_load
-from pygame.transform import rotate
 from pygame.math import Vector2
 from pygame.sprite import WeakDirtySprite
-from pygame.transform import scale
+from pygame.transform import flip, scale
+
+from ...controlador.archivos import RECURSOS
+from .cache_superficies import CacheSuperficies, TamSuperficie
+from .formato_superficies import (espejar_superficie, optimizar_superficie, rotar_superficie,
+                                  variante_transparente)
+from .hoja_sprites import cortar_hoja, es_hoja, leer_geometria, ruta_meta_hoja
 
 if TYPE_CHECKING:
     from os import PathLike
 
     from pygame import Surface
 
+    from ..dibujo import Lienzo
+
 
 SpriteElegido: TypeAlias = WeakDirtySprite
 TuplaSprites: TypeAlias = tuple[SpriteElegido, ...]
+TuplaImagenes: TypeAlias = tuple["Surface", ...]
+Coordenada: TypeAlias = Union[Vector2, tuple[float, float]]
 
 EXT: str = "png"
 
 
+class FramesEspejados(NamedTuple):
+    """
+    Declara los frames de una animación como el reflejo de los de otra carpeta, en vez de
+    tener archivos propios. Se generan al cargarlos y se comparten entre todas las
+    animaciones que los usen.
+    """
+
+    origen: "PathLike"
+    horizontal: bool = True
+    vertical: bool = False
+
+
+RutaFrames: TypeAlias = Union["PathLike", FramesEspejados]
+
+# Imágenes ya leídas del disco, por carpeta. Se comparten entre todas las animaciones
+_IMAGENES_CARGADAS: dict[str, TuplaImagenes] = {}
+# Lo mismo, pero ya escaladas, por carpeta y tamaño
+_IMAGENES_ESCALADAS: dict[tuple[str, TamSuperficie], TuplaImagenes] = {}
+_CANDADO_IMAGENES: Lock = Lock()
+# Lo mismo, pero ya en el formato de la pantalla, por carpeta, tamaño, rotación y alpha.
+# Sólo se usa desde el hilo principal
+_IMAGENES_OPTIMIZADAS: dict[tuple[str, TamSuperficie, float, int], TuplaImagenes] = {}
+
+CACHE_SUPERFICIES: CacheSuperficies = CacheSuperficies()
+
+
+def archivos_frames(ruta: "PathLike") -> list[Path]:
+    """
+    Devuelve los archivos de los que salen los frames de una animación. Si es una hoja de
+    sprites, son la imagen y su JSON (si lo tiene); si es una carpeta, sus imágenes
+    ordenadas por nombre, que es el orden en que se usan.
+    -
+    'ruta': La hoja de sprites, o la carpeta donde se encuentran todos los frames.
+    """
+
+    if es_hoja(ruta):
+        meta = ruta_meta_hoja(ruta)
+        return [Path(ruta)] + ([meta] if meta.is_file() else [])
+
+    return sorted(arch for arch in Path(ruta).iterdir()
+                  if arch.is_file() and arch.name.lower().endswith(f".{EXT.lower()}"))
+
+
+def cargar_imagenes(ruta: "PathLike") -> TuplaImagenes:
+    """
+    Lee todos los frames de una animación, o los devuelve de memoria si ya se leyeron
+    antes (por ejemplo, si los precargó el cargador de recursos). Una hoja de sprites se
+    decodifica una sola vez y se corta en subsuperficies, sin copiar los píxeles. Las
+    imágenes quedan tal cual están en el archivo, sin convertir ni escalar, por lo que se
+    puede llamar desde otro hilo para tenerlas listas de antemano.
+    -
+    'ruta': La hoja de sprites, o la carpeta donde se encuentran todos los frames.
+    """
+
+    clave = Path(ruta).as_posix()
+    with _CANDADO_IMAGENES:
+        imagenes = _IMAGENES_CARGADAS.get(clave)
+
+    if imagenes is None:
+        if es_hoja(ruta):
+            hoja = RECURSOS.imagen_cruda(ruta)
+            imagenes = cortar_hoja(hoja, leer_geometria(ruta, hoja.get_size()))
+        else:
+            imagenes = tuple(RECURSOS.imagen_cruda(arch) for arch in archivos_frames(ruta))
+        with _CANDADO_IMAGENES:
+            imagenes = _IMAGENES_CARGADAS.setdefault(clave, imagenes)
+
+    return imagenes
+
+
+def _clave_frames(ruta: RutaFrames) -> str:
+    """
+    Devuelve la clave con la que se guardan en memoria unos frames.
+    -
+    'ruta': La hoja o carpeta de los frames, o su declaración como reflejo de otra.
+    """
+
+    if isinstance(ruta, FramesEspejados):
+        return (f"{Path(ruta.origen).as_posix()}#espejo"
+                f"{'H' if ruta.horizontal else ''}{'V' if ruta.vertical else ''}")
+
+    return Path(ruta).as_posix()
+
+
+def cargar_imagenes_escaladas(ruta: RutaFrames, tam: "Coordenada") -> TuplaImagenes:
+    """
+    Devuelve los frames de una animación ya escalados a un tamaño. Se buscan primero en
+    memoria, después en la caché en disco, y sólo si no están se leen y escalan, dejándolos
+    guardados para la próxima. Los frames espejados se generan a partir de los de su
+    origen. Como no se convierten al formato de la pantalla, se puede llamar desde otro hilo.
+    -
+    'ruta': La hoja de sprites o carpeta de los frames, o su declaración como reflejo
+            de otra.
+
+    'tam': El tamaño al que escalar los frames. Se trunca a píxeles enteros.
+    """
+
+    tam_px = (int(tam[0]), int(tam[1]))
+    clave = (_clave_frames(ruta), tam_px)
+    with _CANDADO_IMAGENES:
+        imagenes = _IMAGENES_ESCALADAS.get(clave)
+
+    if imagenes is None:
+        if isinstance(ruta, FramesEspejados):
+            imagenes = tuple(flip(imagen, ruta.horizontal, ruta.vertical)
+                             for imagen in cargar_imagenes_escaladas(ruta.origen, tam_px))
+        else:
+            clave_cache = CACHE_SUPERFICIES.clave_de(archivos_frames(ruta), tam_px)
+            imagenes = CACHE_SUPERFICIES.cargar(clave_cache)
+            if imagenes is None:
+                imagenes = tuple(scale(imagen, tam_px) for imagen in cargar_imagenes(ruta))
+                CACHE_SUPERFICIES.guardar(clave_cache, imagenes)
+
+        with _CANDADO_IMAGENES:
+            imagenes = _IMAGENES_ESCALADAS.setdefault(clave, imagenes)
+
+    return imagenes
+
+
+def cargar_imagenes_optimizadas(ruta: RutaFrames,
+                                tam: "Coordenada",
+                                rot: float=0.0,
+                                alpha: int=255) -> TuplaImagenes:
+    """
+    Devuelve los frames de una animación listos para dibujar: escalados, en el formato de
+    píxeles más rápido para cada uno, rotados y con una transparencia general. Cada
+    combinación se prepara una sola vez y se comparte, así que las imágenes no se deben
+    modificar. Debe llamarse desde el hilo principal.
+    -
+    'ruta': La hoja de sprites o carpeta de los frames, o su declaración como reflejo
+            de otra.
+
+    'tam': El tamaño al que escalar los frames. Se trunca a píxeles enteros.
+
+    'rot': La cantidad de grados a rotar.
+
+    'alpha': La transparencia general, entre 0 y 255.
+    """
+
+    tam_px = (int(tam[0]), int(tam[1]))
+    rot = round(rot % 360, 3)
+    alpha = max(0, min(alpha, 255))
+    clave = (_clave_frames(ruta), tam_px, rot, alpha)
+    imagenes = _IMAGENES_OPTIMIZADAS.get(clave)
+
+    if imagenes is None:
+        if alpha < 255:
+            imagenes = tuple(variante_transparente(imagen, alpha)
+                             for imagen in cargar_imagenes_optimizadas(ruta, tam_px, rot))
+        elif rot:
+            imagenes = tuple(rotar_superficie(imagen, rot)
+                             for imagen in cargar_imagenes_optimizadas(ruta, tam_px))
+        # Se espejan las del origen ya optimizadas, tal que se sepa de cuáles salen
+        elif isinstance(ruta, FramesEspejados):
+            imagenes = tuple(espejar_superficie(imagen, ruta.horizontal, ruta.vertical)
+                             for imagen in cargar_imagenes_optimizadas(ruta.origen, tam_px))
+        else:
+            imagenes = tuple(optimizar_superficie(imagen)
+                             for imagen in cargar_imagenes_escaladas(ruta, tam_px))
+        _IMAGENES_OPTIMIZADAS[clave] = imagenes
+
+    return imagenes
+
+
+def olvidar_imagenes_escaladas(ruta: RutaFrames, tam: "Coordenada") -> bool:
+    """
+    Saca de memoria los frames escalados de una animación (y sus versiones ya listas para
+    dibujar), para liberar espacio. Si se vuelven a pedir, se leen de la caché en disco.
+    Devuelve si estaban en memoria.
+    -
+    'ruta': La hoja de sprites o carpeta de los frames, o su declaración como reflejo
+            de otra.
+
+    'tam': El tamaño al que se habían escalado.
+    """
+
+    clave = (_clave_frames(ruta), (int(tam[0]), int(tam[1])))
+    for optimizada in [otra for otra in _IMAGENES_OPTIMIZADAS if otra[:2] == clave]:
+        _IMAGENES_OPTIMIZADAS.pop(optimizada, None)
+
+    with _CANDADO_IMAGENES:
+        return _IMAGENES_ESCALADAS.pop(clave, None) is not None
+
+
 class Animacion:
     "Clase para una colección de sprites."
 
     def __init__(self,
                  pos: Vector2,
                  tam: Vector2,
-                 ruta: "PathLike") -> None:
+                 ruta: RutaFrames,
+                 alphas: tuple[int, ...]=()) -> None:
         """
         Inicializa los sprites del jugador.
         -
@@ -38,34 +232,43 @@ class Animacion:
 
         'tam': El tamaño horizontal/vertical del sprite del jugador.
 
-        'ruta': Directorio padre donde se encuentran los sprites
+        'ruta': La hoja de sprites o el directorio padre donde se encuentran los sprites,
+                o un `FramesEspejados` si la animación es el reflejo de otra.
+
+        'alphas': Transparencias con las que se va a dibujar la animación, para tenerlas
+                  listas de antemano.
         """
 
         self.pos: Vector2 = pos
         # Esto idealmente debería ser igual para todos los frames
         self.tam: Vector2 = tam
+        self.ruta: RutaFrames = ruta
+        self.rot: float = 0.0
+        self.alpha: int = 255
+        self.alphas: tuple[int, ...] = alphas
         self.sprites: TuplaSprites = self._cargar_sprites(ruta)
 
         self._spr_ind: int = 0
 
 
-    def _cargar_sprites(self, ruta: "PathLike") -> TuplaSprites:
+    def _cargar_sprites(self, ruta: RutaFrames) -> TuplaSprites:
         """
         Dada una ruta donde está la carpeta contenedora, esta función carga
         todos los sprites que allí encuentra y los compila en una lista.
         -
-        'ruta': La ruta donde se encuentran todos los frames.
+        'ruta': La ruta donde se encuentran todos los frames, o de qué otros son reflejo.
         """
 
-        path = Path(ruta)
         sprites = []
 
-        for arch in path.iterdir():
-            if arch.is_file() and arch.name.lower().endswith(f".{EXT.lower()}"):
-                spr = SpriteElegido()
-                spr.dirty = 0
-                spr.image = scale(img_load(arch.as_posix()).convert_alpha(), self.tam)
-                sprites.append(spr)
+        for imagen in cargar_imagenes_optimizadas(ruta, self.tam):
+            spr = SpriteElegido()
+            spr.dirty = 0
+            spr.image = imagen
+            sprites.append(spr)
+
+        for alpha in self.alphas:
+            self.variante(alpha)
 
         return tuple(sprites)
 
@@ -102,43 +305,55 @@ class Animacion:
         Intenta rotar todos los sprites de la animación.
         Se devuelve la instancia de la animación.
         -
-        'rot': La cantidad de grados a rotar, en radianes.
+        'rot': La cantidad de grados a rotar.
         """
 
-        for spr in self.sprites:
-            spr.image = rotate(spr.image, rot)
+        self.rot += rot
+        imagenes = cargar_imagenes_optimizadas(self.ruta, self.tam, self.rot)
+        for spr, imagen in zip(self.sprites, imagenes):
+            spr.image = imagen
+        for alpha in self.alphas:
+            self.variante(alpha)
 
         return self
 
 
-    def set_transparencia(self, alpha: int) -> "Animacion":
+    def variante(self, alpha: int) -> TuplaImagenes:
         """
-        Cambia la transparencia de la animación.
+        Devuelve los frames de la animación con una transparencia general, preparándolos
+        si es la primera vez que se piden.
+        -
+        'alpha': La transparencia. Debe ser un número entre 0 y 255.
         """
 
-        if alpha < 0:
-            alpha = 0
-        elif alpha > 255:
-            alpha = 255
+        return cargar_imagenes_optimizadas(self.ruta, self.tam, self.rot, alpha)
+
+
+    def set_transparencia(self, alpha: int) -> "Animacion":
+        """
+        Cambia la transparencia con la que se dibuja la animación por defecto.
+        """
 
-        for spr in self.sprites:
-            spr.image = spr.image.convert_alpha()
-            spr.image.set_alpha(alpha)
+        self.alpha = max(0, min(alpha, 255))
+        self.variante(self.alpha)
 
         return self
 
 
-    def dibujar(self, superficie: "Surface", alpha: int=255) -> SpriteElegido:
+    def dibujar(self, superficie: "Lienzo", alpha: Optional[int]=None) -> SpriteElegido:
         """
         Dibuja esta animación. Devuelve el sprite que se acaba de dibujar.
+        Las imágenes ya están en el formato de la pantalla, así que acá no se convierte nada.
         -
         'superficie': La superficie sobre la que dibujar.
 
-        'alpha': La transparencia de la imagen. Debe ser un número entre 0 y 255.
+        'alpha': La transparencia de la imagen. Debe ser un número entre 0 y 255. Si no
+                 se especifica, se usa la de `set_transparencia()`.
         """
 
+        alpha = (self.alpha if alpha is None else alpha)
         spr_actual = self.sprites[self._spr_ind]
-        spr_actual.image = spr_actual.image.convert_alpha()
-        spr_actual.image.set_alpha(alpha)
-        superficie.blit(spr_actual.image, self.pos)
+        superficie.blit((spr_actual.image if alpha >= 255
+                         else self.variante(alpha)[self._spr_ind]),
+                        self.pos)
         return spr_actual
@@ -0,0 +1,174 @@
+"""
+Módulo para la caché en disco de frames ya escalados.
+"""
+
+from hashlib import sha1
+from os import getpid, utime
+from pathlib import Path
+from struct import Struct
+from struct import error as StructError
+from threading import get_ident
+from typing import TYPE_CHECKING, Iterable, Optional, TypeAlias
+
+from pygame.image import frombuffer, tobytes
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from pygame import Surface
+
+TuplaSuperficies: TypeAlias = tuple["Surface", ...]
+TamSuperficie: TypeAlias = tuple[int, int]
+
+RUTA_CACHE_SUPERFICIES: "PathLike" = "./cache/superficies"
+EXT_CACHE_SUPERFICIES: str = ".raw"
+MAX_BYTES_CACHE_SUPERFICIES: int = 64 * 1024 * 1024 # 64 MiB
+FORMATO_PIXELES: str = "RGBA"
+BYTES_POR_PIXEL: int = 4
+# Cambiar esto si cambia cómo se escalan o guardan los frames
+VERSION_CACHE_SUPERFICIES: int = 1
+CABECERA_SUPERFICIES: Struct = Struct("<4sIII") # formato, ancho, alto, cantidad de frames
+
+
+class CacheSuperficies:
+    """
+    Caché en disco de los frames de una animación ya escalados a un tamaño, guardados
+    como píxeles crudos. Así, en la siguiente ejecución con la misma resolución no hace
+    falta ni decodificar los PNG ni escalarlos: sólo se leen los bytes.
+    Cada entrada se identifica por el contenido de los archivos originales, el tamaño y el
+    formato de los píxeles, por lo que si se cambia un frame la entrada vieja simplemente
+    deja de usarse, y se borra cuando la caché se llena.
+    """
+
+    def __init__(self,
+                 dir_cache: "PathLike"=RUTA_CACHE_SUPERFICIES,
+                 max_bytes: int=MAX_BYTES_CACHE_SUPERFICIES) -> None:
+        """
+        Inicializa la caché. El directorio se crea recién al guardar la primera entrada.
+        -
+        'dir_cache': El directorio donde guardar las entradas.
+
+        'max_bytes': El tamaño máximo que puede ocupar el directorio, en bytes.
+        """
+
+        self.dir_cache: Path = Path(dir_cache)
+        self.max_bytes: int = max_bytes
+
+
+    @staticmethod
+    def clave_de(archivos: Iterable["PathLike"], tam: TamSuperficie) -> str:
+        """
+        Devuelve la clave con la que se guardan unos frames escalados.
+        -
+        'archivos': Los archivos de los frames originales, en orden.
+
+        'tam': El tamaño al que se escalan.
+        """
+
+        hash_clave = sha1(f"{VERSION_CACHE_SUPERFICIES}|{FORMATO_PIXELES}|"
+                          f"{tam[0]}x{tam[1]}".encode("utf-8"))
+        for archivo in archivos:
+            contenido = Path(archivo).read_bytes()
+            hash_clave.update(len(contenido).to_bytes(8, "little"))
+            hash_clave.update(contenido)
+
+        return hash_clave.hexdigest()
+
+
+    def _ruta_de(self, clave: str) -> Path:
+        """
+        Devuelve la ruta del archivo de una entrada.
+        -
+        'clave': La clave de la entrada.
+        """
+
+        return self.dir_cache / f"{clave}{EXT_CACHE_SUPERFICIES}"
+
+
+    def cargar(self, clave: str) -> Optional[TuplaSuperficies]:
+        """
+        Devuelve los frames guardados para una clave, o `None` si no hay o están dañados.
+        Las superficies no están convertidas al formato de la pantalla, así que se puede
+        llamar desde otro hilo.
+        -
+        'clave': La clave de la entrada.
+        """
+
+        ruta = self._ruta_de(clave)
+        try:
+            datos = ruta.read_bytes()
+            formato, ancho, alto, cantidad = CABECERA_SUPERFICIES.unpack_from(datos, 0)
+        except FileNotFoundError:
+            return None
+        except (OSError, StructError):
+            ruta.unlink(missing_ok=True)
+            return None
+
+        tam_frame = ancho * alto * BYTES_POR_PIXEL
+        if (formato.decode("ascii", "replace") != FORMATO_PIXELES
+            or len(datos) != CABECERA_SUPERFICIES.size + tam_frame * cantidad):
+            ruta.unlink(missing_ok=True)
+            return None
+
+        vista = memoryview(datos)
+        inicio = CABECERA_SUPERFICIES.size
+        frames = tuple(frombuffer(vista[inicio + i * tam_frame:inicio + (i + 1) * tam_frame],
+                                  (ancho, alto), FORMATO_PIXELES)
+                       for i in range(cantidad))
+
+        # La fecha de modificación hace de 'último uso' para saber qué borrar primero
+        try:
+            utime(ruta)
+        except OSError:
+            pass
+
+        return frames
+
+
+    def guardar(self, clave: str, frames: TuplaSuperficies) -> None:
+        """
+        Guarda unos frames ya escalados. Todos deben tener el mismo tamaño. Si no se
+        puede escribir, simplemente no se guarda.
+        -
+        'clave': La clave de la entrada.
+
+        'frames': Los frames a guardar.
+        """
+
+        if not frames or len({frame.get_size() for frame in frames}) != 1:
+            return
+
+        ancho, alto = frames[0].get_size()
+        ruta = self._ruta_de(clave)
+        try:
+            self.dir_cache.mkdir(parents=True, exist_ok=True)
+            # Se escribe con otro nombre y se renombra, para que nunca se lea a medias
+            ruta_temp = ruta.with_name(f"{ruta.name}.{getpid()}.{get_ident()}.tmp")
+            with ruta_temp.open(mode="wb") as archivo:
+                archivo.write(CABECERA_SUPERFICIES.pack(FORMATO_PIXELES.encode("ascii"),
+                                                        ancho, alto, len(frames)))
+                for frame in frames:
+                    archivo.write(tobytes(frame, FORMATO_PIXELES))
+            ruta_temp.replace(ruta)
+        except OSError:
+            return
+
+        self.recortar()
+
+
+    def recortar(self) -> None:
+        "Borra las entradas usadas hace más tiempo hasta que la caché entre en su tamaño."
+
+        try:
+            entradas = [(arch.stat(), arch)
+                        for arch in self.dir_cache.glob(f"*{EXT_CACHE_SUPERFICIES}")]
+        except OSError:
+            return
+
+        total = sum(stat.st_size for stat, _ in entradas)
+        for stat, arch in sorted(entradas, key=lambda entrada: entrada[0].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+
+            arch.unlink(missing_ok=True)
+            total -= stat.st_size
@@ -0,0 +1,206 @@
+"""
+Módulo para elegir el formato de píxeles más rápido de dibujar para cada imagen.
+"""
+
+from enum import StrEnum
+from typing import NamedTuple, Optional, TypeAlias
+from weakref import WeakKeyDictionary
+
+from pygame import RLEACCEL, Color, Surface
+from pygame.mask import from_surface, from_threshold
+from pygame.transform import flip, rotate
+
+ColorClave: TypeAlias = tuple[int, int, int]
+
+# Colores a probar como transparentes, si la imagen no los usa ella misma
+CANDIDATOS_COLORKEY: tuple[ColorClave, ...] = ((255, 0, 255), (0, 255, 0), (1, 2, 3),
+                                               (254, 1, 253))
+
+
+class TipoTransparencia(StrEnum):
+    "Cómo maneja la transparencia una imagen."
+
+    OPACA = "opaca" # No tiene píxeles transparentes
+    COLORKEY = "colorkey" # Cada píxel es totalmente opaco o totalmente transparente
+    ALFA = "alfa" # Tiene píxeles semitransparentes
+
+
+class OrigenSuperficie(NamedTuple):
+    """
+    De qué imagen sale otra y qué se le hizo: primero se la espeja, después se la rota y
+    por último se le aplica la transparencia general. Sirve para que quien dibuje con
+    texturas pueda subir sólo la imagen base y aplicar lo demás al dibujarla.
+    """
+
+    base: Surface
+    rot: float = 0.0 # En grados, en sentido antihorario como `pygame.transform.rotate()`
+    espejo_x: bool = False
+    espejo_y: bool = False
+    alpha: int = 255
+
+
+# Las variantes creadas con las funciones de acá, y de qué imagen salen
+_ORIGENES: "WeakKeyDictionary[Surface, OrigenSuperficie]" = WeakKeyDictionary()
+
+
+def analizar_transparencia(imagen: Surface) -> TipoTransparencia:
+    """
+    Revisa los píxeles de una imagen para saber qué transparencia necesita.
+    -
+    'imagen': La imagen a revisar. No hace falta que esté convertida.
+    """
+
+    if imagen.get_alpha() is None and imagen.get_colorkey() is None:
+        return TipoTransparencia.OPACA
+
+    total = imagen.get_width() * imagen.get_height()
+    opacos = from_surface(imagen, threshold=254).count()
+    if opacos == total:
+        return TipoTransparencia.OPACA
+
+    visibles = from_surface(imagen, threshold=0).count()
+    return (TipoTransparencia.COLORKEY if visibles == opacos else TipoTransparencia.ALFA)
+
+
+def _con_colorkey(imagen: Surface) -> Optional[Surface]:
+    """
+    Pasa una imagen sin píxeles semitransparentes a una sin canal alfa y ya convertida,
+    con un color que la imagen no use como transparente. Devuelve `None` si no se
+    encuentra tal color.
+    -
+    'imagen': La imagen original, con transparencia por píxel.
+    """
+
+    opacos = from_surface(imagen, threshold=254).count()
+    transparentes = imagen.get_width() * imagen.get_height() - opacos
+
+    for clave in CANDIDATOS_COLORKEY:
+        nueva = Surface(imagen.get_size())
+        nueva.fill(clave)
+        nueva.blit(imagen, (0, 0))
+        # Si hay más píxeles del color que transparentes, la imagen ya usaba ese color
+        if from_threshold(nueva, Color(*clave), (1, 1, 1, 255)).count() == transparentes:
+            nueva = nueva.convert()
+            nueva.set_colorkey(clave, RLEACCEL)
+            return nueva
+
+    return None
+
+
+def optimizar_superficie(imagen: Surface) -> Surface:
+    """
+    Devuelve una copia de una imagen en el formato más rápido de dibujar en la pantalla:
+    sin canal alfa si es opaca, con un color transparente (y compresión RLE) si cada píxel
+    es todo o nada, y con transparencia por píxel sólo si de verdad la necesita.
+    Debe llamarse desde el hilo principal, con la pantalla ya creada.
+    -
+    'imagen': La imagen original.
+    """
+
+    tipo = analizar_transparencia(imagen)
+
+    if tipo == TipoTransparencia.OPACA:
+        return imagen.convert()
+
+    if tipo == TipoTransparencia.COLORKEY:
+        nueva = _con_colorkey(imagen)
+        if nueva is not None:
+            return nueva
+
+    return imagen.convert_alpha()
+
+
+def origen_de(imagen: Surface) -> OrigenSuperficie:
+    """
+    Devuelve de qué imagen sale una variante y qué se le hizo. Si la imagen no es una
+    variante, es su propia base.
+    -
+    'imagen': La imagen en cuestión.
+    """
+
+    origen = _ORIGENES.get(imagen)
+    return (origen if origen is not None else OrigenSuperficie(imagen))
+
+
+def _registrar_origen(variante: Surface,
+                      imagen: Surface,
+                      rot: float=0.0,
+                      espejo_x: bool=False,
+                      espejo_y: bool=False,
+                      alpha: int=255) -> Surface:
+    """
+    Anota que una variante sale de aplicarle algo a una imagen, que a su vez puede ser
+    variante de otra. Devuelve la variante.
+    -
+    'variante': La imagen resultante.
+
+    'imagen': La imagen de la que sale.
+
+    'rot': Cuántos grados se rotó, después de espejarla.
+
+    'espejo_x/espejo_y': Si se espejó horizontal/verticalmente.
+
+    'alpha': La transparencia general que se le aplicó.
+    """
+
+    previo = origen_de(imagen)
+    # Espejar en un solo eje invierte el sentido de la rotación que ya tenía
+    rot_previa = (-previo.rot if espejo_x != espejo_y else previo.rot)
+    _ORIGENES[variante] = OrigenSuperficie(base=previo.base,
+                                           rot=(rot_previa + rot) % 360,
+                                           espejo_x=(previo.espejo_x != espejo_x),
+                                           espejo_y=(previo.espejo_y != espejo_y),
+                                           alpha=previo.alpha * alpha // 255)
+    return variante
+
+
+def variante_transparente(imagen: Surface, alpha: int) -> Surface:
+    """
+    Devuelve una copia de una imagen ya optimizada, con una transparencia general. Como
+    la copia conserva el formato, dibujarla no requiere ninguna conversión.
+    -
+    'imagen': La imagen original.
+
+    'alpha': La transparencia a aplicar, entre 0 y 255.
+    """
+
+    alpha = max(0, min(alpha, 255))
+    variante = imagen.copy()
+    variante.set_alpha(alpha, (RLEACCEL if imagen.get_colorkey() is not None else 0))
+    return _registrar_origen(variante, imagen, alpha=alpha)
+
+
+def rotar_superficie(imagen: Surface, rot: float) -> Surface:
+    """
+    Rota una imagen ya optimizada, conservando su color transparente si lo tiene.
+    -
+    'imagen': La imagen original.
+
+    'rot': La cantidad de grados a rotar.
+    """
+
+    rotada = rotate(imagen, rot)
+    clave = imagen.get_colorkey()
+    if clave is not None:
+        rotada.set_colorkey(clave, RLEACCEL)
+
+    return _registrar_origen(rotada, imagen, rot=rot)
+
+
+def espejar_superficie(imagen: Surface, horizontal: bool, vertical: bool=False) -> Surface:
+    """
+    Espeja una imagen ya optimizada, conservando su color transparente si lo tiene.
+    -
+    'imagen': La imagen original.
+
+    'horizontal': Si se espeja de izquierda a derecha.
+
+    'vertical': Si se espeja de arriba a abajo.
+    """
+
+    espejada = flip(imagen, horizontal, vertical)
+    clave = imagen.get_colorkey()
+    if clave is not None:
+        espejada.set_colorkey(clave, RLEACCEL)
+
+    return _registrar_origen(espejada, imagen, espejo_x=horizontal, espejo_y=vertical)
@@ -0,0 +1,137 @@
+"""
+Módulo para hojas de sprites: todos los frames de una animación en una sola imagen.
+
+Junto a la imagen puede haber un JSON con el mismo nombre que describe cómo cortarla:
+    {"ancho": 128, "alto": 128, "cantidad": 32, "columnas": 8, "orden": [0, 1, ...]}
+Los frames se numeran de izquierda a derecha y de arriba a abajo. Todos los campos son
+opcionales; sin JSON, la imagen es una tira horizontal de frames cuadrados.
+"""
+
+from json import dump, load
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Sequence
+
+from pygame import SRCALPHA, Rect, Surface
+from pygame.image import save as img_save
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+EXT_HOJA: str = ".png"
+EXT_META_HOJA: str = ".json"
+
+
+class GeometriaHoja(NamedTuple):
+    "Cómo están dispuestos los frames dentro de una hoja."
+
+    ancho: int
+    alto: int
+    columnas: int
+    orden: tuple[int, ...] # Qué celda de la hoja es cada frame, en el orden en que se usan
+
+
+def es_hoja(ruta: "PathLike") -> bool:
+    """
+    Decide si una ruta de animación es una hoja de sprites (y no una carpeta de frames).
+    -
+    'ruta': La ruta de la animación.
+    """
+
+    ruta = Path(ruta)
+    return ruta.suffix.lower() == EXT_HOJA and ruta.is_file()
+
+
+def ruta_meta_hoja(ruta_hoja: "PathLike") -> Path:
+    """
+    Devuelve dónde estaría el JSON con la geometría de una hoja.
+    -
+    'ruta_hoja': La ruta de la imagen de la hoja.
+    """
+
+    return Path(ruta_hoja).with_suffix(EXT_META_HOJA)
+
+
+def leer_geometria(ruta_hoja: "PathLike", tam_hoja: tuple[int, int]) -> GeometriaHoja:
+    """
+    Lee y valida la geometría de una hoja, completando lo que no esté especificado.
+    -
+    'ruta_hoja': La ruta de la imagen de la hoja.
+
+    'tam_hoja': El tamaño de la imagen de la hoja, en píxeles.
+    """
+
+    ruta_meta = ruta_meta_hoja(ruta_hoja)
+    meta: dict[str, Any] = {}
+    if ruta_meta.is_file():
+        with ruta_meta.open(mode="r", encoding="utf-8") as archivo:
+            meta = load(archivo)
+
+    ancho_hoja, alto_hoja = tam_hoja
+    alto = int(meta.get("alto", alto_hoja))
+    ancho = int(meta.get("ancho", alto))
+    if ancho <= 0 or alto <= 0 or ancho > ancho_hoja or alto > alto_hoja:
+        raise ValueError(f"La hoja '{Path(ruta_hoja).as_posix()}' de {ancho_hoja}x{alto_hoja} "
+                         f"no puede tener frames de {ancho}x{alto}.")
+
+    columnas = int(meta.get("columnas", ancho_hoja // ancho))
+    celdas = columnas * (alto_hoja // alto)
+    cantidad = int(meta.get("cantidad", celdas))
+    orden = tuple(int(ind) for ind in meta.get("orden", range(cantidad)))
+
+    if columnas <= 0 or columnas * ancho > ancho_hoja or not orden:
+        raise ValueError(f"La geometría de la hoja '{Path(ruta_hoja).as_posix()}' no es válida.")
+    if any(not 0 <= ind < celdas for ind in orden):
+        raise ValueError(f"La hoja '{Path(ruta_hoja).as_posix()}' no tiene los frames {orden}.")
+
+    return GeometriaHoja(ancho, alto, columnas, orden)
+
+
+def cortar_hoja(hoja: Surface, geometria: GeometriaHoja) -> tuple[Surface, ...]:
+    """
+    Devuelve los frames de una hoja como subsuperficies, que comparten los píxeles con
+    la hoja en vez de copiarlos.
+    -
+    'hoja': La imagen de la hoja.
+
+    'geometria': Cómo están dispuestos los frames.
+    """
+
+    ancho, alto, columnas, orden = geometria
+    return tuple(hoja.subsurface(Rect((ind % columnas) * ancho, (ind // columnas) * alto,
+                                      ancho, alto))
+                 for ind in orden)
+
+
+def crear_hoja(frames: Sequence[Surface],
+               destino: "PathLike",
+               columnas: Optional[int]=None) -> Path:
+    """
+    Arma una hoja a partir de frames sueltos, todos del mismo tamaño, y la guarda junto
+    con su JSON de geometría.
+    -
+    'frames': Los frames, en el orden en que se usan.
+
+    'destino': La ruta de la imagen a crear.
+
+    'columnas': Cuántos frames poner por fila. Si no se especifica, se hace una tira.
+    """
+
+    if not frames or len({frame.get_size() for frame in frames}) != 1:
+        raise ValueError("Se necesita al menos un frame, y todos deben medir lo mismo.")
+
+    ancho, alto = frames[0].get_size()
+    columnas = min(columnas or len(frames), len(frames))
+    filas = -(-len(frames) // columnas)
+
+    hoja = Surface((ancho * columnas, alto * filas), flags=SRCALPHA)
+    for ind, frame in enumerate(frames):
+        hoja.blit(frame, ((ind % columnas) * ancho, (ind // columnas) * alto))
+
+    ruta = Path(destino)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    img_save(hoja, ruta.as_posix())
+    with ruta_meta_hoja(ruta).open(mode="w", encoding="utf-8") as archivo:
+        dump({"ancho": ancho, "alto": alto, "cantidad": len(frames), "columnas": columnas},
+             archivo, indent=4)
+
+    return ruta
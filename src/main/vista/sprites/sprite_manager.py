@@ -2,32 +2,56 @@
 Módulo para un manager de sprites.
 """
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Optional, TypeAlias
 
 from pygame.math import Vector2
 
-from .animacion import Animacion
+from .animacion import Animacion, cargar_imagenes_escaladas, olvidar_imagenes_escaladas
 
 if TYPE_CHECKING:
-    from os import PathLike
+    from ..dibujo import Lienzo
+    from .animacion import RutaFrames, SpriteElegido
 
-    from pygame import Surface
+RutasDict: TypeAlias = dict[str, "RutaFrames"]
+AnimDict: TypeAlias = OrderedDict[str, Animacion]
+TransicionesDict: TypeAlias = dict[str, tuple[str, ...]]
 
-    from .animacion import SpriteElegido
+# Un solo hilo para todas las precargas, tal que no le compitan al juego
+_POOL_PRECARGA: Optional[ThreadPoolExecutor] = None
 
-RutasDict: TypeAlias = dict[str, "PathLike"]
-AnimDict: TypeAlias = dict[str, Animacion]
+
+def _get_pool_precarga() -> ThreadPoolExecutor:
+    "Devuelve el hilo de precarga de animaciones, creándolo si hace falta."
+
+    global _POOL_PRECARGA # pylint: disable=global-statement
+
+    if _POOL_PRECARGA is None:
+        _POOL_PRECARGA = ThreadPoolExecutor(max_workers=1, thread_name_prefix="animaciones")
+
+    return _POOL_PRECARGA
 
 
 class SpritesManager:
-    "Clase que contiene todos los sprites del jugador."
+    """
+    Clase que contiene todos los sprites del jugador.
+    Las animaciones se cargan recién la primera vez que se usan, y mientras tanto se van
+    preparando en segundo plano las que probablemente sigan a la actual. Opcionalmente se
+    puede poner un máximo de animaciones cargadas, tal que se descarten las que hace más
+    tiempo que no se usan, y si falta memoria se pueden liberar los frames de todas las
+    que no se estén usando.
+    """
 
 
     def __init__(self,
                  pos: Vector2,
                  tam: Vector2,
                  rutas_anim: RutasDict,
-                 default: Optional[str]=None) -> None:
+                 default: Optional[str]=None,
+                 transiciones: Optional[TransicionesDict]=None,
+                 max_cargadas: Optional[int]=None,
+                 alphas: tuple[int, ...]=()) -> None:
         """
         Inicializa los sprites del jugador.
         -
@@ -37,30 +61,155 @@ class SpritesManager:
         'tam': El tamaño horizontal/vertical del sprite del jugador.
 
         'rutas_anim': Un diccionario que contiene el nombre de la animación del sprite y la
-                      carpeta donde encontrar los frames de dicha animación.
+                      carpeta donde encontrar los frames de dicha animación (o un
+                      `FramesEspejados`, si es el reflejo de otra).
 
         'default': El nombre de la animación inicial.
+
+        'transiciones': Para cada animación, a cuáles es más probable cambiar después.
+                        Éstas se precargan en segundo plano al cambiar a aquella.
+
+        'max_cargadas': Cuántas animaciones tener cargadas a la vez como máximo. Si es
+                        `None`, nunca se descarta ninguna. Sus frames escalados quedan
+                        en memoria igual, así que volver a una descartada es rápido.
+
+        'alphas': Transparencias con las que se van a dibujar las animaciones, para
+                  tenerlas listas al cargar cada una.
         """
 
         if not rutas_anim:
             raise ValueError("Debe haber al menos 1 sprite en 'rutas_anim'")
 
         self.pos: Vector2 = pos
-        self.tam: Vector2 = tam # Esto idealmente no debería cambiar
+        self.tam: Vector2 = tam # Sólo cambia al reiniciar
 
-        self.animaciones: AnimDict = {}
-        for nombre, ruta in rutas_anim.items():
-            self.animaciones[nombre] = Animacion(self.pos, self.tam, ruta)
+        self.rutas_anim: RutasDict = dict(rutas_anim)
+        self.transiciones: TransicionesDict = (transiciones or {})
+        self.max_cargadas: Optional[int] = max_cargadas
+        self.alphas: tuple[int, ...] = alphas
+        # Sólo las ya cargadas, de la usada hace más tiempo a la más reciente
+        self.animaciones: AnimDict = OrderedDict()
+        self._precargas: dict[str, Future] = {}
 
         self.nombre_actual: str = (default if default is not None
-                                   else list(self.animaciones.keys())[0])
+                                   else list(self.rutas_anim.keys())[0])
+        self._precargar_siguientes(self.nombre_actual)
+
+
+    def _cargar_animacion(self, nombre: str) -> Animacion:
+        """
+        Devuelve una animación, cargándola si todavía no lo estaba.
+        -
+        'nombre': El nombre de la animación.
+        """
+
+        anim = self.animaciones.get(nombre)
+        if anim is None:
+            fut = self._precargas.pop(nombre, None)
+            # Si la precarga ya empezó, esperarla es más rápido que empezar de nuevo
+            if fut is not None and not fut.cancel():
+                try:
+                    fut.result()
+                # Si falla, el error aparece al cargarla de forma normal
+                except Exception: # pylint: disable=broad-exception-caught
+                    pass
+
+            anim = Animacion(self.pos, self.tam, self.rutas_anim[nombre], self.alphas)
+            self.animaciones[nombre] = anim
+            self._descartar_viejas()
+
+        self.animaciones.move_to_end(nombre)
+        return anim
+
+
+    def _descartar_viejas(self) -> None:
+        """
+        Descarta las animaciones usadas hace más tiempo hasta no pasarse del máximo. Sus
+        frames se conservan, para no tener que volver a leerlos del disco si se vuelven a
+        usar en medio del nivel.
+        """
+
+        if self.max_cargadas is None:
+            return
+
+        for nombre in list(self.animaciones.keys()):
+            if len(self.animaciones) <= max(self.max_cargadas, 1):
+                break
+            if nombre == self.nombre_actual:
+                continue
+
+            self.animaciones.pop(nombre)
+
+
+    def liberar_memoria(self) -> None:
+        """
+        Descarta todas las animaciones salvo la actual, y saca de memoria sus frames.
+        Si se vuelven a usar, se leen de la caché en disco.
+        """
+
+        for fut in self._precargas.values():
+            fut.cancel()
+        self._precargas.clear()
+
+        for nombre in list(self.animaciones.keys()):
+            if nombre != self.nombre_actual:
+                self.animaciones.pop(nombre)
+                olvidar_imagenes_escaladas(self.rutas_anim[nombre], self.tam)
+
+
+    def _precargar_siguientes(self, nombre: str) -> None:
+        """
+        Empieza a preparar en segundo plano las animaciones que pueden seguir a una.
+        -
+        'nombre': El nombre de la animación de la que se parte.
+        """
+
+        tam = (self.tam.x, self.tam.y)
+        for sig in self.transiciones.get(nombre, ()):
+            if (sig in self.animaciones or sig in self._precargas
+                or sig not in self.rutas_anim):
+                continue
+
+            self._precargas[sig] = _get_pool_precarga().submit(cargar_imagenes_escaladas,
+                                                                self.rutas_anim[sig],
+                                                                tam)
+
+
+    def reiniciar(self, pos: Vector2, tam: Vector2, default: Optional[str]=None) -> None:
+        """
+        Deja los sprites listos para reutilizarlos con otro jugador (por ejemplo, al empezar
+        un nivel), sin volver a cargarlos. Sólo si el tamaño en píxeles cambia se descartan
+        las animaciones cargadas, y aun así los frames escalados a cada tamaño quedan en
+        memoria para cuando se vuelva a usar.
+        -
+        'pos': La posición del nuevo jugador.
+
+        'tam': El tamaño del nuevo jugador.
+
+        'default': El nombre de la animación inicial. Si no se especifica, se usa la
+                   primera de todas.
+        """
+
+        if (int(tam.x), int(tam.y)) != (int(self.tam.x), int(self.tam.y)):
+            for fut in self._precargas.values():
+                fut.cancel()
+            self._precargas.clear()
+            self.animaciones.clear()
+
+        self.tam = tam
+        self.cambiar_pos(pos)
+        self.nombre_actual = (default if default is not None
+                              else list(self.rutas_anim.keys())[0])
+        for anim in self.animaciones.values():
+            anim.reiniciar_indice()
+        self._precargar_siguientes(self.nombre_actual)
 
 
     @property
     def anim_actual(self) -> Animacion:
         "Devuelve la animación actualmente siendo dibujada."
 
-        return self.animaciones[self.nombre_actual]
+        return self._cargar_animacion(self.nombre_actual)
 
 
     def cambiar_animacion(self, nombre: str) -> Animacion:
@@ -70,9 +219,10 @@ class SpritesManager:
         'nombre': El nombre de la animación actual. Si no la encuentra, no hace nada.
         """
 
-        if nombre in self.animaciones:
+        if nombre in self.rutas_anim:
             self.nombre_actual = nombre
             self.anim_actual.reiniciar_indice()
+            self._precargar_siguientes(nombre)
 
         return self.anim_actual
 
@@ -94,13 +244,14 @@ class SpritesManager:
             anim.pos = nueva_pos
 
 
-    def dibujar(self, superficie: "Surface", alpha: int=255) -> "SpriteElegido":
+    def dibujar(self, superficie: "Lienzo", alpha: Optional[int]=None) -> "SpriteElegido":
         """
         Dibuja la animación actual. Devuelve el sprite que se acaba de dibujar.
         -
         'superficie': La superficie sobre la que dibujar.
 
-        'alpha': La transparencia de la imagen. Debe ser un número entre 0 y 255.
+        'alpha': La transparencia de la imagen. Debe ser un número entre 0 y 255. Si no
+                 se especifica, se dibuja opaca.
         """
 
         return self.anim_actual.dibujar(superficie, alpha)
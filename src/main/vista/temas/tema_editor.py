@@ -4,12 +4,12 @@ Módulo para el tema usado en el editor.
 
 from typing import Optional
 
-from pygame.display import get_surface
 from pygame_menu.locals import ALIGN_LEFT
 from pygame_menu.themes import Theme
 from pygame_menu.widgets import MENUBAR_STYLE_NONE
 from pygame_menu.widgets import HighlightSelection
 
+from ...modelo.utils import METRICAS_PANTALLA
 from ..fuentes import FuenteMinecraftia
 
 
@@ -37,7 +37,7 @@ class TemaEditor(Theme):
                     cosas desde afuera con esto.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         invisible = (255, 255, 255, 0) # Negro con alpha 0.0
         blanco = "#ffffff"
         gris = "#cccccc"
@@ -4,12 +4,12 @@ Módulo para el tema 'Fresh'.
 
 from typing import Optional
 
-from pygame.display import get_surface
 from pygame_menu.locals import ALIGN_LEFT
 from pygame_menu.themes import Theme
 from pygame_menu.widgets import MENUBAR_STYLE_UNDERLINE
 from pygame_menu.widgets import SimpleSelection
 
+from ...modelo.utils import METRICAS_PANTALLA
 from ..fuentes import FuenteMinecraftia
 
 
@@ -37,7 +37,7 @@ class TemaFresh(Theme):
                     cosas desde afuera con esto.
         """
 
-        ancho, alto = get_surface().get_size()
+        ancho, alto = METRICAS_PANTALLA.tam
         invisible = (255, 255, 255, 0) # Negro con alpha 0.0
         blanco = "#ffffff"
         gris = "#cccccc"
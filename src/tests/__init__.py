@@ -10,9 +10,16 @@ environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 
 from unittest import main as test_main
 
+from .controlador.archivos import *
+from .controlador.logger import *
+from .modelo.editor import *
 from .modelo.estado import *
 from .modelo.jugador import *
+from .modelo.niveles import *
 from .modelo.utils import *
+from .vista.dibujo import *
+from .vista.niveles import *
+from .vista.sprites import *
 
 if __name__ == "__main__":
     test_main()
@@ -0,0 +1,3 @@
+"""
+Paquete para pruebas de los controladores.
+"""
@@ -0,0 +1,6 @@
+"""
+Paquete para tests de los manejadores de archivos.
+"""
+
+from .cargador_recursos_test import *
+from .catalogo_niveles_test import *
@@ -0,0 +1,86 @@
+"""
+Módulo para tests del cargador de recursos.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+
+from src.main.controlador.archivos.cargador_recursos import *
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+
+MENUS_TEST: Path = Path("./media/img/menus")
+TITULO_TEST: Path = Path("./media/img/titulo")
+
+
+class CargadorRecursosTest(TestCase):
+    "Tests del cargador de recursos."
+
+    def __init__(self, *args, **kwargs) -> None:
+        "Inicializa los tests del cargador."
+
+        super().__init__(*args, **kwargs)
+        set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        "Crea un cargador nuevo para cada test."
+
+        self.cargador: CargadorRecursos = CargadorRecursos(max_hilos=2)
+
+
+    def tearDown(self) -> None:
+        "Termina los hilos del cargador."
+
+        self.cargador.cerrar()
+
+
+    def test_1_expande_carpetas(self) -> None:
+        "Las carpetas se recorren completas, y sólo se toman imágenes y sonidos."
+
+        archivos = CargadorRecursos.expandir((TITULO_TEST, "./media/sfx/nivel/llave.wav"))
+
+        self.assertEqual([arch.name for arch in archivos], ["cube_jumper.png", "llave.wav"])
+
+
+    def test_2_precarga_y_termina_en_el_hilo_principal(self) -> None:
+        "Todo lo pedido se decodifica y, al procesar, queda convertido y en memoria."
+
+        pedidos = self.cargador.pedir((MENUS_TEST,))
+        self.assertEqual(pedidos, len(CargadorRecursos.expandir((MENUS_TEST,))))
+        self.assertEqual(self.cargador.pedir((MENUS_TEST,)), 0) # Ya estaban pedidos
+
+        while not self.cargador.listo():
+            self.cargador.procesar()
+
+        self.assertEqual(self.cargador.progreso, 1.0)
+        ruta = MENUS_TEST / "play.png"
+        imagen = self.cargador.imagen(ruta)
+        self.assertIs(imagen, self.cargador.imagen(f"./{ruta.as_posix()}"))
+        self.assertEqual(imagen.get_size(), self.cargador.imagen_cruda(ruta).get_size())
+
+
+    def test_3_sin_pedir_antes(self) -> None:
+        "Un recurso que no se precargó se lee en el momento, y uno que no existe falla."
+
+        imagen = self.cargador.imagen(TITULO_TEST / "cube_jumper.png")
+        self.assertGreater(imagen.get_width(), 0)
+
+        with self.assertRaises(FileNotFoundError):
+            self.cargador.imagen(TITULO_TEST / "no_existe.png")
+
+
+    def test_4_manifiesto(self) -> None:
+        "El manifiesto del juego debe existir, y uno inexistente no debe pedir nada."
+
+        manifiesto = cargar_manifiesto()
+        self.assertTrue(manifiesto["inicio"])
+        self.assertTrue(all(Path(ruta).exists()
+                            for ruta in manifiesto["inicio"] + manifiesto["diferido"]))
+
+        with TemporaryDirectory() as temp:
+            self.assertEqual(cargar_manifiesto(Path(temp) / "manifiesto.json"),
+                             {"inicio": (), "diferido": ()})
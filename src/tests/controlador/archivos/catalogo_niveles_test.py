@@ -0,0 +1,123 @@
+"""
+Módulo para tests del catálogo de niveles.
+"""
+
+from os import utime
+from pathlib import Path
+from shutil import copy
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.main.controlador.archivos.catalogo_niveles import *
+from src.main.modelo.niveles import EXT_PACK, PackNiveles
+from src.main.modelo.niveles import nivel as modulo_nivel
+from src.main.modelo.niveles.cache_niveles import CacheNiveles
+
+NIVEL_TEST: Path = Path("./niveles/testing/lock_test.nivel")
+
+
+class CatalogoNivelesTest(TestCase):
+    "Tests del catálogo de niveles."
+
+    def setUp(self) -> None:
+        "Arma un directorio de niveles temporal, con un pack y un nivel suelto."
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self.ruta: Path = Path(self._temp.name)
+        (self.ruta / "pack").mkdir()
+        copy(NIVEL_TEST, self.ruta / "pack" / "b_nivel.nivel")
+        copy(NIVEL_TEST, self.ruta / "pack" / "a_nivel.nivel")
+        copy(NIVEL_TEST, self.ruta / "suelto.nivel")
+        (self.ruta / "pack" / "roto.nivel").write_text("1,0.0\n", encoding="utf-8")
+        # Para no tocar la caché de niveles real, sin que quede entre los niveles
+        self._temp_cache: TemporaryDirectory = TemporaryDirectory()
+        self._cache_original: CacheNiveles = modulo_nivel.CACHE_NIVELES
+        modulo_nivel.CACHE_NIVELES = CacheNiveles(self._temp_cache.name)
+
+
+    def tearDown(self) -> None:
+        "Vuelve a la caché de niveles real y borra los directorios temporales."
+
+        modulo_nivel.CACHE_NIVELES = self._cache_original
+        self._temp_cache.cleanup()
+        self._temp.cleanup()
+
+
+    def test_1_indexa_packs_y_niveles_en_orden(self) -> None:
+        "Los packs y sus niveles se listan en orden alfabético, sin los inválidos."
+
+        catalogo = CatalogoNiveles(self.ruta)
+        self.assertTrue(catalogo.actualizar())
+
+        raiz = self.ruta.as_posix()
+        self.assertEqual(catalogo.subdirectorios(self.ruta), (f"{raiz}/pack",))
+        self.assertEqual(catalogo.niveles_en(self.ruta), (f"{raiz}/suelto.nivel",))
+        self.assertEqual(catalogo.niveles_en(self.ruta / "pack"),
+                         (f"{raiz}/pack/a_nivel.nivel", f"{raiz}/pack/b_nivel.nivel"))
+        self.assertFalse(catalogo.info(self.ruta / "pack" / "roto.nivel")["valido"])
+
+        info = catalogo.info(self.ruta / "suelto.nivel")
+        self.assertEqual((info["ancho"], info["alto"]), (32, 16))
+        self.assertEqual(info["titulo"], "SUELTO")
+
+
+    def test_2_persiste_y_no_reindexa_sin_cambios(self) -> None:
+        "Un catálogo recién cargado del disco no cambia si los niveles tampoco."
+
+        CatalogoNiveles(self.ruta).actualizar()
+        self.assertTrue((self.ruta / NOMBRE_CATALOGO).exists())
+
+        catalogo = CatalogoNiveles(self.ruta)
+        self.assertEqual(len(catalogo.niveles), 4)
+        self.assertFalse(catalogo.actualizar())
+
+
+    def test_3_detecta_niveles_nuevos_modificados_y_borrados(self) -> None:
+        "Los cambios en disco se reflejan al actualizar."
+
+        catalogo = CatalogoNiveles(self.ruta)
+        catalogo.actualizar()
+
+        suelto = self.ruta / "suelto.nivel"
+        suelto.write_text("-1,0.0,1,0 5,0.0,1,0\n", encoding="utf-8")
+        utime(suelto, ns=(0, catalogo.info(suelto)["mtime"] + 10**9))
+        (self.ruta / "pack" / "a_nivel.nivel").unlink()
+
+        self.assertTrue(catalogo.actualizar())
+        self.assertEqual(catalogo.info(suelto)["trofeos"], 1)
+        self.assertIsNone(catalogo.info(self.ruta / "pack" / "a_nivel.nivel"))
+
+
+    def test_4_niveles_v2_por_cabecera(self) -> None:
+        "De un nivel en formato v2 alcanza con la cabecera para catalogarlo."
+
+        v2 = self.ruta / "con_cabecera.nivel"
+        v2.write_text("@nivel v=2 ancho=5 alto=1 jugadores=1 trofeos=2 titulo=Mi nivel\n"
+                      "-1 5 5 0 6\n", encoding="utf-8")
+
+        catalogo = CatalogoNiveles(self.ruta)
+        catalogo.actualizar()
+        info = catalogo.info(v2)
+
+        self.assertTrue(info["valido"])
+        self.assertEqual((info["ancho"], info["alto"], info["trofeos"]), (5, 1, 2))
+        self.assertEqual(info["titulo"], "MI NIVEL")
+
+
+    def test_5_packs_como_directorios(self) -> None:
+        "Un archivo de pack se cataloga como un directorio, con sus niveles en orden."
+
+        ruta_pack = PackNiveles.crear(self.ruta / f"empaquetado{EXT_PACK}",
+                                      (self.ruta / "suelto.nivel",
+                                       self.ruta / "pack" / "b_nivel.nivel",
+                                       self.ruta / "pack" / "a_nivel.nivel"))
+
+        catalogo = CatalogoNiveles(self.ruta)
+        catalogo.actualizar()
+        clave = ruta_pack.as_posix()
+
+        self.assertIn(clave, catalogo.subdirectorios(self.ruta))
+        self.assertEqual(catalogo.niveles_en(ruta_pack),
+                         (f"{clave}/suelto.nivel", f"{clave}/b_nivel.nivel",
+                          f"{clave}/a_nivel.nivel"))
+        self.assertEqual(catalogo.info(f"{clave}/suelto.nivel")["titulo"], "SUELTO")
@@ -0,0 +1,5 @@
+"""
+Paquete para tests del registrador.
+"""
+
+from .perfil_inicio_test import *
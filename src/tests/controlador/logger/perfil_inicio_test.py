@@ -0,0 +1,84 @@
+"""
+Módulo para tests del perfilador del inicio.
+"""
+
+import sys
+from importlib import import_module
+from json import load
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.main.controlador.logger.perfil_inicio import *
+
+
+class PerfilInicioTest(TestCase):
+    "Tests del perfilador del inicio."
+
+    def setUp(self) -> None:
+        "Crea un perfil nuevo y un directorio temporal para módulos de prueba."
+
+        self.perfil: PerfilInicio = PerfilInicio()
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        sys.path.insert(0, self._temp.name)
+
+
+    def tearDown(self) -> None:
+        "Deja todo como estaba."
+
+        self.perfil.dejar_de_medir_importaciones()
+        sys.path.remove(self._temp.name)
+        for nombre in ("perfil_hijo", "perfil_padre"):
+            sys.modules.pop(nombre, None)
+        self._temp.cleanup()
+
+
+    def test_1_fases_anidadas(self) -> None:
+        "Las fases dentro de otras se anotan con su nivel, y aparecen en el reporte en orden."
+
+        with self.perfil.fase("afuera"):
+            with self.perfil.fase("adentro"):
+                pass
+
+        adentro, afuera = self.perfil.fases
+        self.assertEqual((afuera.nombre, afuera.nivel), ("afuera", 0))
+        self.assertEqual((adentro.nombre, adentro.nivel), ("adentro", 1))
+        self.assertGreaterEqual(afuera.ms, adentro.ms)
+
+        reporte = self.perfil.reporte()
+        self.assertLess(reporte.index(next(lin for lin in reporte if "afuera" in lin)),
+                        reporte.index(next(lin for lin in reporte if "adentro" in lin)))
+
+
+    def test_2_mide_importaciones(self) -> None:
+        "Cada módulo importado se anota con su tiempo propio y el de lo que importó."
+
+        temp = Path(self._temp.name)
+        (temp / "perfil_hijo.py").write_text("VALOR = sum(range(1000))\n", encoding="utf-8")
+        (temp / "perfil_padre.py").write_text("import perfil_hijo\n", encoding="utf-8")
+
+        self.perfil.medir_importaciones()
+        modulo = import_module("perfil_padre")
+        self.perfil.dejar_de_medir_importaciones()
+
+        self.assertEqual(modulo.perfil_hijo.VALOR, sum(range(1000)))
+        tiempos = {imp.modulo: imp for imp in self.perfil.importaciones}
+        self.assertEqual(tiempos["perfil_hijo"].nivel, tiempos["perfil_padre"].nivel + 1)
+        self.assertGreaterEqual(tiempos["perfil_padre"].acumulado_ms,
+                                tiempos["perfil_hijo"].acumulado_ms)
+        self.assertEqual([fase.nombre for fase in self.perfil.fases], ["importaciones"])
+
+
+    def test_3_guardar_json(self) -> None:
+        "El perfil se puede guardar como JSON con las fases y las importaciones."
+
+        with self.perfil.fase("algo"):
+            pass
+
+        ruta = Path(self._temp.name) / "perfil" / "inicio.json"
+        self.perfil.guardar_json(ruta)
+        with ruta.open(encoding="utf-8") as archivo:
+            datos = load(archivo)
+
+        self.assertEqual(datos["fases"][0]["nombre"], "algo")
+        self.assertEqual(datos["importaciones"], [])
@@ -0,0 +1,5 @@
+"""
+Paquete para tests del editor de niveles.
+"""
+
+from .validador_niveles_test import *
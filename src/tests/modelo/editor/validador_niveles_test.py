@@ -0,0 +1,121 @@
+"""
+Módulo para tests del validador incremental de niveles.
+"""
+
+from unittest import TestCase
+
+from src.main.modelo.celdas import TiposCelda
+from src.main.modelo.editor.editor_niveles import EditorNiveles
+from src.main.modelo.editor.validador_niveles import *
+from src.main.modelo.niveles import InfoCelda
+
+
+class ValidadorNivelTest(TestCase):
+    "Tests del validador de niveles."
+
+    def setUp(self) -> None:
+        "Crea objetos comunes a todos los tests antes de correrlos."
+
+        self.editor: EditorNiveles = EditorNiveles(col_inic=8, fil_inic=4)
+        self.validador: ValidadorNivel = self.editor.validador
+
+
+    def colocar(self, tipo: TiposCelda, col: int, fil: int, c_id: int=0) -> None:
+        """
+        Coloca una celda en el editor.
+        -
+        'tipo': El tipo de celda a colocar.
+
+        'col/fil': Las coordenadas de la celda.
+
+        'c_id': El ID de la celda.
+        """
+
+        self.editor.celda_sostenida = tipo
+        self.editor.id_sostenido = c_id
+        self.editor.cambiar_celda(col, fil)
+
+
+    def test_1_nivel_vacio_no_tiene_jugador_ni_salida(self) -> None:
+        "Una matriz recién creada no tiene posición del jugador ni salida."
+
+        self.assertEqual(self.validador.cant_jugadores, 0)
+        self.assertEqual(self.validador.cant_salidas, 0)
+        self.assertFalse(self.editor.existe_jugador())
+        self.assertFalse(self.validador.es_jugable())
+
+
+    def test_2_los_conteos_siguen_los_cambios(self) -> None:
+        "Colocar y borrar celdas actualiza los conteos sin recorrer la matriz."
+
+        self.colocar(TiposCelda.POS_JUGADOR, 0, 0)
+        self.colocar(TiposCelda.SALIDA, 7, 3)
+        self.assertTrue(self.editor.existe_jugador())
+        self.assertEqual(self.validador.cant_salidas, 1)
+
+        # Pisar la salida con una plataforma debería descontarla
+        self.colocar(TiposCelda.PLATAFORMA, 7, 3)
+        self.assertEqual(self.validador.cant_salidas, 0)
+
+        self.editor.borrar_celda(0, 0)
+        self.assertFalse(self.editor.existe_jugador())
+
+
+    def test_3_puertas_y_llaves_por_id(self) -> None:
+        "Detecta IDs de puertas sin llave y de llaves sin puerta."
+
+        self.colocar(TiposCelda.PUERTA, 2, 2, c_id=3)
+        self.colocar(TiposCelda.LLAVE, 4, 2, c_id=5)
+        self.assertEqual(self.validador.ids_puertas_sin_llave, {3})
+        self.assertEqual(self.validador.ids_llaves_sin_puerta, {5})
+
+        self.colocar(TiposCelda.LLAVE, 5, 2, c_id=3)
+        self.colocar(TiposCelda.PUERTA, 6, 2, c_id=5)
+        self.assertEqual(self.validador.ids_puertas_sin_llave, set())
+        self.assertEqual(self.validador.ids_llaves_sin_puerta, set())
+
+
+    def test_4_achicar_la_matriz_olvida_celdas(self) -> None:
+        "Las celdas que quedan fuera al achicar la matriz dejan de contarse."
+
+        self.colocar(TiposCelda.POS_JUGADOR, 7, 0)
+        self.colocar(TiposCelda.SALIDA, 0, 3)
+
+        self.editor.set_ancho(4)
+        self.assertEqual(self.validador.cant_jugadores, 0)
+
+        self.editor.set_alto(2)
+        self.assertEqual(self.validador.cant_salidas, 0)
+
+
+    def test_5_coincide_con_reconstruir(self) -> None:
+        "Las actualizaciones incrementales coinciden con volver a recorrer todo."
+
+        self.colocar(TiposCelda.POS_JUGADOR, 0, 0)
+        self.colocar(TiposCelda.PUERTA, 1, 1, c_id=2)
+        self.colocar(TiposCelda.LLAVE, 3, 1, c_id=2)
+        self.colocar(TiposCelda.SALIDA, 5, 3)
+        self.editor.borrar_celda(3, 1)
+
+        completo = ValidadorNivel(self.editor.matriz)
+        self.assertEqual(completo.pos_jugador, self.validador.pos_jugador)
+        self.assertEqual(completo.salidas, self.validador.salidas)
+        self.assertEqual(completo.puertas, self.validador.puertas)
+        self.assertEqual(completo.llaves, self.validador.llaves)
+
+
+    def test_6_alcance_respeta_paredes_y_puertas(self) -> None:
+        "Los objetivos encerrados son inalcanzables, salvo que se tenga la llave correcta."
+
+        aire = InfoCelda()
+        pared = InfoCelda(TiposCelda.PLATAFORMA)
+        matriz = (
+            (InfoCelda(TiposCelda.POS_JUGADOR), aire, pared, InfoCelda(TiposCelda.SALIDA)),
+            (aire, aire, InfoCelda(TiposCelda.PUERTA, id=1), aire),
+            (pared, pared, pared, pared),
+        )
+        self.assertEqual(celdas_inalcanzables(matriz), {(3, 0)})
+
+        con_llave = ((matriz[0][0], InfoCelda(TiposCelda.LLAVE, id=1)) + matriz[0][2:],
+                     matriz[1], matriz[2])
+        self.assertEqual(celdas_inalcanzables(con_llave), frozenset())
@@ -3,3 +3,4 @@ Paquete para tests del estado del juego.
 """
 
 from .estado_juego_test import *
+from .simulacion_juego_test import *
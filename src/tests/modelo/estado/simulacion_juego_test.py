@@ -0,0 +1,107 @@
+"""
+Módulo para tests de la simulación del juego en otro hilo.
+"""
+
+from tempfile import TemporaryDirectory
+from time import sleep
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.modelo.celdas import TiposCelda
+from src.main.modelo.estado.estado_juego import Juego
+from src.main.modelo.estado.simulacion_juego import *
+from src.main.modelo.niveles import nivel as modulo_nivel
+from src.main.modelo.niveles.cache_niveles import CacheNiveles
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+NIVEL_TEST: "PathLike" = "./niveles/testing/lock_test.nivel"
+
+
+class SimulacionJuegoTest(TestCase):
+    "Tests de la simulación del juego en otro hilo."
+
+    def __init__(self, *args, **kwargs) -> None:
+        "Inicializa los tests de la simulación."
+
+        super().__init__(*args, **kwargs)
+        set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        """
+        Carga un nivel de prueba (con una caché de niveles temporal, para no tocar la
+        real) y arma una simulación que no procesa teclas.
+        """
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self._cache_original: CacheNiveles = modulo_nivel.CACHE_NIVELES
+        modulo_nivel.CACHE_NIVELES = CacheNiveles(self._temp.name)
+        self.juego: Juego = Juego()
+        self.juego.cargar_nivel(ruta_nivel=NIVEL_TEST)
+        self.simulacion: SimulacionJuego = SimulacionJuego(self.juego, lambda *_: None)
+
+
+    def tearDown(self) -> None:
+        "Se asegura de que el hilo de simulación no quede corriendo, y vuelve a la caché real."
+
+        self.simulacion.detener()
+        modulo_nivel.CACHE_NIVELES = self._cache_original
+        self._temp.cleanup()
+
+
+    def test_1_buffer_hereda_cambios_no_leidos(self) -> None:
+        "Si se publica sin haber leído la foto anterior, sus cambios de celdas no se pierden."
+
+        primera = self.simulacion.tomar()
+        buffer = DobleBufferFotos()
+        buffer.publicar(primera._replace(celdas=(CeldaCambiada(1, 1, False),)))
+        buffer.publicar(primera._replace(celdas=(CeldaCambiada(2, 2, False),
+                                                 CeldaCambiada(1, 1, True))))
+
+        self.assertEqual(buffer.tomar().celdas, (CeldaCambiada(1, 1, True),
+                                                 CeldaCambiada(2, 2, False)))
+
+        buffer.publicar(primera._replace(celdas=()))
+        self.assertEqual(buffer.tomar().celdas, ())
+
+
+    def test_2_paso_publica_foto(self) -> None:
+        "Cada paso publica una foto con el jugador y sólo las celdas que cambiaron."
+
+        primera = self.simulacion.tomar()
+        self.assertEqual(primera.paso, 0)
+        self.assertEqual(primera.celdas, ())
+
+        col, fil, llave = next((col, fil, celda) for col, fil, celda
+                               in self.juego.nivel_actual.celdas_dinamicas()
+                               if celda.tipo == TiposCelda.LLAVE)
+        llave.visible = False
+        self.simulacion.paso()
+        foto = self.simulacion.tomar()
+
+        self.assertEqual(foto.paso, 1)
+        self.assertEqual(foto.jugador, self.juego.jugador.foto())
+        self.assertEqual(foto.celdas, (CeldaCambiada(col, fil, False),))
+
+        self.simulacion.paso()
+        self.assertEqual(self.simulacion.tomar().celdas, ())
+
+
+    def test_3_avanza_en_otro_hilo(self) -> None:
+        "Mientras corre, el juego avanza solo; al detenerla, deja de hacerlo."
+
+        self.simulacion.iniciar()
+        sleep(MS_POR_PASO * 5 / 1000)
+        self.simulacion.detener()
+
+        pasos = self.simulacion.tomar().paso
+        self.assertFalse(self.simulacion.esta_corriendo())
+        self.assertGreater(pasos, 0)
+        sleep(MS_POR_PASO * 2 / 1000)
+        self.assertEqual(self.simulacion.tomar().paso, pasos)
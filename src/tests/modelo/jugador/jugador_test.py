@@ -2,6 +2,7 @@
 Módulo para tests del jugador.
 """
 
+from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 from unittest import TestCase
 from random import choice
@@ -12,6 +13,8 @@ from pygame.display import set_mode
 from src.main.main import ANCHO_PANTALLA, ALTO_PANTALLA
 from src.main.modelo.jugador import Jugador, EstadoJugador
 from src.main.modelo.niveles import Nivel
+from src.main.modelo.niveles import nivel as modulo_nivel
+from src.main.modelo.niveles.cache_niveles import CacheNiveles
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -32,8 +35,14 @@ class JugadorTest(TestCase):
 
 
     def setUp(self) -> None:
-        "Crea objetos comunes a todos los tests antes de correrlos."
+        """
+        Crea objetos comunes a todos los tests antes de correrlos. El nivel se carga con
+        una caché de niveles temporal, para no tocar la real.
+        """
 
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self._cache_original: CacheNiveles = modulo_nivel.CACHE_NIVELES
+        modulo_nivel.CACHE_NIVELES = CacheNiveles(self._temp.name)
         ancho, alto = self.pantalla.get_size()
         self.jug: Jugador = Jugador(ancho // 2, alto // 2)
         self.grav: float = 0.5
@@ -42,6 +51,13 @@ class JugadorTest(TestCase):
         self.nivel: Nivel = Nivel(NIVEL_TEST)
 
 
+    def tearDown(self) -> None:
+        "Vuelve a la caché de niveles real y borra el directorio temporal."
+
+        modulo_nivel.CACHE_NIVELES = self._cache_original
+        self._temp.cleanup()
+
+
     def test_1_al_ser_creado_esta_quieto(self) -> None:
         """
         Debería empezar con el estado EstadoJugador.QUIETO, y tener velocidad
@@ -131,3 +147,17 @@ class JugadorTest(TestCase):
 
             # Para que en el siguiente ciclo no se sumen
             self.jug.vel.x = 0
+
+
+    def test_7_foto_con_cooldowns(self) -> None:
+        "La foto del jugador debe tener la fracción de cada cooldown que falta, y sus vidas."
+
+        self.jug.dash_cooldown.agotar()
+        self.jug.dashear()
+        self.jug.contar_timers(self.jug.dash_cooldown.inic / 4)
+        foto = self.jug.foto()
+
+        self.assertAlmostEqual(foto.dash_cooldown, 0.75)
+        self.assertEqual(foto.salto_cooldown, 0.0)
+        self.assertEqual((foto.hp, foto.max_hp), (self.jug.hp, self.jug.max_hp))
+        self.assertEqual(foto.vel, (self.jug.vel.x, self.jug.vel.y))
@@ -0,0 +1,10 @@
+"""
+Paquete para tests de los niveles.
+"""
+
+from .cache_niveles_test import *
+from .lector_niveles_test import *
+from .nivel_test import *
+from .pack_niveles_test import *
+from .plantillas_niveles_test import *
+from .precargador_niveles_test import *
@@ -0,0 +1,91 @@
+"""
+Módulo para tests de la caché de niveles.
+"""
+
+from os import utime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.main.modelo.niveles.cache_niveles import *
+from src.main.modelo.niveles.nivel import Nivel
+
+NIVEL_TEST: Path = Path("./niveles/testing/lock_test.nivel")
+
+
+class CacheNivelesTest(TestCase):
+    "Tests de la caché de niveles."
+
+    def setUp(self) -> None:
+        "Arma un directorio temporal para la caché."
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self.ruta: Path = Path(self._temp.name)
+
+
+    def tearDown(self) -> None:
+        "Borra el directorio temporal."
+
+        self._temp.cleanup()
+
+
+    def test_1_guarda_y_carga_lo_mismo(self) -> None:
+        "Una matriz guardada en la caché debe volver igual a la que se interpretó del texto."
+
+        cache = CacheNiveles(self.ruta)
+        datos = Nivel.cargar_desde_ruta(NIVEL_TEST, usar_cache=False)
+        clave = CacheNiveles.clave_de(NIVEL_TEST.read_bytes())
+
+        self.assertIsNone(cache.cargar(clave))
+        cache.guardar(clave, {"matriz": datos["matriz"], "pos_jugador": datos["pos_jugador"]})
+        guardados = cache.cargar(clave)
+
+        self.assertEqual(guardados["matriz"], datos["matriz"])
+        self.assertEqual(guardados["pos_jugador"], datos["pos_jugador"])
+
+
+    def test_2_entrada_danada_es_un_fallo(self) -> None:
+        "Una entrada ilegible se trata como si no existiera, y se borra."
+
+        cache = CacheNiveles(self.ruta)
+        (self.ruta / f"roto{EXT_CACHE}").write_bytes(b"esto no es un pickle")
+
+        self.assertIsNone(cache.cargar("roto"))
+        self.assertFalse((self.ruta / f"roto{EXT_CACHE}").exists())
+
+
+    def test_3_recorta_las_menos_usadas(self) -> None:
+        "Al pasarse del tamaño máximo, se borran primero las entradas usadas hace más tiempo."
+
+        cache = CacheNiveles(self.ruta, max_bytes=10**9)
+        for clave in ("vieja", "usada", "nueva"):
+            cache.guardar(clave, {"relleno": "x" * 1000})
+
+        utime(self.ruta / f"vieja{EXT_CACHE}", ns=(1, 1))
+        utime(self.ruta / f"usada{EXT_CACHE}", ns=(2, 2))
+        cache.cargar("usada") # Usarla la vuelve la más reciente
+
+        cache.max_bytes = 2500
+        cache.recortar()
+        restantes = {arch.stem for arch in self.ruta.glob(f"*{EXT_CACHE}")}
+
+        self.assertEqual(restantes, {"usada", "nueva"})
+
+
+    def test_4_lleva_la_cuenta_sin_recorrer(self) -> None:
+        "Lo que se estima que ocupa la caché coincide con el directorio, y se recorta sola."
+
+        cache = CacheNiveles(self.ruta, max_bytes=10**9)
+        for i in range(20):
+            cache.guardar(f"entrada_{i}", {"relleno": "x" * (100 + i)})
+        cache.guardar("entrada_0", {"relleno": "y" * 500}) # Reemplazar una entrada
+
+        en_disco = sum(arch.stat().st_size for arch in self.ruta.glob(f"*{EXT_CACHE}"))
+        self.assertEqual(cache.bytes_ocupados, en_disco)
+
+        cache.max_bytes = en_disco // 2
+        cache.guardar("ultima", {"relleno": "z" * 100})
+        en_disco = sum(arch.stat().st_size for arch in self.ruta.glob(f"*{EXT_CACHE}"))
+        self.assertLessEqual(en_disco, cache.max_bytes)
+        self.assertEqual(cache.bytes_ocupados, en_disco)
+        self.assertTrue((self.ruta / f"ultima{EXT_CACHE}").exists())
@@ -0,0 +1,131 @@
+"""
+Módulo para tests del lector de niveles.
+"""
+
+from pathlib import Path
+from unittest import TestCase
+
+from src.main.modelo.celdas import TiposCelda
+from src.main.modelo.niveles.lector_niveles import *
+
+NIVEL_TEST: Path = Path("./niveles/testing/lock_test.nivel")
+
+
+class LectorNivelesTest(TestCase):
+    "Tests del lector de niveles."
+
+    def test_1_celda_incompleta_indica_donde(self) -> None:
+        "Una celda con campos de menos debe fallar con su línea y columna."
+
+        lineas = ["# Comentario",
+                  "0,0.0,1,0 1,0.0,1,0",
+                  "0,0.0,1,0  1,0.0"]
+
+        with self.assertRaises(ErrorFormatoNivel) as ctx:
+            list(leer_filas(lineas, "prueba.nivel"))
+
+        self.assertEqual((ctx.exception.linea, ctx.exception.columna), (3, 12))
+        self.assertTrue(str(ctx.exception).startswith("prueba.nivel:3:12:"))
+
+
+    def test_2_filas_desparejas(self) -> None:
+        "Una fila de otro ancho que las anteriores debe ser un error."
+
+        lineas = ["0,0.0,1,0 0,0.0,1,0", "", "0,0.0,1,0"]
+
+        with self.assertRaises(ErrorFormatoNivel) as ctx:
+            list(leer_filas(lineas))
+
+        self.assertEqual(ctx.exception.linea, 3)
+
+
+    def test_3_campos_fuera_de_rango(self) -> None:
+        "Tipos, rotaciones, visibilidades o IDs inválidos se rechazan en su columna."
+
+        casos = {"9,0.0,1,0": 1, "1,nan,1,0": 3, "1,0.0,2,0": 7, "1,0.0,1,-3": 9}
+        for celda, columna in casos.items():
+            with self.assertRaises(ErrorFormatoNivel) as ctx:
+                list(leer_filas([celda]))
+
+            self.assertEqual(ctx.exception.columna, columna, celda)
+
+
+    def test_4_modo_por_filas(self) -> None:
+        "Con una función por fila no se arma la matriz, pero se recibe cada fila en orden."
+
+        with NIVEL_TEST.open(encoding="utf-8") as archivo:
+            matriz, pos_jugador, _ = leer_nivel(archivo, NIVEL_TEST.as_posix())
+
+        recibidas = []
+        with NIVEL_TEST.open(encoding="utf-8") as archivo:
+            sin_matriz, misma_pos, _ = leer_nivel(archivo,
+                                               al_leer_fila=lambda fil, fila:
+                                               recibidas.append((fil, fila)))
+
+        self.assertIsNone(sin_matriz)
+        self.assertEqual(misma_pos, pos_jugador)
+        self.assertEqual([fila for _, fila in recibidas], matriz)
+        self.assertEqual([fil for fil, _ in recibidas], list(range(len(matriz))))
+        jug_x, jug_y = pos_jugador
+        self.assertEqual(matriz[jug_y][jug_x].tipo, TiposCelda.POS_JUGADOR)
+
+
+    def test_5_formato_v2_ida_y_vuelta(self) -> None:
+        "Un nivel escrito en formato v2 debe leerse igual que el original, y ocupar menos."
+
+        with NIVEL_TEST.open(encoding="utf-8") as archivo:
+            matriz, pos_jugador, cabecera = leer_nivel(archivo)
+
+        lineas = list(escribir_nivel(matriz, "Prueba v2"))
+        matriz_v2, pos_v2, cabecera_v2 = leer_nivel(lineas)
+
+        self.assertIsNone(cabecera)
+        self.assertEqual(matriz_v2, matriz)
+        self.assertEqual(pos_v2, pos_jugador)
+        self.assertEqual((cabecera_v2.ancho, cabecera_v2.alto), (len(matriz[0]), len(matriz)))
+        self.assertEqual(cabecera_v2.titulo, "Prueba v2")
+        self.assertEqual(cabecera_v2.jugadores, 1)
+        self.assertLess(len("\n".join(lineas)) * 4, NIVEL_TEST.stat().st_size)
+
+
+    def test_6_cabecera_sin_leer_la_grilla(self) -> None:
+        "La cabecera se lee sola, aunque la grilla que le sigue esté rota."
+
+        lineas = ["# comentario",
+                  "@nivel v=2 ancho=3 alto=2 trofeos=1 titulo=Con espacios",
+                  "esto no es una fila"]
+
+        cabecera = leer_cabecera(lineas)
+        self.assertEqual((cabecera.ancho, cabecera.alto, cabecera.trofeos), (3, 2, 1))
+        self.assertEqual(cabecera.titulo, "Con espacios")
+        self.assertIsNone(leer_cabecera(["0,0.0,1,0"]))
+
+
+    def test_7_formato_v2_respeta_la_cabecera(self) -> None:
+        "Filas de más, de menos o de otro ancho que el de la cabecera son errores."
+
+        cabecera = "@nivel v=2 ancho=3 alto=2 titulo=X"
+        casos = {(cabecera, "3*0", "2*1"): 3,
+                 (cabecera, "3*0"): 3,
+                 (cabecera, "3*0", "3*0", "3*0"): 4,
+                 (cabecera, "2*0 -1,4"): 2}
+
+        for lineas, num_linea in casos.items():
+            with self.assertRaises(ErrorFormatoNivel) as ctx:
+                list(leer_filas(lineas))
+
+            self.assertEqual(ctx.exception.linea, num_linea, lineas)
+
+
+    def test_8_titulo_con_numeral(self) -> None:
+        "Un '#' en el título no es un comentario, y el título vuelve entero al releerlo."
+
+        with NIVEL_TEST.open(encoding="utf-8") as archivo:
+            matriz, _, _ = leer_nivel(archivo)
+
+        lineas = list(escribir_nivel(matriz, "Nivel #2"))
+        self.assertEqual(leer_cabecera(lineas).titulo, "Nivel #2")
+        self.assertEqual(leer_nivel(lineas)[2].titulo, "Nivel #2")
+
+        cabecera = leer_cabecera(["@nivel v=2 ancho=3 alto=2 # titulo=Comentado"])
+        self.assertEqual(cabecera.titulo, "")
@@ -0,0 +1,125 @@
+"""
+Módulo para tests de los niveles.
+"""
+
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.modelo.celdas import TiposCelda
+from src.main.modelo.editor import EditorNiveles
+from src.main.modelo.niveles import nivel as modulo_nivel
+from src.main.modelo.niveles.cache_niveles import CacheNiveles
+from src.main.modelo.niveles.nivel import *
+from src.main.modelo.utils import METRICAS_PANTALLA
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from pygame import Surface
+
+NIVEL_TEST: "PathLike" = "./niveles/testing/lock_test.nivel"
+
+
+class NivelTest(TestCase):
+    "Tests de los niveles."
+
+    def __init__(self, methodName: str="runTest") -> None:
+        "Inicializa las pruebas de los niveles."
+
+        super().__init__(methodName)
+
+        self.pantalla: "Surface" = set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        "Usa una caché de niveles en un directorio temporal, para no tocar la real."
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self._cache_original: CacheNiveles = modulo_nivel.CACHE_NIVELES
+        modulo_nivel.CACHE_NIVELES = CacheNiveles(self._temp.name)
+
+
+    def tearDown(self) -> None:
+        "Vuelve a la caché de niveles real y borra el directorio temporal."
+
+        modulo_nivel.CACHE_NIVELES = self._cache_original
+        self._temp.cleanup()
+
+
+    def test_1_desde_matriz_igual_que_desde_archivo(self) -> None:
+        "Un nivel armado en memoria debe ser igual al que se carga desde su archivo."
+
+        datos = Nivel.cargar_desde_ruta(NIVEL_TEST)
+        desde_archivo = Nivel(NIVEL_TEST)
+        en_memoria = Nivel.desde_matriz(datos["matriz"], datos["titulo"])
+
+        self.assertEqual(en_memoria.forma, desde_archivo.forma)
+        self.assertEqual(en_memoria.pos_inicial, desde_archivo.pos_inicial)
+        self.assertEqual(en_memoria.titulo, desde_archivo.titulo)
+
+        for j in range(desde_archivo.alto):
+            for i in range(desde_archivo.ancho):
+                celda_a, celda_b = desde_archivo.celda(i, j), en_memoria.celda(i, j)
+                self.assertEqual(celda_a is None, celda_b is None)
+                if celda_a is not None:
+                    self.assertEqual(celda_a.tipo, celda_b.tipo)
+
+
+    def test_2_desde_matriz_sin_jugador_falla(self) -> None:
+        "Sin la celda de posición del jugador, no se puede armar un nivel jugable."
+
+        editor = EditorNiveles(col_inic=4, fil_inic=4)
+        with self.assertRaises(JugadorNoEncontrado):
+            editor.generar_nivel("Prueba")
+
+        editor.celda_sostenida = TiposCelda.POS_JUGADOR
+        editor.cambiar_celda(2, 1)
+        nivel = editor.generar_nivel("Prueba")
+        self.assertEqual(tuple(nivel.pos_inicial), (2, 1))
+        self.assertEqual(nivel.titulo, "PRUEBA")
+
+
+    def test_3_reiniciar_restaura_el_estado(self) -> None:
+        "Tras abrir puertas y recoger llaves, reiniciar debe dejar el nivel como al cargarlo."
+
+        nivel = Nivel(NIVEL_TEST)
+        llaves = [celda for fila in nivel.matriz for celda in fila
+                  if celda is not None and celda.tipo == TiposCelda.LLAVE]
+        puertas = [puerta for llave in llaves for puerta in llave.puertas_asociadas]
+        self.assertTrue(llaves and puertas)
+
+        for llave in llaves:
+            llave.abrir_puertas()
+        nivel.victoria = True
+        self.assertFalse(any(puerta.esta_cerrada for puerta in puertas))
+
+        nivel.reiniciar()
+        self.assertTrue(all(puerta.esta_cerrada and puerta.visible for puerta in puertas))
+        self.assertTrue(all(not llave.recolectada and llave.visible for llave in llaves))
+        self.assertFalse(nivel.victoria)
+
+
+    def test_4_reubicar_celdas_al_redimensionar(self) -> None:
+        "Al cambiar el tamaño de la pantalla, las celdas se reubican sin perder su estado."
+
+        nivel = Nivel(NIVEL_TEST)
+        llave = next(celda for fila in nivel.matriz for celda in fila
+                     if celda is not None and celda.tipo == TiposCelda.LLAVE)
+        llave.abrir_puertas()
+
+        try:
+            METRICAS_PANTALLA.actualizar((ANCHO_PANTALLA // 2, ALTO_PANTALLA // 2))
+            nivel.reubicar_celdas()
+            incr_x, incr_y = nivel.incremento_celda
+            for j, fila in enumerate(nivel.matriz):
+                for i, celda in enumerate(fila):
+                    if celda is not None:
+                        self.assertEqual(celda.rect.topleft, (int(incr_x * i), int(incr_y * j)))
+            self.assertTrue(llave.recolectada)
+        finally:
+            METRICAS_PANTALLA.actualizar((ANCHO_PANTALLA, ALTO_PANTALLA))
@@ -0,0 +1,95 @@
+"""
+Módulo para tests de los packs de niveles.
+"""
+
+from json import dumps as json_dumps
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.main.modelo.estado import Juego
+from src.main.modelo.niveles.nivel import Nivel
+from src.main.modelo.niveles.pack_niveles import *
+
+NIVELES_TEST: tuple[Path, ...] = (Path("./niveles/default/nivel_3.nivel"),
+                                  Path("./niveles/testing/lock_test.nivel"),
+                                  Path("./niveles/default/nivel_1.nivel"))
+
+
+class PackNivelesTest(TestCase):
+    "Tests de los packs de niveles."
+
+    def setUp(self) -> None:
+        "Arma un pack temporal con algunos niveles, en un orden que no es el alfabético."
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self.ruta_pack: Path = PackNiveles.crear(Path(self._temp.name) / f"prueba{EXT_PACK}",
+                                                 NIVELES_TEST)
+
+
+    def tearDown(self) -> None:
+        "Borra el directorio temporal."
+
+        self._temp.cleanup()
+
+
+    def test_1_conserva_orden_y_contenido(self) -> None:
+        "Los niveles del pack deben estar en el orden dado, y leerse igual que los originales."
+
+        with PackNiveles(self.ruta_pack) as pack:
+            self.assertEqual(pack.nombres, tuple(ruta.name for ruta in NIVELES_TEST))
+            self.assertEqual(pack.info("lock_test.nivel")["titulo"], "LOCK TEST")
+
+            for ruta_pack, ruta_suelta in zip(pack.rutas(), NIVELES_TEST):
+                en_pack = Nivel.cargar_desde_ruta(ruta_pack, usar_cache=False)
+                suelto = Nivel.cargar_desde_ruta(ruta_suelta, usar_cache=False)
+                self.assertEqual(en_pack["matriz"], suelto["matriz"])
+                self.assertEqual(en_pack["pos_jugador"], suelto["pos_jugador"])
+
+
+    def test_2_juego_acepta_el_pack(self) -> None:
+        "El juego debe poder usar el archivo del pack directamente como lista de niveles."
+
+        juego = Juego()
+        juego.reiniciar_niveles(self.ruta_pack)
+
+        self.assertEqual(juego.rutas_niveles,
+                         tuple(f"{self.ruta_pack.as_posix()}/{ruta.name}" for ruta in NIVELES_TEST))
+        with self.assertRaises(ValueError):
+            juego.reiniciar_niveles(NIVELES_TEST[0])
+
+
+    def test_3_pack_danado(self) -> None:
+        "Un archivo que no es un pack, o con la tabla rota, no se debe poder abrir."
+
+        falso = Path(self._temp.name) / f"falso{EXT_PACK}"
+        falso.write_bytes(b"esto no es un pack")
+        with self.assertRaises(PackInvalido):
+            PackNiveles(falso)
+
+        recortado = Path(self._temp.name) / f"recortado{EXT_PACK}"
+        recortado.write_bytes(self.ruta_pack.read_bytes()[:-50])
+        with self.assertRaises(PackInvalido):
+            PackNiveles(recortado)
+
+
+    def test_4_tabla_con_entradas_rotas(self) -> None:
+        "Una tabla que es JSON válido pero con entradas incompletas o mal tipadas es inválida."
+
+        entrada = PackNiveles(self.ruta_pack).entradas[0]
+        tablas_rotas = ([{"nombre": "a.nivel"}],
+                        ["a.nivel"],
+                        {"nombre": "a.nivel"},
+                        [entrada | {"offset": "0"}],
+                        [entrada | {"tam": None}],
+                        [entrada | {"offset": -1}],
+                        [{k: v for k, v in entrada.items() if k != "titulo"}])
+
+        for i, tabla in enumerate(tablas_rotas):
+            with self.subTest(tabla=tabla):
+                contenido = json_dumps(tabla).encode("utf-8")
+                ruta = Path(self._temp.name) / f"roto_{i}{EXT_PACK}"
+                ruta.write_bytes(CABECERA_PACK.pack(MARCA_PACK, VERSION_PACK, 1, len(contenido))
+                                 + contenido + b"\0" * 64)
+                with self.assertRaises(PackInvalido):
+                    PackNiveles(ruta)
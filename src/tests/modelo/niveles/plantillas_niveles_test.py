@@ -0,0 +1,126 @@
+"""
+Módulo para tests de las plantillas de niveles.
+"""
+
+from os import utime
+from pathlib import Path
+from shutil import copy
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.modelo.estado import Juego
+from src.main.modelo.niveles import nivel as modulo_nivel
+from src.main.modelo.niveles.cache_niveles import CacheNiveles
+from src.main.modelo.utils import METRICAS_PANTALLA
+from src.main.modelo.niveles.plantillas_niveles import *
+
+if TYPE_CHECKING:
+    from pygame import Surface
+
+NIVEL_TEST: Path = Path("./niveles/testing/lock_test.nivel")
+
+
+class PlantillasNivelesTest(TestCase):
+    "Tests de las plantillas de niveles."
+
+    def __init__(self, methodName: str="runTest") -> None:
+        "Inicializa las pruebas de las plantillas."
+
+        super().__init__(methodName)
+
+        self.pantalla: "Surface" = set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        """
+        Copia el nivel de prueba a un directorio temporal, y usa una caché de niveles
+        ahí mismo para no tocar la real.
+        """
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self.ruta: Path = Path(self._temp.name) / NIVEL_TEST.name
+        copy(NIVEL_TEST, self.ruta)
+        self._cache_original: CacheNiveles = modulo_nivel.CACHE_NIVELES
+        modulo_nivel.CACHE_NIVELES = CacheNiveles(Path(self._temp.name) / "cache")
+
+
+    def tearDown(self) -> None:
+        "Vuelve a la caché de niveles real y borra el directorio temporal."
+
+        modulo_nivel.CACHE_NIVELES = self._cache_original
+        self._temp.cleanup()
+
+
+    def test_1_reutiliza_y_reinicia(self) -> None:
+        "Pedir dos veces el mismo nivel debe devolver la misma instancia, ya reiniciada."
+
+        plantillas = PlantillasNiveles()
+        nivel = plantillas.obtener(self.ruta, "sig.nivel")
+        nivel.victoria = True
+
+        otra_vez = plantillas.obtener(self.ruta)
+        self.assertIs(otra_vez, nivel)
+        self.assertFalse(otra_vez.victoria)
+        self.assertIsNone(otra_vez.sig)
+
+
+    def test_2_archivo_modificado_se_vuelve_a_cargar(self) -> None:
+        "Si el archivo cambió, la plantilla vieja se descarta."
+
+        plantillas = PlantillasNiveles()
+        nivel = plantillas.obtener(self.ruta)
+        mtime = self.ruta.stat().st_mtime_ns
+        utime(self.ruta, ns=(mtime + 10**9, mtime + 10**9))
+
+        self.assertFalse(plantillas.tiene(self.ruta))
+        self.assertIsNot(plantillas.obtener(self.ruta), nivel)
+        self.assertEqual(len(plantillas.plantillas), 1)
+
+
+    def test_3_olvida_las_menos_usadas(self) -> None:
+        "Al superar el máximo, se olvida la plantilla usada hace más tiempo."
+
+        otra = self.ruta.with_name("otro_nivel.nivel")
+        copy(NIVEL_TEST, otra)
+        plantillas = PlantillasNiveles(max_plantillas=1)
+        plantillas.obtener(self.ruta)
+        plantillas.obtener(otra)
+
+        self.assertFalse(plantillas.tiene(self.ruta))
+        self.assertTrue(plantillas.tiene(otra))
+
+
+    def test_4_redimensionar_y_volver(self) -> None:
+        """
+        Si se redimensiona en medio de un nivel, al volver al tamaño anterior y jugarlo
+        otra vez sus celdas deben tener el tamaño de la pantalla actual.
+        """
+
+        otra = self.ruta.with_name("otro_nivel.nivel")
+        copy(NIVEL_TEST, otra)
+        juego = Juego(niveles=(self.ruta, otra))
+
+        try:
+            juego.jugar()
+            METRICAS_PANTALLA.actualizar((ANCHO_PANTALLA * 5 // 4, ALTO_PANTALLA * 5 // 4))
+            juego.reacomodar((ANCHO_PANTALLA, ALTO_PANTALLA))
+            juego.jugar()
+            METRICAS_PANTALLA.actualizar((ANCHO_PANTALLA, ALTO_PANTALLA))
+            juego.reacomodar((ANCHO_PANTALLA * 5 // 4, ALTO_PANTALLA * 5 // 4))
+
+            juego.reiniciar_niveles()
+            juego.jugar()
+            incr_x, incr_y = juego.nivel_actual.incremento_celda
+            celda = next(celda for fila in juego.nivel_actual.matriz for celda in fila
+                         if celda is not None)
+            self.assertEqual(celda.rect.size, (int(incr_x), int(incr_y)))
+        finally:
+            METRICAS_PANTALLA.actualizar((ANCHO_PANTALLA, ALTO_PANTALLA))
+            juego.precargador.descartar()
+            if juego.precargador._hilo is not None:
+                juego.precargador._hilo.join()
@@ -0,0 +1,86 @@
+"""
+Módulo para tests del precargador de niveles.
+"""
+
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.modelo.niveles import nivel as modulo_nivel
+from src.main.modelo.niveles.cache_niveles import CacheNiveles
+from src.main.modelo.niveles.precargador_niveles import *
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from pygame import Surface
+
+NIVEL_TEST: "PathLike" = "./niveles/testing/lock_test.nivel"
+NIVEL_SIG: "PathLike" = "./niveles/default/nivel_1.nivel"
+
+
+class PrecargadorNivelesTest(TestCase):
+    "Tests del precargador de niveles."
+
+    def __init__(self, methodName: str="runTest") -> None:
+        "Inicializa las pruebas del precargador."
+
+        super().__init__(methodName)
+
+        self.pantalla: "Surface" = set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        "Usa una caché de niveles en un directorio temporal, para no tocar la real."
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self._cache_original: CacheNiveles = modulo_nivel.CACHE_NIVELES
+        modulo_nivel.CACHE_NIVELES = CacheNiveles(self._temp.name)
+
+
+    def tearDown(self) -> None:
+        "Vuelve a la caché de niveles real y borra el directorio temporal."
+
+        modulo_nivel.CACHE_NIVELES = self._cache_original
+        self._temp.cleanup()
+
+
+    def test_1_tomar_devuelve_el_nivel_pedido(self) -> None:
+        "El nivel precargado debe ser el mismo que se cargaría desde el archivo."
+
+        calentados = []
+        precargador = PrecargadorNiveles(calentar=calentados.append)
+        precargador.pedir(NIVEL_TEST, NIVEL_SIG)
+        nivel = precargador.tomar(NIVEL_TEST, NIVEL_SIG)
+        esperado = Nivel(NIVEL_TEST)
+
+        self.assertIsNotNone(nivel)
+        self.assertEqual(nivel.forma, esperado.forma)
+        self.assertEqual(nivel.sig, NIVEL_SIG)
+        self.assertEqual(calentados, [nivel])
+        self.assertIsNone(precargador.tomar(NIVEL_TEST, NIVEL_SIG))
+
+
+    def test_2_otras_rutas_no_se_toman(self) -> None:
+        "Pedir un nivel distinto al precargado, o uno descartado, no debe devolver nada."
+
+        precargador = PrecargadorNiveles()
+        precargador.pedir(NIVEL_TEST, NIVEL_SIG)
+        self.assertIsNone(precargador.tomar(NIVEL_SIG))
+
+        precargador.descartar()
+        self.assertIsNone(precargador.tomar(NIVEL_TEST, NIVEL_SIG))
+        precargador._hilo.join() # Que no termine de cargar con la caché real ya puesta
+
+
+    def test_3_un_nivel_roto_no_se_precarga(self) -> None:
+        "Si el nivel no se puede cargar, no se devuelve nada en lugar de fallar."
+
+        precargador = PrecargadorNiveles()
+        precargador.pedir("./niveles/no_existe.nivel")
+
+        self.assertIsNone(precargador.tomar("./niveles/no_existe.nivel"))
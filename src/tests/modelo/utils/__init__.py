@@ -2,4 +2,5 @@
 Paquete para tests de utilidades.
 """
 
+from .metricas_pantalla_test import *
 from .temporizador_test import *
@@ -0,0 +1,37 @@
+"""
+Módulo para tests de las medidas de la pantalla.
+"""
+
+from unittest import TestCase
+
+from src.main.modelo.utils.metricas_pantalla import *
+
+
+class MetricasPantallaTest(TestCase):
+    "Tests de las medidas de la pantalla."
+
+    def test_1_generacion_cambia_con_el_tamanio(self) -> None:
+        "Sólo se pasa a una nueva generación cuando el tamaño realmente cambia."
+
+        metricas = MetricasPantalla()
+        self.assertTrue(metricas.actualizar((800, 600)))
+        generacion = metricas.generacion
+
+        self.assertFalse(metricas.actualizar((800, 600)))
+        self.assertEqual(metricas.generacion, generacion)
+
+        self.assertTrue(metricas.actualizar((1024, 768)))
+        self.assertEqual(metricas.generacion, generacion + 1)
+        self.assertEqual((metricas.ancho, metricas.alto), (1024, 768))
+
+
+    def test_2_incremento_celda(self) -> None:
+        "El tamaño de las celdas se calcula una vez por tamaño de pantalla."
+
+        metricas = MetricasPantalla()
+        metricas.actualizar((800, 600))
+        self.assertEqual(metricas.incremento_celda((8, 6)), (100.0, 100.0))
+        self.assertIs(metricas.incremento_celda((8, 6)), metricas.incremento_celda((8, 6)))
+
+        metricas.actualizar((400, 300))
+        self.assertEqual(metricas.incremento_celda((8, 6)), (50.0, 50.0))
@@ -0,0 +1,6 @@
+"""
+Paquete para tests de la lista de dibujo y del motor de texturas.
+"""
+
+from .lista_dibujo_test import *
+from .motor_texturas_test import *
@@ -0,0 +1,89 @@
+"""
+Módulo para tests de la lista de dibujo.
+"""
+
+from unittest import TestCase
+
+from pygame import Surface
+from pygame.math import Vector2
+
+from src.main.vista.dibujo.lista_dibujo import *
+
+TAM_TEST: tuple[int, int] = (8, 8)
+
+
+def cuadrado(color: str) -> Surface:
+    """
+    Crea una imagen de un solo color.
+    -
+    'color': El color de la imagen.
+    """
+
+    imagen = Surface((4, 4))
+    imagen.fill(color)
+    return imagen
+
+
+class ListaDibujoTest(TestCase):
+    "Tests de la lista de dibujo."
+
+    def setUp(self) -> None:
+        "Crea una lista de dibujo y una superficie donde dibujar."
+
+        self.lista: ListaDibujo = ListaDibujo()
+        self.superficie: Surface = Surface(TAM_TEST)
+
+
+    def test_1_capas_en_orden(self) -> None:
+        "Las capas de número más alto se dibujan encima, sin importar cuándo se anotaron."
+
+        self.lista.capa(CapasDibujo.INTERFAZ).blit(cuadrado("#ff0000"), (0, 0))
+        self.lista.capa(CapasDibujo.CELDAS).blit(cuadrado("#00ff00"), (0, 0))
+        self.lista.capa(CapasDibujo.CELDAS).blit(cuadrado("#0000ff"), (4, 4))
+
+        self.assertEqual(len(self.lista), 3)
+        self.assertEqual(self.lista.dibujar(self.superficie), 3)
+        self.assertEqual(self.superficie.get_at((0, 0)), (255, 0, 0, 255))
+        self.assertEqual(self.superficie.get_at((5, 5)), (0, 0, 255, 255))
+        self.assertEqual(len(self.lista), 0)
+
+
+    def test_2_cuenta_por_frame(self) -> None:
+        "Se cuenta cuántas imágenes y llamadas hubo en el frame anterior."
+
+        capa = self.lista.capa(CapasDibujo.CELDAS)
+        for i in range(3):
+            capa.blit(cuadrado("#ffffff"), (i, 0))
+        self.lista.capa(CapasDibujo.DEBUG).blit(cuadrado("#ffffff"), (0, 0))
+        self.lista.dibujar(self.superficie)
+        self.lista.nuevo_frame()
+
+        self.assertEqual(self.lista.imagenes_frame_anterior, 4)
+        self.assertEqual(self.lista.llamadas_frame_anterior, 2)
+        self.assertEqual(self.lista.imagenes, 0)
+
+
+    def test_3_copia_posiciones(self) -> None:
+        "Las posiciones se toman al anotar, aunque el vector cambie antes de dibujar."
+
+        pos = Vector2(0, 0)
+        self.lista.capa(CapasDibujo.JUGADOR).blit(cuadrado("#ffff00"), pos)
+        pos.update(4, 4)
+        self.lista.dibujar(self.superficie)
+
+        self.assertEqual(self.superficie.get_at((0, 0)), (255, 255, 0, 255))
+        self.assertEqual(self.superficie.get_at((5, 5)), (0, 0, 0, 255))
+
+
+
+    def test_4_hasta_capa(self) -> None:
+        "Se puede dibujar sólo hasta una capa, y las de más arriba quedan para después."
+
+        self.lista.capa(CapasDibujo.CELDAS).blit(cuadrado("#00ff00"), (0, 0))
+        self.lista.capa(CapasDibujo.INTERFAZ).blit(cuadrado("#ff0000"), (0, 0))
+
+        self.assertEqual(self.lista.dibujar(self.superficie, CapasDibujo.JUGADOR), 1)
+        self.assertEqual(self.superficie.get_at((0, 0)), (0, 255, 0, 255))
+        self.assertEqual(len(self.lista), 1)
+        self.assertEqual(self.lista.dibujar(self.superficie), 1)
+        self.assertEqual(self.superficie.get_at((0, 0)), (255, 0, 0, 255))
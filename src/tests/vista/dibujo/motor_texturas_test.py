@@ -0,0 +1,101 @@
+"""
+Módulo para tests del motor de texturas.
+"""
+
+from unittest import TestCase
+
+from pygame import Surface
+from pygame._sdl2.video import Renderer, Texture, Window
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.vista.dibujo.lista_dibujo import CapasDibujo, ListaDibujo
+from src.main.vista.dibujo.motor_texturas import *
+from src.main.vista.sprites.formato_superficies import (espejar_superficie,
+                                                        optimizar_superficie,
+                                                        rotar_superficie,
+                                                        variante_transparente)
+
+TAM_TEST: tuple[int, int] = (16, 8)
+VERDE: tuple[int, int, int, int] = (0, 255, 0, 255)
+ROJO: tuple[int, int, int, int] = (255, 0, 0, 255)
+AZUL: tuple[int, int, int, int] = (0, 0, 255, 255)
+
+
+class MotorTexturasTest(TestCase):
+    "Tests del motor de texturas."
+
+    def __init__(self, *args, **kwargs) -> None:
+        "Inicializa los tests del motor de texturas."
+
+        super().__init__(*args, **kwargs)
+        set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        """
+        Crea una ventana propia con el renderer por software, un motor que dibuja sobre
+        una textura de ella, y una imagen roja con un solo píxel verde arriba a la izquierda.
+        """
+
+        self.ventana: Window = Window("test", size=TAM_TEST, hidden=True)
+        self.renderer: Renderer = Renderer(self.ventana, accelerated=0)
+        self.motor: MotorTexturas = MotorTexturas(self.renderer, TAM_TEST)
+        self.destino: Texture = Texture(self.renderer, TAM_TEST, target=True)
+        self.renderer.target = self.destino
+
+        imagen = Surface((4, 4))
+        imagen.fill(ROJO)
+        imagen.set_at((0, 0), VERDE)
+        self.imagen: Surface = optimizar_superficie(imagen)
+        self.lista: ListaDibujo = ListaDibujo()
+
+
+    def tearDown(self) -> None:
+        "Cierra la ventana del test."
+
+        del self.motor, self.destino, self.renderer
+        self.ventana.destroy()
+
+
+    def test_1_una_textura_por_imagen_base(self) -> None:
+        "Las variantes de una imagen se dibujan con la textura de ésta."
+
+        rotada = rotar_superficie(self.imagen, 90)
+        transparente = variante_transparente(espejar_superficie(self.imagen, True), 100)
+        capa = self.lista.capa(CapasDibujo.CELDAS)
+        for imagen in (self.imagen, rotada, transparente):
+            capa.blit(imagen, (0, 0))
+
+        self.assertEqual(self.motor.dibujar(self.lista), 3)
+        self.assertEqual(len(self.motor._texturas), 1)
+        self.assertEqual(len(self.lista), 0)
+
+
+    def test_2_transformaciones_al_dibujar(self) -> None:
+        "Las rotaciones y reflejos quedan igual que si se hubieran hecho sobre la imagen."
+
+        capa = self.lista.capa(CapasDibujo.JUGADOR)
+        capa.blit(self.imagen, (0, 0))
+        capa.blit(espejar_superficie(self.imagen, True), (4, 0))
+        capa.blit(rotar_superficie(self.imagen, 180), (8, 0))
+        capa.blit(rotar_superficie(espejar_superficie(self.imagen, False, True), 90), (12, 0))
+
+        self.motor.dibujar(self.lista, fondo="blue")
+        pantalla = self.renderer.to_surface()
+
+        for pos_verde in ((0, 0), (7, 0), (11, 3), (15, 3)):
+            self.assertEqual(pantalla.get_at(pos_verde), VERDE)
+        self.assertEqual(pantalla.get_at((1, 1)), ROJO)
+        self.assertEqual(pantalla.get_at((0, 5)), AZUL)
+
+
+    def test_3_hasta_capa(self) -> None:
+        "Lo que está por encima de la última capa pedida queda anotado en la lista."
+
+        self.lista.capa(CapasDibujo.CELDAS).blit(self.imagen, (0, 0))
+        self.lista.capa(CapasDibujo.INTERFAZ).blit(self.imagen, (4, 0))
+
+        self.assertEqual(self.motor.dibujar(self.lista, hasta_capa=CapasDibujo.JUGADOR), 1)
+        self.assertEqual(len(self.lista), 1)
@@ -0,0 +1,5 @@
+"""
+Paquete para tests de la vista de niveles.
+"""
+
+from .miniaturas_test import *
@@ -0,0 +1,62 @@
+"""
+Módulo para tests de las miniaturas de niveles.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pygame.image import load as img_load
+
+from src.main.modelo.niveles import Nivel
+from src.main.modelo.niveles import nivel as modulo_nivel
+from src.main.modelo.niveles.cache_niveles import CacheNiveles
+from src.main.vista.niveles.miniaturas import *
+
+NIVEL_TEST: Path = Path("./niveles/testing/lock_test.nivel")
+
+
+class MiniaturasTest(TestCase):
+    "Tests de las miniaturas de niveles."
+
+    def setUp(self) -> None:
+        """
+        Arma un directorio temporal para la caché de miniaturas, y otro para la de
+        niveles, tal que no se toque la real.
+        """
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self.ruta: Path = Path(self._temp.name)
+        self._temp_cache: TemporaryDirectory = TemporaryDirectory()
+        self._cache_original: CacheNiveles = modulo_nivel.CACHE_NIVELES
+        modulo_nivel.CACHE_NIVELES = CacheNiveles(self._temp_cache.name)
+
+
+    def tearDown(self) -> None:
+        "Vuelve a la caché de niveles real y borra los directorios temporales."
+
+        modulo_nivel.CACHE_NIVELES = self._cache_original
+        self._temp_cache.cleanup()
+        self._temp.cleanup()
+
+
+    def test_1_tamanio_segun_celdas(self) -> None:
+        "La miniatura debe medir lo mismo que la grilla del nivel por el tamaño de celda."
+
+        matriz = Nivel.cargar_desde_ruta(NIVEL_TEST, ignorar_pos_jugador=True)["matriz"]
+        ruta_png = renderizar_miniatura(NIVEL_TEST.as_posix(), self.ruta.as_posix(), 3)
+
+        self.assertEqual(img_load(ruta_png).get_size(), (len(matriz[0]) * 3, len(matriz) * 3))
+
+
+    def test_2_reutiliza_por_contenido(self) -> None:
+        "Dos archivos con el mismo contenido deben compartir una única miniatura."
+
+        copia = self.ruta / "copia.nivel"
+        copia.write_bytes(NIVEL_TEST.read_bytes())
+
+        ruta_png = renderizar_miniatura(NIVEL_TEST.as_posix(), self.ruta.as_posix(), 4)
+        ruta_copia = renderizar_miniatura(copia.as_posix(), self.ruta.as_posix(), 4)
+
+        self.assertEqual(ruta_png, ruta_copia)
+        self.assertEqual(len(list(self.ruta.glob("*.png"))), 1)
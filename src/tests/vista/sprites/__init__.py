@@ -0,0 +1,9 @@
+"""
+Paquete para tests de los sprites.
+"""
+
+from .animacion_test import *
+from .cache_superficies_test import *
+from .formato_superficies_test import *
+from .hoja_sprites_test import *
+from .sprite_manager_test import *
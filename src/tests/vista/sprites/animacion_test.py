@@ -0,0 +1,88 @@
+"""
+Módulo para tests de las animaciones.
+"""
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pygame.constants import HIDDEN
+from pygame.display import get_surface, set_mode
+from pygame.image import tobytes
+from pygame.math import Vector2
+from pygame.transform import flip
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.vista.sprites import animacion as modulo_animacion
+from src.main.vista.sprites.animacion import *
+from src.main.vista.sprites.cache_superficies import CacheSuperficies
+
+FRAMES_TEST: str = "./media/sprites/celdas/llave"
+TAM_TEST: Vector2 = Vector2(41.5, 30.2)
+
+
+class AnimacionTest(TestCase):
+    "Tests de las animaciones."
+
+    def __init__(self, *args, **kwargs) -> None:
+        "Inicializa los tests de animaciones."
+
+        super().__init__(*args, **kwargs)
+        set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        "Usa una caché de frames escalados en un directorio temporal, para no tocar la real."
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self._cache_original: CacheSuperficies = modulo_animacion.CACHE_SUPERFICIES
+        modulo_animacion.CACHE_SUPERFICIES = CacheSuperficies(self._temp.name)
+
+
+    def tearDown(self) -> None:
+        "Vuelve a la caché de frames escalados real y borra el directorio temporal."
+
+        modulo_animacion.CACHE_SUPERFICIES = self._cache_original
+        self._temp.cleanup()
+
+
+    def test_1_frames_espejados(self) -> None:
+        "Los frames espejados son el reflejo de los originales, y se generan una sola vez."
+
+        originales = cargar_imagenes_escaladas(FRAMES_TEST, TAM_TEST)
+        espejados = cargar_imagenes_escaladas(FramesEspejados(FRAMES_TEST), TAM_TEST)
+
+        self.assertIs(espejados, cargar_imagenes_escaladas(FramesEspejados(FRAMES_TEST),
+                                                           TAM_TEST))
+        self.assertEqual(len(espejados), len(originales))
+        for espejado, original in zip(espejados, originales):
+            self.assertEqual(espejado.get_size(), (41, 30))
+            self.assertEqual(tobytes(espejado, "RGBA"), tobytes(flip(original, True, False),
+                                                                "RGBA"))
+
+
+    def test_2_animacion_espejada(self) -> None:
+        "Una animación se puede crear directamente a partir de los frames de otra."
+
+        normal = Animacion(Vector2(0, 0), TAM_TEST, FRAMES_TEST)
+        espejada = Animacion(Vector2(0, 0), TAM_TEST, FramesEspejados(FRAMES_TEST, False, True))
+
+        self.assertEqual(len(espejada.sprites), len(normal.sprites))
+        self.assertIsNot(espejada.sprites[0].image, normal.sprites[0].image)
+        self.assertEqual(tobytes(espejada.sprites[0].image, "RGBA"),
+                         tobytes(flip(normal.sprites[0].image, False, True), "RGBA"))
+
+
+    def test_3_dibujar_sin_convertir(self) -> None:
+        "Dibujar con transparencia usa imágenes ya preparadas, compartidas entre animaciones."
+
+        anim = Animacion(Vector2(0, 0), TAM_TEST, FRAMES_TEST, alphas=(100,))
+        otra = Animacion(Vector2(0, 0), TAM_TEST, FRAMES_TEST)
+        imagen = anim.sprites[0].image
+
+        anim.dibujar(get_surface(), alpha=100)
+        anim.set_transparencia(40).dibujar(get_surface())
+
+        self.assertIs(anim.sprites[0].image, imagen)
+        self.assertIs(otra.sprites[0].image, imagen)
+        self.assertIs(otra.variante(100), anim.variante(100))
+        self.assertEqual(anim.variante(40)[0].get_alpha(), 40)
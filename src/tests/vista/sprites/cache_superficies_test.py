@@ -0,0 +1,83 @@
+"""
+Módulo para tests de la caché de frames escalados.
+"""
+
+from pathlib import Path
+from shutil import copytree
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pygame.image import load as img_load
+from pygame.image import tobytes
+from pygame.transform import scale
+
+from src.main.vista.sprites.cache_superficies import *
+
+FRAMES_TEST: Path = Path("./media/sprites/celdas/llave")
+TAM_TEST: tuple[int, int] = (37, 21)
+
+
+class CacheSuperficiesTest(TestCase):
+    "Tests de la caché de frames escalados."
+
+    def setUp(self) -> None:
+        "Arma una caché en un directorio temporal, y una copia de unos frames."
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self.ruta: Path = Path(self._temp.name)
+        self.cache: CacheSuperficies = CacheSuperficies(self.ruta / "cache")
+        self.frames: Path = Path(copytree(FRAMES_TEST, self.ruta / "frames"))
+        self.archivos: list[Path] = sorted(self.frames.glob("*.png"))
+
+
+    def tearDown(self) -> None:
+        "Borra el directorio temporal."
+
+        self._temp.cleanup()
+
+
+    def test_1_guarda_y_carga_los_mismos_pixeles(self) -> None:
+        "Los frames leídos de la caché deben ser idénticos a los escalados originalmente."
+
+        escalados = tuple(scale(img_load(arch), TAM_TEST) for arch in self.archivos)
+        clave = CacheSuperficies.clave_de(self.archivos, TAM_TEST)
+        self.assertIsNone(self.cache.cargar(clave))
+
+        self.cache.guardar(clave, escalados)
+        cargados = self.cache.cargar(clave)
+
+        self.assertEqual(len(cargados), len(escalados))
+        for cargado, original in zip(cargados, escalados):
+            self.assertEqual(cargado.get_size(), TAM_TEST)
+            self.assertEqual(tobytes(cargado, FORMATO_PIXELES),
+                             tobytes(original, FORMATO_PIXELES))
+
+
+    def test_2_la_clave_cambia_con_el_origen(self) -> None:
+        "Cambiar el tamaño o el contenido de un frame debe dar otra clave."
+
+        clave = CacheSuperficies.clave_de(self.archivos, TAM_TEST)
+        self.assertNotEqual(clave, CacheSuperficies.clave_de(self.archivos, (38, 21)))
+
+        with self.archivos[0].open(mode="ab") as archivo:
+            archivo.write(b"\0")
+        self.assertNotEqual(clave, CacheSuperficies.clave_de(self.archivos, TAM_TEST))
+
+
+    def test_3_entradas_danadas_y_limite(self) -> None:
+        "Una entrada dañada se descarta, y la caché no pasa de su tamaño máximo."
+
+        frames = (scale(img_load(self.archivos[0]), TAM_TEST),)
+        self.cache.guardar("rota", frames)
+        ruta_rota = self.cache.dir_cache / f"rota{EXT_CACHE_SUPERFICIES}"
+        ruta_rota.write_bytes(ruta_rota.read_bytes()[:-10])
+
+        self.assertIsNone(self.cache.cargar("rota"))
+        self.assertFalse(ruta_rota.exists())
+
+        tam_entrada = CABECERA_SUPERFICIES.size + TAM_TEST[0] * TAM_TEST[1] * BYTES_POR_PIXEL
+        self.cache.max_bytes = tam_entrada * 2
+        for i in range(4):
+            self.cache.guardar(f"entrada_{i}", frames)
+
+        self.assertEqual(len(list(self.cache.dir_cache.glob(f"*{EXT_CACHE_SUPERFICIES}"))), 2)
@@ -0,0 +1,124 @@
+"""
+Módulo para tests del formato de píxeles de las imágenes.
+"""
+
+from unittest import TestCase
+
+from pygame import SRCALPHA, Surface
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+from pygame.image import tobytes
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.vista.sprites.formato_superficies import *
+
+TAM_TEST: tuple[int, int] = (6, 4)
+COLOR_FONDO_TEST: tuple[int, int, int] = (10, 20, 30)
+
+
+def dibujada(imagen: Surface) -> bytes:
+    """
+    Devuelve cómo queda una imagen dibujada sobre un fondo fijo.
+    -
+    'imagen': La imagen a dibujar.
+    """
+
+    fondo = Surface(imagen.get_size())
+    fondo.fill(COLOR_FONDO_TEST)
+    fondo.blit(imagen, (0, 0))
+    return tobytes(fondo, "RGB")
+
+
+class FormatoSuperficiesTest(TestCase):
+    "Tests del formato de píxeles de las imágenes."
+
+    def __init__(self, *args, **kwargs) -> None:
+        "Inicializa los tests de formato de píxeles."
+
+        super().__init__(*args, **kwargs)
+        set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        "Crea una imagen con transparencia por píxel, de fondo transparente."
+
+        self.imagen: Surface = Surface(TAM_TEST, flags=SRCALPHA)
+        self.imagen.fill((0, 0, 0, 0))
+        self.imagen.fill((200, 50, 50, 255), (1, 1, 2, 2))
+
+
+    def test_1_analizar(self) -> None:
+        "Se distinguen las imágenes opacas, las de todo o nada y las semitransparentes."
+
+        opaca = Surface(TAM_TEST, flags=SRCALPHA)
+        opaca.fill((1, 2, 3, 255))
+        semi = self.imagen.copy()
+        semi.set_at((5, 3), (0, 0, 0, 128))
+
+        self.assertEqual(analizar_transparencia(opaca), TipoTransparencia.OPACA)
+        self.assertEqual(analizar_transparencia(Surface(TAM_TEST)), TipoTransparencia.OPACA)
+        self.assertEqual(analizar_transparencia(self.imagen), TipoTransparencia.COLORKEY)
+        self.assertEqual(analizar_transparencia(semi), TipoTransparencia.ALFA)
+
+
+    def test_2_optimizar(self) -> None:
+        "La imagen optimizada pierde el canal alfa si no lo necesita, y se ve igual."
+
+        opaca = Surface(TAM_TEST, flags=SRCALPHA)
+        opaca.fill((1, 2, 3, 255))
+        optimizada = optimizar_superficie(opaca)
+        self.assertFalse(optimizada.get_flags() & SRCALPHA)
+        self.assertIsNone(optimizada.get_colorkey())
+
+        optimizada = optimizar_superficie(self.imagen)
+        self.assertFalse(optimizada.get_flags() & SRCALPHA)
+        self.assertIsNotNone(optimizada.get_colorkey())
+        self.assertEqual(dibujada(optimizada), dibujada(self.imagen))
+
+
+    def test_3_colorkey_no_usado(self) -> None:
+        "El color transparente elegido nunca es uno que la imagen use."
+
+        self.imagen.set_at((4, 0), (*CANDIDATOS_COLORKEY[0], 255))
+        optimizada = optimizar_superficie(self.imagen)
+
+        self.assertNotEqual(optimizada.get_colorkey()[:3], CANDIDATOS_COLORKEY[0])
+        self.assertEqual(dibujada(optimizada), dibujada(self.imagen))
+
+
+    def test_4_semitransparente(self) -> None:
+        "Las imágenes con píxeles semitransparentes conservan el canal alfa."
+
+        self.imagen.set_at((5, 3), (0, 0, 0, 128))
+        optimizada = optimizar_superficie(self.imagen)
+
+        self.assertTrue(optimizada.get_flags() & SRCALPHA)
+        self.assertEqual(dibujada(optimizada), dibujada(self.imagen))
+
+
+    def test_5_variantes(self) -> None:
+        "Las variantes transparentes y rotadas conservan el formato de la original."
+
+        optimizada = optimizar_superficie(self.imagen)
+        variante = variante_transparente(optimizada, 100)
+        rotada = rotar_superficie(optimizada, 90)
+
+        self.assertEqual(variante.get_alpha(), 100)
+        self.assertIsNone(optimizada.get_alpha())
+        self.assertEqual(variante.get_colorkey(), optimizada.get_colorkey())
+        self.assertEqual(rotada.get_size(), TAM_TEST[::-1])
+        self.assertEqual(rotada.get_colorkey(), optimizada.get_colorkey())
+
+
+    def test_6_origen_de_variantes(self) -> None:
+        "Las variantes saben de qué imagen salen y qué se les hizo, aunque se encadenen."
+
+        optimizada = optimizar_superficie(self.imagen)
+        espejada = espejar_superficie(optimizada, True)
+        variante = variante_transparente(rotar_superficie(espejada, 90), 100)
+
+        self.assertEqual(origen_de(optimizada), OrigenSuperficie(optimizada))
+        self.assertEqual(origen_de(variante),
+                         OrigenSuperficie(optimizada, rot=90, espejo_x=True, alpha=100))
+        self.assertEqual(origen_de(espejar_superficie(rotar_superficie(optimizada, 90), True)),
+                         OrigenSuperficie(optimizada, rot=270, espejo_x=True))
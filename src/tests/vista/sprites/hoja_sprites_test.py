@@ -0,0 +1,106 @@
+"""
+Módulo para tests de las hojas de sprites.
+"""
+
+from json import dump
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from pygame import SRCALPHA, Surface
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.vista.sprites.animacion import archivos_frames, cargar_imagenes
+from src.main.vista.sprites.hoja_sprites import *
+
+TAM_FRAME_TEST: tuple[int, int] = (4, 3)
+CANT_FRAMES_TEST: int = 5
+
+
+class HojaSpritesTest(TestCase):
+    "Tests de las hojas de sprites."
+
+    def __init__(self, *args, **kwargs) -> None:
+        "Inicializa los tests de hojas de sprites."
+
+        super().__init__(*args, **kwargs)
+        set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        "Crea una carpeta temporal y frames de un color distinto cada uno."
+
+        self.dir_temp: Path = Path(mkdtemp())
+        self.frames: list[Surface] = []
+        for ind in range(CANT_FRAMES_TEST):
+            frame = Surface(TAM_FRAME_TEST, flags=SRCALPHA)
+            frame.fill((ind * 40, 0, 255 - ind * 40, 255))
+            self.frames.append(frame)
+
+
+    def tearDown(self) -> None:
+        "Borra la carpeta temporal."
+
+        rmtree(self.dir_temp, ignore_errors=True)
+
+
+    def test_1_crear_y_cortar(self) -> None:
+        "Una hoja armada con frames sueltos se corta en los mismos frames, en orden."
+
+        ruta = crear_hoja(self.frames, self.dir_temp / "anim.png", columnas=2)
+        frames = cargar_imagenes(ruta)
+
+        self.assertTrue(es_hoja(ruta))
+        self.assertEqual(archivos_frames(ruta), [ruta, ruta_meta_hoja(ruta)])
+        self.assertEqual(len(frames), CANT_FRAMES_TEST)
+        for ind, frame in enumerate(frames):
+            self.assertEqual(frame.get_size(), TAM_FRAME_TEST)
+            self.assertEqual(frame.get_at((0, 0)), self.frames[ind].get_at((0, 0)))
+
+
+    def test_2_subsuperficies(self) -> None:
+        "Los frames comparten los píxeles con la hoja en vez de copiarlos."
+
+        ruta = crear_hoja(self.frames, self.dir_temp / "anim.png", columnas=3)
+        frames = cargar_imagenes(ruta)
+
+        self.assertIs(frames[0].get_parent(), frames[-1].get_parent())
+        self.assertEqual(frames[4].get_offset(), (TAM_FRAME_TEST[0], TAM_FRAME_TEST[1]))
+
+
+    def test_3_orden_explicito(self) -> None:
+        "Si el JSON trae un orden, los frames se usan en ese orden."
+
+        ruta = crear_hoja(self.frames, self.dir_temp / "anim.png")
+        with ruta_meta_hoja(ruta).open(mode="w", encoding="utf-8") as archivo:
+            dump({"ancho": TAM_FRAME_TEST[0], "orden": [4, 0, 0]}, archivo)
+
+        frames = cargar_imagenes(ruta)
+
+        self.assertEqual([frame.get_at((0, 0)) for frame in frames],
+                         [self.frames[ind].get_at((0, 0)) for ind in (4, 0, 0)])
+
+
+    def test_4_tira_sin_json(self) -> None:
+        "Sin JSON, la hoja es una tira horizontal de frames cuadrados."
+
+        geometria = leer_geometria(self.dir_temp / "tira.png", (30, 10))
+
+        self.assertEqual(geometria, GeometriaHoja(10, 10, 3, (0, 1, 2)))
+
+
+    def test_5_geometria_invalida(self) -> None:
+        "Una geometría que no entra en la hoja es un error."
+
+        ruta = self.dir_temp / "mala.png"
+        with ruta_meta_hoja(ruta).open(mode="w", encoding="utf-8") as archivo:
+            dump({"ancho": 8, "alto": 8, "orden": [0, 9]}, archivo)
+
+        with self.assertRaises(ValueError):
+            leer_geometria(ruta, (16, 8))
+
+        with self.assertRaises(ValueError):
+            leer_geometria(ruta, (4, 4))
@@ -0,0 +1,135 @@
+"""
+Módulo para tests del manager de sprites.
+"""
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pygame.constants import HIDDEN
+from pygame.display import set_mode
+from pygame.math import Vector2
+
+from src.main.main import ALTO_PANTALLA, ANCHO_PANTALLA
+from src.main.vista.sprites import animacion as modulo_animacion
+from src.main.vista.sprites.animacion import FramesEspejados
+from src.main.vista.sprites.cache_superficies import CacheSuperficies
+from src.main.vista.sprites.sprite_manager import *
+
+RUTAS_TEST: RutasDict = {
+    "llave": "./media/sprites/celdas/llave",
+    "llave_h": FramesEspejados("./media/sprites/celdas/llave"),
+    "llave_v": FramesEspejados("./media/sprites/celdas/llave", False, True),
+    "llave_hv": FramesEspejados("./media/sprites/celdas/llave", True, True)
+}
+TAM_TEST: Vector2 = Vector2(23.0, 17.0)
+
+
+class SpritesManagerTest(TestCase):
+    "Tests del manager de sprites."
+
+    def __init__(self, *args, **kwargs) -> None:
+        "Inicializa los tests del manager de sprites."
+
+        super().__init__(*args, **kwargs)
+        set_mode((ANCHO_PANTALLA, ALTO_PANTALLA), flags=HIDDEN)
+
+
+    def setUp(self) -> None:
+        "Usa una caché de frames escalados en un directorio temporal, para no tocar la real."
+
+        self._temp: TemporaryDirectory = TemporaryDirectory()
+        self._cache_original: CacheSuperficies = modulo_animacion.CACHE_SUPERFICIES
+        modulo_animacion.CACHE_SUPERFICIES = CacheSuperficies(self._temp.name)
+
+
+    def tearDown(self) -> None:
+        "Vuelve a la caché de frames escalados real y borra el directorio temporal."
+
+        modulo_animacion.CACHE_SUPERFICIES = self._cache_original
+        self._temp.cleanup()
+
+
+    def test_1_carga_al_usar(self) -> None:
+        "Las animaciones se cargan recién cuando se cambia a ellas."
+
+        manager = SpritesManager(Vector2(0, 0), TAM_TEST, RUTAS_TEST, default="llave")
+
+        self.assertEqual(len(manager.animaciones), 0)
+        manager.cambiar_animacion("llave_h")
+
+        self.assertEqual(list(manager.animaciones.keys()), ["llave_h"])
+        self.assertEqual(manager.anim_actual.sprites[0].image.get_size(), (23, 17))
+
+
+    def test_2_precarga_siguientes(self) -> None:
+        "Al cambiar de animación, las que le pueden seguir se preparan en segundo plano."
+
+        manager = SpritesManager(Vector2(0, 0), TAM_TEST, RUTAS_TEST, default="llave",
+                                 transiciones={"llave": ("llave_v", "otra")})
+
+        self.assertEqual(list(manager._precargas.keys()), ["llave_v"])
+        manager._precargas["llave_v"].result()
+        manager.cambiar_animacion("llave_v")
+
+        self.assertEqual(manager._precargas, {})
+        self.assertIn("llave_v", manager.animaciones)
+
+
+    def test_3_descarta_viejas(self) -> None:
+        """
+        Si hay demasiadas cargadas, se descartan las usadas hace más tiempo, pero sus
+        frames quedan en memoria.
+        """
+
+        manager = SpritesManager(Vector2(0, 0), TAM_TEST, RUTAS_TEST, default="llave",
+                                 max_cargadas=2)
+        for nombre in ("llave", "llave_h", "llave_v", "llave"):
+            manager.cambiar_animacion(nombre)
+            if nombre == "llave_h":
+                frame = manager.anim_actual.sprites[0].image
+
+        self.assertEqual(list(manager.animaciones.keys()), ["llave_v", "llave"])
+        manager.cambiar_animacion("llave_h")
+        self.assertIs(manager.anim_actual.sprites[0].image, frame)
+        manager.cambiar_animacion("llave")
+
+        manager.cambiar_pos(Vector2(5, 5))
+        manager.cambiar_animacion("llave_hv")
+        self.assertEqual(list(manager.animaciones.keys()), ["llave", "llave_hv"])
+        self.assertEqual(manager.anim_actual.pos, Vector2(5, 5))
+
+
+    def test_4_reiniciar(self) -> None:
+        "Al reiniciar se conservan las animaciones, salvo que cambie el tamaño en píxeles."
+
+        manager = SpritesManager(Vector2(0, 0), TAM_TEST, RUTAS_TEST, default="llave")
+        manager.cambiar_animacion("llave_h")
+        manager.siguiente_frame()
+        anim = manager.anim_actual
+
+        manager.reiniciar(Vector2(3, 3), TAM_TEST + Vector2(0.4, 0.4))
+        self.assertEqual(manager.nombre_actual, "llave")
+        self.assertIs(manager.animaciones["llave_h"], anim)
+        self.assertEqual(anim._spr_ind, 0)
+        self.assertEqual(anim.pos, Vector2(3, 3))
+
+        manager.reiniciar(Vector2(3, 3), TAM_TEST * 2, default="llave_h")
+        self.assertEqual(len(manager.animaciones), 0)
+        self.assertEqual(manager.anim_actual.sprites[0].image.get_size(), (46, 34))
+
+
+    def test_5_liberar_memoria(self) -> None:
+        "Por defecto no se descarta ninguna; al liberar memoria, sólo queda la actual."
+
+        manager = SpritesManager(Vector2(0, 0), TAM_TEST, RUTAS_TEST, default="llave")
+        for nombre in ("llave_h", "llave_v", "llave_hv", "llave"):
+            manager.cambiar_animacion(nombre)
+        frame = manager.animaciones["llave_h"].sprites[0].image
+
+        self.assertEqual(len(manager.animaciones), len(RUTAS_TEST))
+        manager.liberar_memoria()
+        self.assertEqual(list(manager.animaciones.keys()), ["llave"])
+
+        manager.cambiar_animacion("llave_h")
+        self.assertIsNot(manager.anim_actual.sprites[0].image, frame)
+        self.assertEqual(manager.anim_actual.sprites[0].image.get_size(), (23, 17))